@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Benchmark for generating the default sound bank
+使用方法: uv run scripts/bench_sounds.py [repeats]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+from aws_typing_game.managers.audio_manager import DEFAULT_SOUNDS, SoundGenerator
+
+
+def main() -> int:
+    """Time each default sound and the whole bank"""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+
+    totals = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for generator_name, args in DEFAULT_SOUNDS.values():
+            getattr(SoundGenerator, generator_name)(*args)
+        totals.append(time.perf_counter() - start)
+
+    for sound_name, (generator_name, args) in DEFAULT_SOUNDS.items():
+        start = time.perf_counter()
+        getattr(SoundGenerator, generator_name)(*args)
+        print(f"{sound_name:14s} {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    print(f"default bank   {min(totals) * 1000:8.2f} ms (best of {repeats})")
+    pygame.mixer.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
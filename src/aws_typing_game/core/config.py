@@ -11,6 +11,19 @@ class GameConfig:
     TIME_LIMIT = 60  # seconds
     TARGET_FPS = 60
     WINDOW_TITLE = "AWS Service Typing"
+    # Present only changed regions with display.update(rects) instead of a full flip
+    ENABLE_DIRTY_RECTS = False
+    # Block on events instead of polling in states without animation
+    ENABLE_IDLE_RENDERING = True
+    IDLE_WAIT_TIMEOUT_MS = 500
+
+    # Sentence selection favours sentences the player gets wrong or types slowly
+    ENABLE_WEAKNESS_SAMPLING = True
+    WEAKNESS_ERROR_WEIGHT = 8.0
+    WEAKNESS_SPEED_WEIGHT = 2.0
+    WEAKNESS_MAX_SLOWNESS = 2.0
+    WEAKNESS_SMOOTHING = 0.5  # Share of the newest result in a sentence's weight
+    TARGET_SECONDS_PER_CHAR = 0.2  # 60 WPM
 
 
 class Colors:
@@ -75,6 +88,10 @@ class FontConfig:
     SCORE_SIZE = 24
     SMALL_SIZE = 18
 
+    # Rendered text surface cache
+    TEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024  # 16 MB of pixel data
+    TEXT_CACHE_MAX_ENTRIES = 2048
+
     # Platform-specific font paths
     MACOS_FONTS = [
         "/System/Library/Fonts/Hiragino Sans GB.ttc",
@@ -139,6 +156,9 @@ class UIConfig:
     PROGRESS_BAR_WIDTH = 200
     PROGRESS_BAR_HEIGHT = 8  # Thinner, modern progress bar
 
+    # Number of sentence layouts kept across the corpus
+    SENTENCE_LAYOUT_CACHE_SIZE = 1024
+
     # Button specifications
     BUTTON_HEIGHT = 48
     BUTTON_PADDING_H = 24
@@ -156,6 +176,21 @@ class FileConfig:
 
     SAVE_FILE = "save_data.json"
     AWS_DATA_FILE = "aws_services.json"
+    CORPUS_OVERRIDE_FOLDER = "assets/corpus"  # Corpus files here win over the bundled data
+    ENABLE_CORPUS_WATCH = True
+    CORPUS_WATCH_INTERVAL = 1.0  # seconds
+    ENABLE_ASYNC_SAVE = True
+    SAVE_QUEUE_SIZE = 8
+    SESSION_DB_FILE = "sessions.db"
+    SESSION_PROFILE = ""  # Identifies this machine or player in shared session data
+    SESSION_BATCH_SIZE = 64
+    SESSION_FLUSH_INTERVAL = 1.0  # seconds to gather a batch
+    SESSION_QUEUE_SIZE = 1024
+    ENABLE_KEYSTROKE_JOURNAL = False
+    KEYSTROKE_JOURNAL_FOLDER = "keystrokes"
+    KEYSTROKE_JOURNAL_FILE_BYTES = 4 * 1024 * 1024  # Rotate to a new file at this size
+    KEYSTROKE_JOURNAL_BUFFER_BYTES = 64 * 1024
+    TYPING_STATS_FILE = "typing_stats.npz"
 
 
 class AccessibilityConfig:
@@ -176,6 +211,9 @@ class AnimationConfig:
     ENABLE_TRANSITIONS = True
     ANIMATION_SPEED_MULTIPLIER = 1.0
     PARTICLE_COUNT_MULTIPLIER = 1.0
+    MAX_PARTICLES = 2048  # Preallocated particle slots
+    MAX_ANIMATIONS = 64  # Named animations such as score popups
+    EFFECT_EVICTION_POLICY = "drop_oldest"  # drop_oldest, lowest_priority
 
 
 class AudioConfig:
@@ -189,3 +227,15 @@ class AudioConfig:
     MUSIC_VOLUME = 0.5
     SOUNDS_FOLDER = "sounds"
     MUSIC_FOLDER = "music"
+    ENABLE_SOUND_CACHE = True
+    SOUND_CACHE_FOLDER = "assets/cache/sounds"
+    TYPING_CLICK_VARIANTS = 6
+    TYPING_CHANNELS = 3
+    TYPING_VOLUME = 0.3
+    ENABLE_AUDIO_THREAD = False
+    AUDIO_QUEUE_SIZE = 64
+    MUSIC_FADE_MS = 1000
+    MIXER_BUFFER_SIZE = 512
+    SOUND_LOADER_WORKERS = 4
+    ENABLE_LATENCY_TRACKING = False
+    LATENCY_DUMP_FILE = "audio_latency.json"
@@ -7,6 +7,8 @@ import re
 import time
 
 from ..managers.data_manager import DataManager
+from ..utils.sentence_sampler import SentenceSampler
+from ..utils.typing_stats import TypingStats
 from .config import EvaluationConfig, GameConfig
 
 
@@ -17,6 +19,8 @@ class Game:
         self.data_manager = data_manager
         self.audio_manager = None
         self.animation_manager = None
+        self.keystroke_journal = None
+        self.sentence_sampler = None
         self.reset_game()
         self.game_state = "menu"  # menu, playing, game_over, service_info
         self.answered_services = []
@@ -32,6 +36,10 @@ class Game:
         """Set the animation manager"""
         self.animation_manager = animation_manager
 
+    def set_keystroke_journal(self, keystroke_journal):
+        """Set the journal that records every typed character"""
+        self.keystroke_journal = keystroke_journal
+
     def reset_game(self) -> None:
         """Reset game state for a new game"""
         self.current_word = ""
@@ -42,18 +50,27 @@ class Game:
         self.answered_services = []
         self.total_chars = 0
         self.correct_chars = 0  # 正解した文字数を追跡
+        self.typing_stats = TypingStats()
         self.select_new_word()
+        if self.keystroke_journal:
+            self.keystroke_journal.start_session()
 
     def select_new_word(self) -> None:
         """Select a new random sentence"""
         sentences = self.data_manager.get_all_sentences()
-        if sentences:
+        self.current_sentence_index = None
+        if sentences and GameConfig.ENABLE_WEAKNESS_SAMPLING:
+            self.current_sentence_index = self._get_sentence_sampler(sentences).sample()
+            self.current_word = sentences[self.current_sentence_index]
+        elif sentences:
             self.current_word = random.choice(sentences)
         else:
             # Fallback sentence if no data is available
             self.current_word = "My <EC2> instance is having an identity crisis"
 
         self.typed_text = ""
+        self.word_mistakes = 0
+        self.word_start_time = time.time()
 
         # Extract service name from brackets
         service_match = re.search(r"<([^>]+)>", self.current_word)
@@ -61,6 +78,7 @@ class Game:
             self.current_service_name = service_match.group(1)
         else:
             self.current_service_name = ""
+        self.typing_stats.start_word(self.word_start_time)
 
     def update(self, events, ignore_space: bool = False) -> None:
         """Update game state during gameplay"""
@@ -72,6 +90,9 @@ class Game:
 
         for event in events:
             if event.type == pygame.KEYDOWN:
+                if self.audio_manager:
+                    self.audio_manager.mark_keypress()
+
                 if event.key == pygame.K_ESCAPE:
                     self.game_state = "menu"
                 elif event.key == pygame.K_BACKSPACE:
@@ -106,11 +127,24 @@ class Game:
                     # Check if the new character is correct before adding
                     clean_current_word = self.current_word.replace("<", "").replace(">", "")
                     current_pos = len(self.typed_text)
-
-                    if (
+                    is_correct = (
                         current_pos < len(clean_current_word)
                         and event.unicode == clean_current_word[current_pos]
-                    ):
+                    )
+
+                    expected = (
+                        ord(clean_current_word[current_pos])
+                        if current_pos < len(clean_current_word)
+                        else 0
+                    )
+                    typed = ord(event.unicode[0])
+                    self.typing_stats.record_keystroke(
+                        self.current_service_name, expected, typed, is_correct
+                    )
+                    if self.keystroke_journal:
+                        self.keystroke_journal.record(typed, expected, is_correct)
+
+                    if is_correct:
                         # Correct character
                         self.typed_text += event.unicode
                         self.correct_chars += 1  # 正解文字数をカウント
@@ -130,6 +164,7 @@ class Game:
                     else:
                         # Wrong character - increment mistakes
                         self.mistakes += 1
+                        self.word_mistakes += 1
                         # Play error sound
                         if self.audio_manager:
                             self.audio_manager.play_error_sound()
@@ -139,6 +174,10 @@ class Game:
                                 400, 300, (255, 0, 0), "error"
                             )
 
+        # Sounds played outside keypress handling are not keypress feedback
+        if self.audio_manager:
+            self.audio_manager.clear_keypress()
+
     def handle_menu_events(self, events) -> None:
         """Handle events in menu state"""
         for event in events:
@@ -218,16 +257,19 @@ class Game:
         # Find example sentence for this service
         example_sentence = ""
         translation = ""
-        sentences = self.data_manager.get_all_sentences()
-
-        for sentence in sentences:
-            if f"<{current_service}>" in sentence:
-                example_sentence = sentence.replace(f"<{current_service}>", current_service)
-                translation = self.data_manager.get_sentence_translation(example_sentence)
-                break
+        sentences = self.data_manager.get_sentences_for_service(current_service)
+        if sentences:
+            example_sentence = sentences[0].replace(f"<{current_service}>", current_service)
+            translation = self.data_manager.get_sentence_translation(example_sentence)
 
         return description, example_sentence, translation
 
+    def _get_sentence_sampler(self, sentences) -> SentenceSampler:
+        """Get the sampler for the current sentences, rebuilding it after a corpus reload"""
+        if self.sentence_sampler is None or self.sentence_sampler.sentences is not sentences:
+            self.sentence_sampler = SentenceSampler(sentences, self.data_manager.typing_stats)
+        return self.sentence_sampler
+
     def _complete_word(self) -> None:
         """Complete the current word successfully"""
         clean_current_word = self.current_word.replace("<", "").replace(">", "")
@@ -238,6 +280,16 @@ class Game:
         # Calculate new score based on accuracy and WPM
         self._update_score()
 
+        now = time.time()
+        self.typing_stats.complete_word(self.current_service_name, now)
+        if self.sentence_sampler and self.current_sentence_index is not None:
+            self.sentence_sampler.record_result(
+                self.current_sentence_index,
+                self.word_mistakes,
+                len(clean_current_word),
+                now - self.word_start_time,
+            )
+
         # Record answered service
         if self.current_service_name and self.current_service_name not in self.answered_services:
             self.answered_services.append(self.current_service_name)
@@ -311,6 +363,7 @@ class Game:
             elapsed_time=elapsed_time,
             answered_services=self.answered_services,
         )
+        self.data_manager.add_typing_stats(self.typing_stats)
 
 
 # Import pygame here to avoid circular imports
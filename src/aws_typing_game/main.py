@@ -11,15 +11,17 @@ import sys
 import pygame
 
 # Import from relative modules
-from .core.config import AccessibilityConfig, AnimationConfig, GameConfig
+from .core.config import AccessibilityConfig, AnimationConfig, FileConfig, GameConfig
 from .core.game import Game
 from .managers.accessibility_manager import AccessibilityManager
 from .managers.animation_manager import AnimationManager
 from .managers.audio_manager import AudioManager
-from .managers.data_manager import DataManager
+from .managers.data_manager import DEFAULT_AWS_DATA_FILE, DataManager
 from .managers.font_manager import FontManager
 from .managers.responsive_manager import ResponsiveManager
 from .ui.ui_manager import UIManager
+from .utils.frame_stats import FrameStats
+from .utils.keystroke_journal import KeystrokeJournal
 
 
 def main():
@@ -35,7 +37,13 @@ def main():
 
     # Initialize managers
     font_manager = FontManager()
-    data_manager = DataManager()
+    data_manager = DataManager(
+        [FileConfig.CORPUS_OVERRIDE_FOLDER, DEFAULT_AWS_DATA_FILE],
+        watch_interval=FileConfig.CORPUS_WATCH_INTERVAL if FileConfig.ENABLE_CORPUS_WATCH else None,
+        async_save=FileConfig.ENABLE_ASYNC_SAVE,
+        session_db=FileConfig.SESSION_DB_FILE,
+        typing_stats_file=FileConfig.TYPING_STATS_FILE,
+    )
     audio_manager = AudioManager()
     animation_manager = AnimationManager()
     accessibility_manager = AccessibilityManager()
@@ -45,11 +53,15 @@ def main():
     ui_manager.set_responsive_manager(responsive_manager)
     ui_manager.set_accessibility_manager(accessibility_manager)
     ui_manager.set_animation_manager(animation_manager)
+    if GameConfig.ENABLE_DIRTY_RECTS:
+        ui_manager.enable_dirty_rects()
 
     # Initialize game
     game = Game(data_manager)
     game.set_audio_manager(audio_manager)
     game.set_animation_manager(animation_manager)
+    keystroke_journal = KeystrokeJournal() if FileConfig.ENABLE_KEYSTROKE_JOURNAL else None
+    game.set_keystroke_journal(keystroke_journal)
 
     # Create audio folders (don't auto-start music)
     try:
@@ -70,15 +82,43 @@ def main():
     space_key_released = True
     ignore_next_space = False
 
+    frame_stats = FrameStats()
+    needs_redraw = True
+
     running = True
     while running:
-        events = pygame.event.get()
+        frame_state = game.game_state
+        animating = AnimationConfig.ENABLE_ANIMATIONS and animation_manager.has_active_effects()
+
+        # Static screens block until something happens instead of polling at TARGET_FPS
+        if (
+            GameConfig.ENABLE_IDLE_RENDERING
+            and frame_state != "playing"
+            and not animating
+            and not needs_redraw
+        ):
+            first_event = pygame.event.wait(GameConfig.IDLE_WAIT_TIMEOUT_MS)
+            events = [] if first_event.type == pygame.NOEVENT else [first_event]
+            events.extend(pygame.event.get())
+        else:
+            events = pygame.event.get()
+
+        # Corpus edits picked up by the watcher are swapped in between frames
+        if data_manager.apply_pending_reload():
+            needs_redraw = True
 
         # Handle quit event
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+            # Let the audio manager advance the music playlist
+            audio_manager.handle_event(event)
+
+            # The window contents must be presented in full after a resize or expose
+            if event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE):
+                ui_manager.invalidate_frame()
+
             # Handle accessibility navigation
             if AccessibilityConfig.ENABLE_KEYBOARD_NAVIGATION:
                 nav_result = accessibility_manager.handle_navigation_input(event)
@@ -145,17 +185,31 @@ def main():
             game.update(events, ignore_next_space)
             ignore_next_space = False
 
-            # Update animations
-            if AnimationConfig.ENABLE_ANIMATIONS:
-                animation_manager.update()
-
         elif game.game_state == "game_over":
             game.handle_game_over_events(events)
 
         elif game.game_state == "service_info":
             game.handle_service_info_events(events)
 
+        # Update animations so effects finish even after leaving the playing state
+        if AnimationConfig.ENABLE_ANIMATIONS:
+            animation_manager.update()
+
+        # Only re-render idle screens when an input event, state change or animation needs it
+        needs_redraw = (
+            needs_redraw
+            or not GameConfig.ENABLE_IDLE_RENDERING
+            or animating
+            or game.game_state == "playing"
+            or game.game_state != frame_state
+            or any(event.type != pygame.MOUSEMOTION for event in events)
+        )
+        if not needs_redraw:
+            frame_stats.record_iteration(frame_state, rendered=False)
+            continue
+
         # Render current state
+        ui_manager.begin_frame(game.game_state)
         if game.game_state == "menu":
             ui_manager.draw_menu(
                 high_score=game.get_high_score(),
@@ -198,15 +252,31 @@ def main():
 
         # Draw animation effects
         if AnimationConfig.ENABLE_ANIMATIONS:
-            animation_manager.draw_effects(screen)
+            effect_rects = animation_manager.draw_effects(screen)
+            ui_manager.add_transient_regions(effect_rects)
+
+        # Present the frame, falling back to a full flip when everything changed
+        dirty_rects = ui_manager.end_frame()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+        needs_redraw = False
 
-        pygame.display.flip()
         clock.tick(GameConfig.TARGET_FPS)
+        frame_stats.record_iteration(frame_state, rendered=True)
+
+    print("Frame statistics:")
+    print(frame_stats.format_summary())
 
     # Cleanup
     try:
         if audio_manager.audio_enabled:
             audio_manager.stop_background_music()
+        audio_manager.shutdown()
+        data_manager.shutdown()
+        if keystroke_journal:
+            keystroke_journal.close()
         pygame.quit()
         print("Game closed successfully")
     except Exception as e:
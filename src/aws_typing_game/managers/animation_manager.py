@@ -2,11 +2,16 @@
 Animation manager for AWS Service Typing Game
 """
 
+import contextlib
+import itertools
 import time
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
+from ..core.config import AnimationConfig
+
 
 class Animation:
     """Base animation class"""
@@ -119,126 +124,351 @@ class ColorAnimation(Animation):
         return r, g, b
 
 
-class ParticleEffect:
-    """Particle effect for typing feedback"""
-
-    def __init__(self, x: int, y: int, color: Tuple[int, int, int], effect_type: str = "success"):
-        self.particles = []
-        self.creation_time = time.time()
-        self.duration = 1.0
-        self.x = x
-        self.y = y
-        self.color = color
-
-        # Create particles based on effect type
-        if effect_type == "success":
-            self._create_success_particles()
-        elif effect_type == "error":
-            self._create_error_particles()
-        elif effect_type == "typing":
-            self._create_typing_particles()
-
-    def _create_success_particles(self):
-        """Create success effect particles"""
-        import random
-
-        for _ in range(15):
-            particle = {
-                "x": self.x + random.randint(-20, 20),
-                "y": self.y + random.randint(-20, 20),
-                "vx": random.uniform(-2, 2),
-                "vy": random.uniform(-3, -1),
-                "life": 1.0,
-                "size": random.randint(2, 5),
-            }
-            self.particles.append(particle)
-
-    def _create_error_particles(self):
-        """Create error effect particles"""
-        import random
-
-        for _ in range(10):
-            particle = {
-                "x": self.x + random.randint(-15, 15),
-                "y": self.y + random.randint(-15, 15),
-                "vx": random.uniform(-1, 1),
-                "vy": random.uniform(-2, 0),
-                "life": 0.8,
-                "size": random.randint(1, 3),
-            }
-            self.particles.append(particle)
-
-    def _create_typing_particles(self):
-        """Create typing effect particles"""
-        import random
-
-        for _ in range(5):
-            particle = {
-                "x": self.x + random.randint(-10, 10),
-                "y": self.y + random.randint(-10, 10),
-                "vx": random.uniform(-0.5, 0.5),
-                "vy": random.uniform(-1, 0),
-                "life": 0.5,
-                "size": random.randint(1, 2),
-            }
-            self.particles.append(particle)
+# Spawn parameters per effect type: eviction priority, particle count,
+# position spread, x/y velocity ranges, initial life and size range
+PARTICLE_SPECS = {
+    "success": {
+        "priority": 2,
+        "count": 15,
+        "spread": 20,
+        "vx": (-2, 2),
+        "vy": (-3, -1),
+        "life": 1.0,
+        "size": (2, 5),
+    },
+    "error": {
+        "priority": 1,
+        "count": 10,
+        "spread": 15,
+        "vx": (-1, 1),
+        "vy": (-2, 0),
+        "life": 0.8,
+        "size": (1, 3),
+    },
+    "typing": {
+        "priority": 0,
+        "count": 5,
+        "spread": 10,
+        "vx": (-0.5, 0.5),
+        "vy": (-1, 0),
+        "life": 0.5,
+        "size": (1, 2),
+    },
+}
+
+
+PARTICLE_MAX_RADIUS = max(spec["size"][1] for spec in PARTICLE_SPECS.values())
+
+
+class ParticleSpriteAtlas:
+    """Lazily rasterized circle sprites per (color, radius, alpha bucket)
+
+    Each palette color gets one atlas surface laid out as a grid with one column
+    per radius and one row per alpha bucket. Cells are drawn the first time a
+    particle needs them.
+    """
+
+    ALPHA_BUCKETS = 16
+
+    def __init__(self, max_radius: int = PARTICLE_MAX_RADIUS):
+        self.max_radius = max_radius
+        self.cell_size = max_radius * 2
+        self.atlases: List[pygame.Surface] = []
+        self.rasterized: List[np.ndarray] = []
+
+    @classmethod
+    def get_alpha_buckets(cls, alphas: np.ndarray) -> np.ndarray:
+        """Quantize alpha values (0-255) into bucket indices"""
+        return np.minimum(alphas * cls.ALPHA_BUCKETS // 256, cls.ALPHA_BUCKETS - 1)
+
+    def _bucket_alpha(self, bucket: int) -> int:
+        """Get the alpha value used to draw a bucket"""
+        return (bucket + 1) * 256 // self.ALPHA_BUCKETS - 1
+
+    def _ensure_color(self, color_index: int) -> None:
+        """Allocate empty atlases up to the given palette index"""
+        while len(self.atlases) <= color_index:
+            atlas = pygame.Surface(
+                (self.cell_size * self.max_radius, self.cell_size * self.ALPHA_BUCKETS),
+                pygame.SRCALPHA,
+            )
+            # No display yet; keep the plain SRCALPHA surface
+            with contextlib.suppress(pygame.error):
+                atlas = atlas.convert_alpha()
+            self.atlases.append(atlas)
+            self.rasterized.append(np.zeros((self.max_radius + 1, self.ALPHA_BUCKETS), bool))
+
+    def get_area(self, radius: int, bucket: int) -> pygame.Rect:
+        """Get the atlas area of a cell"""
+        return pygame.Rect(
+            (radius - 1) * self.cell_size, bucket * self.cell_size, radius * 2, radius * 2
+        )
+
+    def prepare(
+        self,
+        palette: List[Tuple[int, int, int]],
+        color_indices: np.ndarray,
+        radii: np.ndarray,
+        buckets: np.ndarray,
+    ) -> None:
+        """Rasterize every cell referenced by the given particles that is not drawn yet"""
+        if len(color_indices):
+            self._ensure_color(int(color_indices.max()))
+
+        keys = np.unique(
+            (color_indices.astype(np.int64) * (self.max_radius + 1) + radii) * self.ALPHA_BUCKETS
+            + buckets
+        )
+        for key in keys:
+            color_radius, bucket = divmod(int(key), self.ALPHA_BUCKETS)
+            color_index, radius = divmod(color_radius, self.max_radius + 1)
+            if self.rasterized[color_index][radius, bucket]:
+                continue
+
+            area = self.get_area(radius, bucket)
+            color = (*palette[color_index], self._bucket_alpha(bucket))
+            pygame.draw.circle(self.atlases[color_index], color, area.center, radius)
+            self.rasterized[color_index][radius, bucket] = True
+
+    def clear(self) -> None:
+        """Drop all rasterized sprites"""
+        self.atlases = []
+        self.rasterized = []
+
+
+class ParticleSystem:
+    """Single particle system stored as preallocated NumPy arrays (struct of arrays)"""
+
+    GRAVITY = 0.1
+    LIFE_DURATION = 1.0  # Seconds for a particle with life 1.0 to fade out
 
-    def update(self):
-        """Update particle positions and life"""
-        dt = 1 / 60  # Assume 60 FPS
-        for particle in self.particles[:]:
-            particle["x"] += particle["vx"]
-            particle["y"] += particle["vy"]
-            particle["vy"] += 0.1  # Gravity
-            particle["life"] -= dt / self.duration
-
-            if particle["life"] <= 0:
-                self.particles.remove(particle)
-
-    def draw(self, surface):
-        """Draw particles"""
-        for particle in self.particles:
-            alpha = int(255 * particle["life"])
-            color = (*self.color, alpha)
-            size = int(particle["size"] * particle["life"])
-            if size > 0:
-                # Create a surface with per-pixel alpha
-                particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, color, (size, size), size)
-                surface.blit(
-                    particle_surface, (int(particle["x"] - size), int(particle["y"] - size))
-                )
-
-    def is_finished(self) -> bool:
-        """Check if effect is finished"""
-        return len(self.particles) == 0 or time.time() - self.creation_time > self.duration
+    def __init__(
+        self,
+        capacity: int = AnimationConfig.MAX_PARTICLES,
+        eviction_policy: str = AnimationConfig.EFFECT_EVICTION_POLICY,
+    ):
+        self.capacity = capacity
+        self.eviction_policy = eviction_policy  # drop_oldest, lowest_priority
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color_index = np.zeros(capacity, dtype=np.uint16)
+        self.priority = np.zeros(capacity, dtype=np.int8)
+        self.serial = np.zeros(capacity, dtype=np.int64)  # Spawn order, for oldest-first eviction
+        self._next_serial = 0
+
+        # Pool counters
+        self.peak_count = 0
+        self.dropped_count = 0
+        self.evicted_count = 0
+
+        # Stack of free slot indices; the top of the stack is free_slots[free_count - 1]
+        self.free_slots = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self.free_count = capacity
+
+        self.palette: List[Tuple[int, int, int]] = []
+        self._palette_index: Dict[Tuple[int, int, int], int] = {}
+        self.atlas = ParticleSpriteAtlas()
+        self._rng = np.random.default_rng()
+        self._last_update = time.time()
+
+    @property
+    def active_count(self) -> int:
+        """Number of live particles"""
+        return self.capacity - self.free_count
+
+    def _get_color_index(self, color: Tuple[int, int, int]) -> int:
+        """Get the palette index of a color, adding it on first use"""
+        color = tuple(color)
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = index
+        return index
+
+    def spawn(self, x: int, y: int, color: Tuple[int, int, int], effect_type: str = "success"):
+        """Spawn the particles of one effect into free slots"""
+        spec = PARTICLE_SPECS.get(effect_type)
+        if spec is None:
+            return
+
+        requested = max(1, int(spec["count"] * AnimationConfig.PARTICLE_COUNT_MULTIPLIER))
+        if requested > self.free_count:
+            self._evict(requested - self.free_count, spec["priority"])
+        count = min(requested, self.free_count)
+        self.dropped_count += requested - count
+        if count == 0:
+            return
+
+        self.free_count -= count
+        slots = self.free_slots[self.free_count : self.free_count + count]
+
+        rng = self._rng
+        spread = spec["spread"]
+        self.x[slots] = x + rng.integers(-spread, spread, count, endpoint=True)
+        self.y[slots] = y + rng.integers(-spread, spread, count, endpoint=True)
+        self.vx[slots] = rng.uniform(*spec["vx"], count)
+        self.vy[slots] = rng.uniform(*spec["vy"], count)
+        self.life[slots] = spec["life"]
+        self.size[slots] = rng.integers(*spec["size"], count, endpoint=True)
+        self.color_index[slots] = self._get_color_index(color)
+        self.priority[slots] = spec["priority"]
+        self.serial[slots] = self._next_serial
+        self._next_serial += 1
+        self.peak_count = max(self.peak_count, self.active_count)
+
+    def _evict(self, count: int, incoming_priority: int) -> None:
+        """Free up to count slots from live particles according to the eviction policy"""
+        live = np.flatnonzero(self.life > 0)
+        if self.eviction_policy == "lowest_priority":
+            # Never evict particles that matter more than the incoming effect
+            live = live[self.priority[live] <= incoming_priority]
+            order = np.lexsort((self.serial[live], self.priority[live]))
+        else:
+            order = np.argsort(self.serial[live], kind="stable")
+
+        victims = live[order[:count]]
+        if len(victims) == 0:
+            return
+        self._free(victims)
+        self.evicted_count += len(victims)
+
+    def _free(self, slots: np.ndarray) -> None:
+        """Mark slots as dead and push them onto the free stack"""
+        self.life[slots] = 0
+        self.free_slots[self.free_count : self.free_count + len(slots)] = slots
+        self.free_count += len(slots)
+
+    def update(self, now: Optional[float] = None):
+        """Advance all live particles and free the ones that died
+
+        Particles move a fixed step per frame but age by the real time since
+        the last update, so effects last as long at any frame rate.
+        """
+        if now is None:
+            now = time.time()
+        dt = max(0.0, now - self._last_update)
+        self._last_update = now
+        if self.free_count == self.capacity:
+            return
+
+        alive = self.life > 0
+        np.add(self.x, self.vx, out=self.x, where=alive)
+        np.add(self.y, self.vy, out=self.y, where=alive)
+        np.add(self.vy, self.GRAVITY, out=self.vy, where=alive)
+        np.subtract(self.life, dt / self.LIFE_DURATION, out=self.life, where=alive)
+
+        dead = np.flatnonzero(alive & (self.life <= 0))
+        if len(dead):
+            self._free(dead)
+
+    def draw(self, surface) -> List[pygame.Rect]:
+        """Draw particles and return the rects that were touched"""
+        live = np.flatnonzero(self.life > 0)
+        if len(live) == 0:
+            return []
+
+        life = self.life[live]
+        sizes = (self.size[live] * life).astype(np.int32)
+        alphas = (255 * life).astype(np.int32)
+        xs = self.x[live].astype(np.int32) - sizes
+        ys = self.y[live].astype(np.int32) - sizes
+        color_indices = self.color_index[live]
+
+        visible = sizes > 0
+        radii = np.minimum(sizes[visible], self.atlas.max_radius)
+        xs = xs[visible]
+        ys = ys[visible]
+        color_indices = color_indices[visible]
+        buckets = self.atlas.get_alpha_buckets(alphas[visible])
+        self.atlas.prepare(self.palette, color_indices, radii, buckets)
+
+        # Submit every particle in a single blits() call
+        atlases = self.atlas.atlases
+        get_area = self.atlas.get_area
+        blit_sequence = [
+            (atlases[color_index], (x, y), get_area(radius, bucket))
+            for color_index, x, y, radius, bucket in zip(
+                color_indices.tolist(), xs.tolist(), ys.tolist(), radii.tolist(), buckets.tolist()
+            )
+        ]
+        return surface.blits(blit_sequence, doreturn=True) or []
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool occupancy and drop counters"""
+        return {
+            "capacity": self.capacity,
+            "active": self.active_count,
+            "peak": self.peak_count,
+            "dropped": self.dropped_count,
+            "evicted": self.evicted_count,
+        }
+
+    def clear(self):
+        """Remove all particles"""
+        self.life[:] = 0
+        self.free_slots[:] = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self.free_count = self.capacity
 
 
 class AnimationManager:
     """Manages all animations and effects in the game"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_animations: int = AnimationConfig.MAX_ANIMATIONS,
+        eviction_policy: str = AnimationConfig.EFFECT_EVICTION_POLICY,
+    ):
         self.animations: Dict[str, Animation] = {}
-        self.particle_effects: List[ParticleEffect] = []
+        self.animation_priorities: Dict[str, int] = {}
+        self.max_animations = max_animations
+        self.eviction_policy = eviction_policy  # drop_oldest, lowest_priority
+        self.particles = ParticleSystem(eviction_policy=eviction_policy)
         self.screen_transition = None
         self.typing_feedback_enabled = True
         self.transition_surface = None
+        self._popup_ids = itertools.count()
+
+        # Animation pool counters
+        self.peak_animations = 0
+        self.dropped_animations = 0
+        self.evicted_animations = 0
+
+    def add_animation(self, name: str, animation: Animation, priority: int = 0):
+        """Add a named animation, evicting another one if the pool is full"""
+        self.remove_animation(name)
+
+        if len(self.animations) >= self.max_animations:
+            if self.eviction_policy == "lowest_priority":
+                # Oldest animation among those with the lowest priority
+                victim = min(self.animations, key=self.animation_priorities.__getitem__)
+                if self.animation_priorities[victim] > priority:
+                    self.dropped_animations += 1
+                    return
+            else:
+                victim = next(iter(self.animations))
+            self.remove_animation(victim)
+            self.evicted_animations += 1
 
-    def add_animation(self, name: str, animation: Animation):
-        """Add a named animation"""
         self.animations[name] = animation
+        self.animation_priorities[name] = priority
+        self.peak_animations = max(self.peak_animations, len(self.animations))
 
     def remove_animation(self, name: str):
         """Remove an animation"""
         if name in self.animations:
             del self.animations[name]
+            del self.animation_priorities[name]
 
     def add_particle_effect(
         self, x: int, y: int, color: Tuple[int, int, int], effect_type: str = "success"
     ):
         """Add a particle effect"""
-        effect = ParticleEffect(x, y, color, effect_type)
-        self.particle_effects.append(effect)
+        self.particles.spawn(x, y, color, effect_type)
 
     def start_screen_transition(self, transition_type: str = "fade", duration: float = 0.5):
         """Start a screen transition effect"""
@@ -259,13 +489,10 @@ class AnimationManager:
 
         # Remove finished animations
         for name in finished_animations:
-            del self.animations[name]
+            self.remove_animation(name)
 
         # Update particle effects
-        for effect in self.particle_effects[:]:
-            effect.update()
-            if effect.is_finished():
-                self.particle_effects.remove(effect)
+        self.particles.update()
 
         # Update screen transition
         if self.screen_transition:
@@ -273,11 +500,12 @@ class AnimationManager:
             if self.screen_transition.finished:
                 self.screen_transition = None
 
-    def draw_effects(self, surface):
-        """Draw all visual effects"""
+    def draw_effects(self, surface) -> List[pygame.Rect]:
+        """Draw all visual effects and return the rects that were touched"""
+        drawn_rects = []
+
         # Draw particle effects
-        for effect in self.particle_effects:
-            effect.draw(surface)
+        drawn_rects.extend(self.particles.draw(surface))
 
         # Draw screen transition
         if self.screen_transition:
@@ -286,7 +514,9 @@ class AnimationManager:
                 # Create transition overlay
                 overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
                 overlay.fill((0, 0, 0, alpha))
-                surface.blit(overlay, (0, 0))
+                drawn_rects.append(surface.blit(overlay, (0, 0)))
+
+        return drawn_rects
 
     def get_animated_value(self, name: str, default_value: Any) -> Any:
         """Get animated value by name"""
@@ -325,8 +555,9 @@ class AnimationManager:
         slide_anim = SlideAnimation((x, y), (x, y - 50), 1.0, "ease_out")
         fade_anim = FadeAnimation(255, 0, 1.0, "ease_in")
 
-        self.add_animation(f"score_slide_{time.time()}", slide_anim)
-        self.add_animation(f"score_fade_{time.time()}", fade_anim)
+        popup_id = next(self._popup_ids)
+        self.add_animation(f"score_slide_{popup_id}", slide_anim, priority=1)
+        self.add_animation(f"score_fade_{popup_id}", fade_anim, priority=1)
 
     def create_button_hover_effect(self, name: str):
         """Create button hover effect"""
@@ -339,12 +570,30 @@ class AnimationManager:
         scale_anim = ScaleAnimation(1.0, 1.2, duration / 2, "ease_in_out")
         self.add_animation(f"pulse_{name}", scale_anim)
 
+    def has_active_effects(self) -> bool:
+        """Check if anything is animating and the screen needs continuous redraws"""
+        return bool(self.animations or self.particles.active_count or self.screen_transition)
+
     def is_transitioning(self) -> bool:
         """Check if a screen transition is in progress"""
         return self.screen_transition is not None
 
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get occupancy and drop counters for the animation and particle pools"""
+        return {
+            "animations": {
+                "capacity": self.max_animations,
+                "active": len(self.animations),
+                "peak": self.peak_animations,
+                "dropped": self.dropped_animations,
+                "evicted": self.evicted_animations,
+            },
+            "particles": self.particles.get_stats(),
+        }
+
     def clear_all_effects(self):
         """Clear all animations and effects"""
         self.animations.clear()
-        self.particle_effects.clear()
+        self.animation_priorities.clear()
+        self.particles.clear()
         self.screen_transition = None
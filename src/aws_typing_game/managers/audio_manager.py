@@ -2,18 +2,39 @@
 Audio manager for AWS Service Typing Game
 """
 
-import math
+import hashlib
+import io
+import mmap
 import os
+import queue
 import random
+import threading
 import time
-from typing import Dict, List, Optional
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Tuple
 
 import pygame
 
+from ..core.config import AudioConfig
+from ..utils.latency_stats import LatencyTracker
+
+# Posted by pygame.mixer.music when a track finishes
+MUSIC_END_EVENT = pygame.USEREVENT + 1
+
 
 class SoundGenerator:
     """Generates simple sound effects using pygame"""
 
+    @staticmethod
+    def _make_stereo_sound(wave) -> pygame.mixer.Sound:
+        """Convert a mono waveform array into a 16-bit stereo Sound"""
+        import numpy as np
+
+        samples = np.clip(wave, -32768, 32767).astype(np.int16)
+        stereo = np.ascontiguousarray(np.column_stack((samples, samples)))
+        return pygame.sndarray.make_sound(stereo)
+
     @staticmethod
     def generate_beep(
         frequency: int, duration: float, sample_rate: int = 22050
@@ -23,15 +44,9 @@ class SoundGenerator:
             import numpy as np
 
             frames = int(duration * sample_rate)
-            arr = []
-            for i in range(frames):
-                wave = 4096 * math.sin(2 * math.pi * frequency * i / sample_rate)
-                arr.append([int(wave), int(wave)])
-
-            # Convert to numpy array for pygame
-            sound_array = np.array(arr, dtype=np.int16)
-            sound = pygame.sndarray.make_sound(sound_array)
-            return sound
+            t = np.arange(frames) / sample_rate
+            wave = 4096 * np.sin(2 * np.pi * frequency * t)
+            return SoundGenerator._make_stereo_sound(wave)
         except ImportError:
             # Fallback: create a minimal silent sound
             return pygame.mixer.Sound(buffer=b"\x00\x00" * 1000)
@@ -42,17 +57,32 @@ class SoundGenerator:
         try:
             import numpy as np
 
+            rng = np.random.default_rng()
+            frames = int(duration * sample_rate)
+            # Create a short burst of noise that fades out
+            envelope = 1 - np.arange(frames) / frames
+            amplitude = (1000 * envelope * rng.uniform(0.8, 1.2, frames)).astype(np.int64)
+            noise = rng.integers(-amplitude, amplitude, endpoint=True)
+            return SoundGenerator._make_stereo_sound(noise)
+        except ImportError:
+            # Fallback: create a minimal silent sound
+            return pygame.mixer.Sound(buffer=b"\x00\x00" * 500)
+
+    @staticmethod
+    def generate_click_variant(
+        frequency: float, seed: int, duration: float = 0.05, sample_rate: int = 22050
+    ) -> pygame.mixer.Sound:
+        """Generate a typing click with a tuned body and reproducible noise"""
+        try:
+            import numpy as np
+
+            rng = np.random.default_rng(seed)
             frames = int(duration * sample_rate)
-            arr = []
-            for i in range(frames):
-                # Create a short burst of noise that fades out
-                amplitude = 1000 * (1 - i / frames) * random.uniform(0.8, 1.2)
-                noise = random.randint(-int(amplitude), int(amplitude))
-                arr.append([noise, noise])
-
-            sound_array = np.array(arr, dtype=np.int16)
-            sound = pygame.sndarray.make_sound(sound_array)
-            return sound
+            t = np.arange(frames) / sample_rate
+            envelope = (1 - np.arange(frames) / frames) ** 2  # Sharper decay than a plain click
+            noise = rng.uniform(-1, 1, frames) * rng.uniform(0.8, 1.2)
+            tone = np.sin(2 * np.pi * frequency * t)
+            return SoundGenerator._make_stereo_sound(envelope * (700 * noise + 500 * tone))
         except ImportError:
             # Fallback: create a minimal silent sound
             return pygame.mixer.Sound(buffer=b"\x00\x00" * 500)
@@ -66,21 +96,14 @@ class SoundGenerator:
             import numpy as np
 
             frames = int(duration * sample_rate)
-            arr = []
 
             # Major chord frequencies (C4, E4, G4)
-            frequencies = [261.63, 329.63, 392.00]
-
-            for i in range(frames):
-                wave = 0
-                envelope = 1 - (i / frames)  # Fade out
-                for freq in frequencies:
-                    wave += envelope * 1000 * math.sin(2 * math.pi * freq * i / sample_rate)
-                arr.append([int(wave), int(wave)])
-
-            sound_array = np.array(arr, dtype=np.int16)
-            sound = pygame.sndarray.make_sound(sound_array)
-            return sound
+            frequencies = np.array([261.63, 329.63, 392.00])
+
+            t = np.arange(frames) / sample_rate
+            envelope = 1 - np.arange(frames) / frames  # Fade out
+            tones = np.sin(2 * np.pi * frequencies[:, None] * t).sum(axis=0)
+            return SoundGenerator._make_stereo_sound(envelope * 1000 * tones)
         except ImportError:
             # Fallback: create a minimal silent sound
             return pygame.mixer.Sound(buffer=b"\x00\x00" * 1000)
@@ -91,31 +114,393 @@ class SoundGenerator:
         try:
             import numpy as np
 
+            rng = np.random.default_rng()
             frames = int(duration * sample_rate)
-            arr = []
-
-            for i in range(frames):
-                # Low frequency buzz with some randomness
-                envelope = 1 - (i / frames)
-                wave = envelope * 2000 * math.sin(2 * math.pi * 100 * i / sample_rate)
-                wave += envelope * 1000 * random.uniform(-0.3, 0.3)
-                arr.append([int(wave), int(wave)])
-
-            sound_array = np.array(arr, dtype=np.int16)
-            sound = pygame.sndarray.make_sound(sound_array)
-            return sound
+
+            # Low frequency buzz with some randomness
+            t = np.arange(frames) / sample_rate
+            envelope = 1 - np.arange(frames) / frames
+            wave = envelope * 2000 * np.sin(2 * np.pi * 100 * t)
+            wave += envelope * 1000 * rng.uniform(-0.3, 0.3, frames)
+            return SoundGenerator._make_stereo_sound(wave)
         except ImportError:
             # Fallback: create a minimal silent sound
             return pygame.mixer.Sound(buffer=b"\x00\x00" * 800)
 
 
+# Default sound bank: sound name -> (SoundGenerator method name, arguments)
+DEFAULT_SOUNDS = {
+    "typing": ("generate_click", (0.05,)),
+    "success": ("generate_success_chord", (0.4,)),
+    "error": ("generate_error_buzz", (0.2,)),
+    "menu_select": ("generate_beep", (800, 0.1)),
+    "menu_navigate": ("generate_beep", (600, 0.05)),
+    "game_start": ("generate_beep", (1000, 0.3)),
+    "game_over": ("generate_beep", (300, 0.8)),
+    "new_word": ("generate_beep", (700, 0.1)),
+}
+
+# Custom sound file names for each sound, in order of preference
+CUSTOM_SOUND_FILES = {
+    "typing": ["type", "click", "key"],
+    "success": ["success", "correct", "win"],
+    "error": ["error", "wrong", "buzz"],
+    "menu_select": ["select", "confirm"],
+    "menu_navigate": ["navigate", "move"],
+    "game_start": ["start", "begin"],
+    "game_over": ["gameover", "end"],
+    "new_word": ["newword", "next"],
+}
+CUSTOM_SOUND_EXTENSIONS = [".wav", ".ogg"]
+
+
+def _decode_sound_file(filepath: str) -> Tuple[Optional[pygame.mixer.Sound], float]:
+    """Decode a sound file into the mixer's sample format and time it"""
+    start = time.perf_counter()
+    try:
+        sound = pygame.mixer.Sound(filepath)
+    except pygame.error:
+        sound = None
+    return sound, time.perf_counter() - start
+
+
+def _find_custom_sound_files(folder: str) -> Dict[str, List[str]]:
+    """Find the custom files of each sound in a folder, most preferred first"""
+    # List the folder once and match file names case-insensitively
+    try:
+        available = {
+            entry.name.lower(): entry.path for entry in os.scandir(folder) if entry.is_file()
+        }
+    except OSError:
+        return {}
+
+    candidates = {}
+    for sound_name, base_names in CUSTOM_SOUND_FILES.items():
+        paths = [
+            available[base_name + extension]
+            for base_name in base_names
+            for extension in CUSTOM_SOUND_EXTENSIONS
+            if base_name + extension in available
+        ]
+        if paths:
+            candidates[sound_name] = paths
+    return candidates
+
+
+def _code_fingerprint(code: types.CodeType, digest) -> None:
+    """Feed a function's bytecode and constants into a hash"""
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_fingerprint(const, digest)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def _function_fingerprint(function: types.FunctionType, digest) -> None:
+    """Feed a function's code and default argument values into a hash"""
+    _code_fingerprint(function.__code__, digest)
+    digest.update(repr((function.__defaults__, function.__kwdefaults__)).encode("utf-8"))
+
+
+class SoundCache:
+    """On-disk cache of raw PCM buffers for generated sounds
+
+    Each buffer is stored in its own file named after a hash of the generator,
+    its arguments, the generator code and defaults, and the mixer format, so
+    changing any of them makes the old files unreachable instead of returning
+    stale audio.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, folder: str = AudioConfig.SOUND_CACHE_FOLDER):
+        self.folder = folder
+        self.hits = 0
+        self.misses = 0
+        self._fingerprints: Dict[str, str] = {}
+
+    def _generator_fingerprint(self, generator_name: str) -> str:
+        """Get a hash of the code that produces a generator's samples"""
+        if generator_name not in self._fingerprints:
+            digest = hashlib.blake2b(digest_size=20)
+            _function_fingerprint(getattr(SoundGenerator, generator_name), digest)
+            _function_fingerprint(SoundGenerator._make_stereo_sound, digest)
+            self._fingerprints[generator_name] = digest.hexdigest()
+        return self._fingerprints[generator_name]
+
+    def make_key(self, generator_name: str, args: tuple) -> Optional[str]:
+        """Build the cache key for a generated sound, or None if the mixer is not ready"""
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            return None
+        key = repr(
+            (
+                self.FORMAT_VERSION,
+                generator_name,
+                args,
+                mixer_format,
+                self._generator_fingerprint(generator_name),
+            )
+        )
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=20).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, f"{key}.pcm")
+
+    def load(self, key: str) -> Optional[pygame.mixer.Sound]:
+        """Load a cached buffer from a memory-mapped file
+
+        pygame copies the samples into its own chunk, so the map is closed
+        right away; mapping only skips reading the file into a bytes object.
+        """
+        try:
+            with open(self._path(key), "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buffer:
+                sound = pygame.mixer.Sound(buffer=buffer)
+        except (OSError, ValueError, pygame.error):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return sound
+
+    def store(self, key: str, sound: pygame.mixer.Sound) -> None:
+        """Write a sound's raw samples to the cache"""
+        path = self._path(key)
+        temp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.write(sound.get_raw())
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not cache sound: {e}")
+
+    def prune(self, keep_keys: Iterable[str]) -> None:
+        """Delete cached buffers that are no longer referenced"""
+        keep_files = {f"{key}.pcm" for key in keep_keys}
+        try:
+            for filename in os.listdir(self.folder):
+                if filename not in keep_files:
+                    os.remove(os.path.join(self.folder, filename))
+        except OSError:
+            pass
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache usage counters"""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class AudioDispatcher:
+    """Runs play commands on a worker thread so mixer calls never block a frame
+
+    Commands go through a bounded queue and are dropped rather than blocking
+    when it is full. A command identical to one still waiting in the queue is
+    coalesced into it, since both would play at the same moment. Sounds in
+    uncoalesced_sounds, such as typing clicks, play once per command so every
+    keystroke is heard.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, Optional[float], Optional[float]], None],
+        max_size: int = AudioConfig.AUDIO_QUEUE_SIZE,
+        uncoalesced_sounds: Collection[str] = ("typing",),
+    ):
+        self.handler = handler
+        self.uncoalesced_sounds = frozenset(uncoalesced_sounds)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        # Shared by the submitting thread and the worker
+        self._pending: set = set()
+        self._pending_lock = threading.Lock()
+
+        self.submitted = 0
+        self.dispatched = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="audio-dispatcher", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        sound_name: str,
+        volume_override: Optional[float] = None,
+        keypress_time: Optional[float] = None,
+    ) -> None:
+        """Queue a play command without waiting for the mixer"""
+        self.submitted += 1
+        command = (sound_name, volume_override)
+        coalesce = sound_name not in self.uncoalesced_sounds
+        if coalesce:
+            with self._pending_lock:
+                if command in self._pending:
+                    self.coalesced += 1
+                    return
+                self._pending.add(command)
+
+        try:
+            self._queue.put_nowait((command, time.perf_counter(), keypress_time))
+        except queue.Full:
+            if coalesce:
+                with self._pending_lock:
+                    self._pending.discard(command)
+            self.dropped += 1
+            return
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            command, queued_at, keypress_time = item
+            with self._pending_lock:
+                self._pending.discard(command)
+
+            latency = time.perf_counter() - queued_at
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.dispatched += 1
+
+            try:
+                self.handler(*command, keypress_time)
+            except pygame.error as e:
+                print(f"Warning: Could not play sound: {e}")
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Stop the worker after the queued commands have been played"""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get queue depth and dispatch latency counters"""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self.max_depth,
+            "submitted": self.submitted,
+            "dispatched": self.dispatched,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "mean_latency_ms": 1000 * self.total_latency / max(self.dispatched, 1),
+            "max_latency_ms": 1000 * self.max_latency,
+        }
+
+
+class MusicPlaylist:
+    """Plays background tracks in shuffled order without blocking the frame loop
+
+    Track files are read and handed to the mixer on a worker thread, and the
+    following track is always prebuffered and queued with mixer.music.queue so
+    playback continues by itself when the current one ends.
+    """
+
+    def __init__(self, tracks: List[str], fade_ms: int = AudioConfig.MUSIC_FADE_MS):
+        self.tracks = list(tracks)
+        self.fade_ms = fade_ms
+        self.current_track: Optional[str] = None
+        self.queued_track: Optional[str] = None
+        self._order: List[str] = []
+        self._active = False
+        # The mixer streams from these buffers, so they must stay referenced
+        self._current_buffer: Optional[io.BytesIO] = None
+        self._queued_buffer: Optional[io.BytesIO] = None
+
+        self._commands: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="music-playlist", daemon=True)
+        self._thread.start()
+
+    def play(self, track_path: Optional[str] = None) -> None:
+        """Start playback from a given track, or the next one in the playlist"""
+        self._commands.put(("play", track_path))
+
+    def stop(self) -> None:
+        """Stop playback"""
+        self._commands.put(("stop", None))
+
+    def track_ended(self) -> None:
+        """Advance the playlist after the mixer moved on to the queued track"""
+        self._commands.put(("ended", None))
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Stop the worker thread"""
+        self._commands.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            command = self._commands.get()
+            if command is None:
+                break
+            action, track_path = command
+            try:
+                if action == "play":
+                    self._play(track_path)
+                elif action == "stop":
+                    self._stop()
+                elif action == "ended":
+                    self._advance()
+            except (pygame.error, OSError) as e:
+                print(f"Warning: Could not play music: {e}")
+
+    def _next_track(self) -> str:
+        """Get the next track, reshuffling after every full pass"""
+        if not self._order:
+            self._order = random.sample(self.tracks, len(self.tracks))
+        return self._order.pop()
+
+    def _read(self, track_path: str) -> io.BytesIO:
+        with open(track_path, "rb") as f:
+            return io.BytesIO(f.read())
+
+    def _play(self, track_path: Optional[str]) -> None:
+        track_path = track_path or self._next_track()
+        buffer = self._read(track_path)
+        pygame.mixer.music.load(buffer, track_path)
+        pygame.mixer.music.play(fade_ms=self.fade_ms)
+        self._active = True
+        self.current_track, self._current_buffer = track_path, buffer
+        print(f"Started playing BGM: {os.path.basename(track_path)}")
+        self._queue_next()
+
+    def _queue_next(self) -> None:
+        track_path = self._next_track()
+        buffer = self._read(track_path)
+        pygame.mixer.music.queue(buffer, track_path)
+        self.queued_track, self._queued_buffer = track_path, buffer
+
+    def _advance(self) -> None:
+        if not self._active or self.queued_track is None:
+            return
+        self.current_track, self._current_buffer = self.queued_track, self._queued_buffer
+        self._queue_next()
+
+    def _stop(self) -> None:
+        self._active = False
+        # Stopping posts an end event too, which must not advance the playlist
+        pygame.mixer.music.set_endevent()
+        pygame.mixer.music.stop()
+        pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+        self.current_track = self.queued_track = None
+        self._current_buffer = self._queued_buffer = None
+
+
 class AudioManager:
     """Manages all audio functionality for the game"""
 
     def __init__(self):
         # Initialize pygame mixer
         try:
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            pygame.mixer.init(
+                frequency=22050, size=-16, channels=2, buffer=AudioConfig.MIXER_BUFFER_SIZE
+            )
             self.audio_enabled = True
         except pygame.error:
             print("Warning: Audio could not be initialized")
@@ -132,7 +517,17 @@ class AudioManager:
         # Sound effects
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.music_tracks: List[str] = []
-        self.current_music = None
+        self.playlist: Optional[MusicPlaylist] = None
+        self.custom_sound_load_times: Dict[str, float] = {}
+        self.sound_cache = SoundCache() if AudioConfig.ENABLE_SOUND_CACHE else None
+
+        # Typing clicks rotate through several variants on reserved channels
+        self.typing_volume = AudioConfig.TYPING_VOLUME
+        self.typing_variants: List[pygame.mixer.Sound] = []
+        self.typing_variant_index = 0
+        reserved = pygame.mixer.set_reserved(AudioConfig.TYPING_CHANNELS)
+        self.typing_channels = [pygame.mixer.Channel(i) for i in range(reserved)]
+        self.typing_channel_index = 0
 
         # Generate basic sound effects
         self._generate_default_sounds()
@@ -147,9 +542,19 @@ class AudioManager:
         # Load custom sounds if available
         self._load_custom_sounds()
 
-        # Typing sound timing
-        self.last_type_sound = 0
-        self.type_sound_interval = 0.05  # Minimum interval between typing sounds
+        # Music is scanned once at startup and played by a background playlist
+        if self.music_tracks:
+            pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+            self.playlist = MusicPlaylist(self.music_tracks)
+
+        # Optional keypress-to-sound latency measurements
+        self.latency_tracker = LatencyTracker() if AudioConfig.ENABLE_LATENCY_TRACKING else None
+        self._keypress_time: Optional[float] = None
+
+        # Optionally move mixer calls off the render thread
+        self.dispatcher = (
+            AudioDispatcher(self._play_sound_now) if AudioConfig.ENABLE_AUDIO_THREAD else None
+        )
 
     def _generate_default_sounds(self):
         """Generate default sound effects"""
@@ -157,50 +562,64 @@ class AudioManager:
             return
 
         try:
-            # Generate basic sound effects
-            self.sounds["typing"] = SoundGenerator.generate_click(0.05)
-            self.sounds["success"] = SoundGenerator.generate_success_chord(0.4)
-            self.sounds["error"] = SoundGenerator.generate_error_buzz(0.2)
-            self.sounds["menu_select"] = SoundGenerator.generate_beep(800, 0.1)
-            self.sounds["menu_navigate"] = SoundGenerator.generate_beep(600, 0.05)
-            self.sounds["game_start"] = SoundGenerator.generate_beep(1000, 0.3)
-            self.sounds["game_over"] = SoundGenerator.generate_beep(300, 0.8)
-            self.sounds["new_word"] = SoundGenerator.generate_beep(700, 0.1)
+            # Generate basic sound effects, reusing buffers cached by earlier runs
+            cache_keys: List[str] = []
+            for sound_name, (generator_name, args) in DEFAULT_SOUNDS.items():
+                self.sounds[sound_name] = self._get_generated_sound(
+                    generator_name, args, cache_keys
+                )
+
+            # Pitch and noise varied typing clicks
+            count = AudioConfig.TYPING_CLICK_VARIANTS
+            self.typing_variants = [
+                self._get_generated_sound(
+                    "generate_click_variant", (1600 + 800 * i / max(count - 1, 1), i), cache_keys
+                )
+                for i in range(count)
+            ]
+
+            if self.sound_cache and self.sound_cache.misses:
+                self.sound_cache.prune(cache_keys)
 
             # Set volumes for generated sounds
-            for sound in self.sounds.values():
-                sound.set_volume(self.sfx_volume * self.master_volume)
+            self._update_sound_volumes()
 
         except Exception as e:
             print(f"Warning: Could not generate default sounds: {e}")
 
+    def _get_generated_sound(
+        self, generator_name: str, args: tuple, cache_keys: List[str]
+    ) -> pygame.mixer.Sound:
+        """Load a generated sound from the cache, synthesizing it on a miss"""
+        key = self.sound_cache.make_key(generator_name, args) if self.sound_cache else None
+        sound = self.sound_cache.load(key) if key else None
+        if sound is None:
+            sound = getattr(SoundGenerator, generator_name)(*args)
+            if key:
+                self.sound_cache.store(key, sound)
+        if key:
+            cache_keys.append(key)
+        return sound
+
     def _load_custom_sounds(self):
         """Load custom sound files if available"""
         if not self.audio_enabled:
             return
 
-        sound_files = {
-            "typing": ["type.wav", "click.wav", "key.wav"],
-            "success": ["success.wav", "correct.wav", "win.wav"],
-            "error": ["error.wav", "wrong.wav", "buzz.wav"],
-            "menu_select": ["select.wav", "confirm.wav"],
-            "menu_navigate": ["navigate.wav", "move.wav"],
-            "game_start": ["start.wav", "begin.wav"],
-            "game_over": ["gameover.wav", "end.wav"],
-            "new_word": ["newword.wav", "next.wav"],
-        }
-
-        if os.path.exists(self.sounds_folder):
-            for sound_name, possible_files in sound_files.items():
-                for filename in possible_files:
-                    filepath = os.path.join(self.sounds_folder, filename)
-                    if os.path.exists(filepath):
-                        try:
-                            self.sounds[sound_name] = pygame.mixer.Sound(filepath)
-                            self.sounds[sound_name].set_volume(self.sfx_volume * self.master_volume)
-                            break
-                        except pygame.error:
-                            continue
+        candidates = _find_custom_sound_files(self.sounds_folder)
+        if candidates:
+            for sound_name, sound in self._decode_custom_sounds(candidates).items():
+                self.sounds[sound_name] = sound
+                if sound_name == "typing":
+                    # A custom click replaces the generated variants
+                    self.typing_variants = [sound]
+
+            self._update_sound_volumes()
+            slowest = max(self.custom_sound_load_times, key=self.custom_sound_load_times.get)
+            print(
+                f"Decoded {len(self.custom_sound_load_times)} custom sound(s), slowest: {slowest} "
+                f"({self.custom_sound_load_times[slowest]:.1f} ms)"
+            )
 
         # Load music files
         if os.path.exists(self.music_folder):
@@ -215,31 +634,94 @@ class AudioManager:
         else:
             print("No music files found in assets/music/ folder")
 
+    def _decode_custom_sounds(
+        self, candidates: Dict[str, List[str]]
+    ) -> Dict[str, pygame.mixer.Sound]:
+        """Decode the preferred file of each sound, falling back to the next one if it fails"""
+        sounds: Dict[str, pygame.mixer.Sound] = {}
+        remaining = {sound_name: list(paths) for sound_name, paths in candidates.items()}
+        workers = min(AudioConfig.SOUND_LOADER_WORKERS, len(remaining))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while remaining:
+                # One file per sound at a time, so unused alternatives are never decoded
+                chosen = {sound_name: paths.pop(0) for sound_name, paths in remaining.items()}
+                results = executor.map(_decode_sound_file, chosen.values())
+                for (sound_name, filepath), (sound, seconds) in zip(chosen.items(), results):
+                    self.custom_sound_load_times[os.path.basename(filepath)] = seconds * 1000
+                    if sound is not None:
+                        sounds[sound_name] = sound
+                remaining = {
+                    sound_name: paths
+                    for sound_name, paths in remaining.items()
+                    if paths and sound_name not in sounds
+                }
+        return sounds
+
     def play_sound(self, sound_name: str, volume_override: Optional[float] = None):
         """Play a sound effect"""
         if not self.audio_enabled or not self.sfx_enabled:
             return
 
-        if sound_name in self.sounds:
+        if self.dispatcher:
+            self.dispatcher.submit(sound_name, volume_override, self._keypress_time)
+        else:
+            self._play_sound_now(sound_name, volume_override, self._keypress_time)
+
+    def _play_sound_now(
+        self,
+        sound_name: str,
+        volume_override: Optional[float] = None,
+        keypress_time: Optional[float] = None,
+    ):
+        """Issue the mixer calls for a sound effect"""
+        # Typing clicks have their own voices and volume
+        if sound_name == "typing" and self.typing_variants and self.typing_channels:
+            self._play_typing_click()
+        elif sound_name in self.sounds:
             sound = self.sounds[sound_name]
 
-            # Special handling for typing sounds to prevent overlap
-            if sound_name == "typing":
-                current_time = time.time()
-                if current_time - self.last_type_sound < self.type_sound_interval:
-                    return
-                self.last_type_sound = current_time
-
             if volume_override is not None:
                 sound.set_volume(volume_override * self.master_volume)
             else:
                 sound.set_volume(self.sfx_volume * self.master_volume)
 
             sound.play()
+        else:
+            return
+
+        if self.latency_tracker and keypress_time is not None:
+            self.latency_tracker.record(sound_name, time.perf_counter() - keypress_time)
+
+    def mark_keypress(self):
+        """Remember when the key being handled was pressed, for latency tracking"""
+        if self.audio_enabled and self.latency_tracker:
+            self._keypress_time = time.perf_counter()
+
+    def clear_keypress(self):
+        """Stop attributing sounds to the last keypress"""
+        if self.audio_enabled:
+            self._keypress_time = None
+
+    def _play_typing_click(self):
+        """Play the next click variant, stealing the oldest voice if all are busy"""
+        sound = self.typing_variants[self.typing_variant_index]
+        self.typing_variant_index = (self.typing_variant_index + 1) % len(self.typing_variants)
+
+        # Channels are used in rotation, so the next one in line is the oldest voice
+        channel_count = len(self.typing_channels)
+        index = self.typing_channel_index
+        for offset in range(channel_count):
+            candidate = (self.typing_channel_index + offset) % channel_count
+            if not self.typing_channels[candidate].get_busy():
+                index = candidate
+                break
+
+        self.typing_channels[index].play(sound)
+        self.typing_channel_index = (index + 1) % channel_count
 
     def play_typing_sound(self):
-        """Play typing sound with rate limiting"""
-        self.play_sound("typing", 0.3)
+        """Play typing sound"""
+        self.play_sound("typing")
 
     def play_success_sound(self):
         """Play success sound"""
@@ -268,43 +750,42 @@ class AudioManager:
         """Play new word sound"""
         self.play_sound("new_word", 0.6)
 
+    @property
+    def current_music(self) -> Optional[str]:
+        """Path of the background track that is currently playing"""
+        return self.playlist.current_track if self.playlist else None
+
     def start_background_music(self, track_name: Optional[str] = None):
         """Start playing background music"""
         if not self.audio_enabled or not self.music_enabled:
             return
 
         # Check if music tracks are available
-        if not self.music_tracks:
+        if not self.playlist:
             return  # No music to play
 
-        try:
-            if track_name:
-                # Play specific track
-                track_path = None
-                for track in self.music_tracks:
-                    if track_name in track:
-                        track_path = track
-                        break
-                if not track_path:
-                    return
-            else:
-                # Play random track
-                track_path = random.choice(self.music_tracks)
+        track_path = None
+        if track_name:
+            # Play specific track
+            for track in self.music_tracks:
+                if track_name in track:
+                    track_path = track
+                    break
+            if not track_path:
+                return
 
-            pygame.mixer.music.load(track_path)
-            pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-            pygame.mixer.music.play(-1)  # Loop indefinitely
-            self.current_music = track_path
-            print(f"Started playing BGM: {os.path.basename(track_path)}")
-
-        except pygame.error as e:
-            print(f"Warning: Could not play music: {e}")
+        pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
+        self.playlist.play(track_path)
 
     def stop_background_music(self):
         """Stop background music"""
-        if self.audio_enabled:
-            pygame.mixer.music.stop()
-            self.current_music = None
+        if self.audio_enabled and self.playlist:
+            self.playlist.stop()
+
+    def handle_event(self, event: pygame.event.Event):
+        """Handle audio events posted by the mixer"""
+        if self.audio_enabled and self.playlist and event.type == MUSIC_END_EVENT:
+            self.playlist.track_ended()
 
     def pause_background_music(self):
         """Pause background music"""
@@ -357,6 +838,36 @@ class AudioManager:
 
         for sound in self.sounds.values():
             sound.set_volume(self.sfx_volume * self.master_volume)
+        for sound in self.typing_variants:
+            sound.set_volume(self.typing_volume * self.master_volume)
+
+    def shutdown(self):
+        """Stop the audio worker threads"""
+        if not self.audio_enabled:
+            return
+        if self.dispatcher:
+            self.dispatcher.shutdown()
+            self.dispatcher = None
+        if self.playlist:
+            self.playlist.shutdown()
+        if self.latency_tracker:
+            self.dump_latency_stats()
+
+    def dump_latency_stats(self, path: str = AudioConfig.LATENCY_DUMP_FILE):
+        """Write keypress-to-sound latency statistics with the mixer settings"""
+        if not self.audio_enabled or not self.latency_tracker:
+            return
+        frequency, size, channels = pygame.mixer.get_init() or (0, 0, 0)
+        self.latency_tracker.dump(
+            path,
+            {
+                "frequency": frequency,
+                "size": size,
+                "channels": channels,
+                "buffer": AudioConfig.MIXER_BUFFER_SIZE,
+                "audio_thread": self.dispatcher is not None,
+            },
+        )
 
     def create_audio_folders(self):
         """Create audio folders if they don't exist"""
@@ -419,4 +930,8 @@ Example filenames:
             "current_music": os.path.basename(self.current_music) if self.current_music else None,
             "available_tracks": len(self.music_tracks),
             "loaded_sounds": list(self.sounds.keys()),
+            "sound_cache": self.sound_cache.get_stats() if self.sound_cache else None,
+            "command_queue": self.dispatcher.get_stats() if self.dispatcher else None,
+            "latency": self.latency_tracker.get_stats() if self.latency_tracker else None,
+            "custom_sound_load_ms": dict(self.custom_sound_load_times),
         }
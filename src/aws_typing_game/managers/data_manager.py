@@ -2,39 +2,400 @@
 Data management module for AWS Service Typing Game
 """
 
+import contextlib
 import json
+import os
+import queue
+import sqlite3
+import stat
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..core.config import FileConfig
+from ..utils.corpus import (
+    CORPUS_SUFFIX,
+    JSONL_SUFFIX,
+    SOURCE_SUFFIXES,
+    CompiledCorpus,
+    CorpusIndex,
+    MultiCorpus,
+    StreamingCorpus,
+)
+from ..utils.session_store import SessionStore
+from ..utils.typing_stats import TypingStats
+
+# The data directory within the package
+DEFAULT_AWS_DATA_FILE = Path(__file__).parent.parent / "data" / "aws_services_data.json"
+
+Corpus = Union[CorpusIndex, CompiledCorpus, StreamingCorpus, MultiCorpus]
+SourceSignature = Tuple[int, int]
+
+
+def _read_umask() -> int:
+    """Read the process umask, which can only be done by setting it"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import, before worker threads could create files concurrently
+FILE_CREATION_MASK = _read_umask()
+
+
+def write_file_atomic(path: str, data: Union[str, bytes]) -> None:
+    """Replace a file so that readers see either the old or the new contents"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    # mkstemp creates files as 0600; keep the mode the file has or would get
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~FILE_CREATION_MASK
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+    # Persist the rename itself; directories cannot be opened on Windows. The
+    # data is already in place, so a failure here does not fail the save
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError as e:
+            print(f"Warning: Could not sync directory of {path}: {e}")
+
+
+def serialize_json(data: Dict[str, Any]) -> bytes:
+    """Serialize save data the way it is stored on disk"""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+class SaveWriter:
+    """Writes a file on a worker thread so saving never blocks a frame
+
+    Only the newest snapshot is kept: a save submitted while another is still
+    waiting replaces it, and the queue merely wakes the worker. Wake-ups are
+    dropped rather than blocking when the bounded queue is full, since the
+    pending snapshot is written by the wake-up already queued.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = FileConfig.SAVE_QUEUE_SIZE,
+        serialize: Callable[[Any], bytes] = serialize_json,
+    ):
+        self.path = path
+        self.serialize = serialize
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._snapshot: Optional[bytes] = None
+
+        self.submitted = 0
+        self.written = 0
+        self.coalesced = 0
+        self.failed = 0
+
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, data: Any) -> None:
+        """Queue a snapshot of the data without touching the disk"""
+        snapshot = self.serialize(data)
+        self.submitted += 1
+        with self._lock:
+            if self._snapshot is not None:
+                self.coalesced += 1
+            self._snapshot = snapshot
+        with contextlib.suppress(queue.Full):
+            self._queue.put_nowait(True)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+
+            with self._lock:
+                snapshot, self._snapshot = self._snapshot, None
+            if snapshot is None:
+                continue
+            try:
+                write_file_atomic(self.path, snapshot)
+                self.written += 1
+            except OSError as e:
+                self.failed += 1
+                print(f"Error saving {self.path}: {e}")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every submitted snapshot has been written"""
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Write the pending snapshot and stop the worker"""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get save pipeline counters"""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "submitted": self.submitted,
+            "written": self.written,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+        }
 
 
 class DataManager:
     """Manages game data including AWS services and user statistics"""
 
-    def __init__(self, aws_data_file: str = None, save_file: str = "save_data.json"):
+    def __init__(
+        self,
+        aws_data_file: Union[str, Path, Sequence[Union[str, Path]], None] = None,
+        save_file: str = "save_data.json",
+        watch_interval: Optional[float] = None,
+        async_save: bool = False,
+        session_db: Optional[str] = None,
+        typing_stats_file: Optional[str] = None,
+    ):
         # Set default path for AWS data file relative to package
         if aws_data_file is None:
-            # Get the path to the data directory within the package
-            package_dir = Path(__file__).parent.parent
-            self.aws_data_file = package_dir / "data" / "aws_services_data.json"
+            self.aws_data_file = DEFAULT_AWS_DATA_FILE
+        elif isinstance(aws_data_file, (list, tuple)):
+            self.aws_data_file = aws_data_file[0]
         else:
             self.aws_data_file = aws_data_file
+        # Corpus files or directories, earlier sources win for duplicate services
+        self.data_sources: List[Union[str, Path]] = (
+            list(aws_data_file)
+            if isinstance(aws_data_file, (list, tuple))
+            else [self.aws_data_file]
+        )
         self.save_file = save_file
         self.aws_data = None
         self.save_data = None
+        self.save_writer = SaveWriter(save_file) if async_save else None
+        self.session_store: Optional[SessionStore] = None
+        if session_db is not None:
+            try:
+                self.session_store = SessionStore(session_db, FileConfig.SESSION_PROFILE)
+            except sqlite3.Error as e:
+                print(f"Warning: Could not open session history {session_db}: {e}")
+        self.typing_stats_file = typing_stats_file
+        self.typing_stats = TypingStats()
+        self.stats_writer = (
+            SaveWriter(typing_stats_file, serialize=TypingStats.to_bytes)
+            if async_save and typing_stats_file is not None
+            else None
+        )
+
+        # Lookup indexes, rebuilt whenever the AWS data is (re)loaded
+        self.corpus: Corpus = CorpusIndex(None)
+        self._sources: Dict[str, Optional[Corpus]] = {}
+
+        # Source state seen by the last scan, which may not have been applied yet
+        self._scan_lock = threading.Lock()
+        self._scanned_signatures: Optional[Dict[str, Optional[SourceSignature]]] = None
+        self._scanned_sources: Dict[str, Optional[Corpus]] = {}
+        self._scanned_data: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._pending_reload = None
+        # Replaced compiled corpora whose memory maps are still in use somewhere
+        self._retired_corpora: List[CompiledCorpus] = []
+        self._watch_stop = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+
         self.load_aws_data()
         self.load_save_data()
+        self.load_typing_stats()
+        if watch_interval is not None:
+            self.start_watching(watch_interval)
 
     def load_aws_data(self) -> None:
-        """Load AWS services data from JSON file"""
+        """Load AWS services data from every source and apply it immediately"""
+        with self._scan_lock:
+            self._scanned_signatures = None
+            self._scanned_sources = {}
+            self._scanned_data = {}
+            self._scan_sources()
+        self.apply_pending_reload()
+
+    def _list_source_files(self) -> List[str]:
+        """List the corpus files of every source in precedence order"""
+        paths = []
+        for source in map(str, self.data_sources):
+            if source.endswith(SOURCE_SUFFIXES):
+                paths.append(source)
+            elif os.path.isdir(source):
+                # Directories may appear later; their files load in name order
+                paths.extend(
+                    sorted(
+                        entry.path
+                        for entry in os.scandir(source)
+                        if entry.is_file() and entry.name.endswith(SOURCE_SUFFIXES)
+                    )
+                )
+        return paths
+
+    def _get_signature(self, path: str) -> Optional[SourceSignature]:
+        """Get the modification time and size that identify a source file version"""
         try:
-            with open(self.aws_data_file, encoding="utf-8") as f:
-                self.aws_data = json.load(f)
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def _scan_sources(self) -> bool:
+        """Reload changed sources and stage the merged corpus; call with the scan lock held"""
+        signatures = {path: self._get_signature(path) for path in self._list_source_files()}
+        if signatures == self._scanned_signatures:
+            return False
+        previous_signatures = self._scanned_signatures or {}
+
+        sources: Dict[str, Optional[Corpus]] = {}
+        source_data: Dict[str, Dict[str, Any]] = {}
+        for path, signature in signatures.items():
+            if path in self._scanned_sources and previous_signatures.get(path) == signature:
+                sources[path] = self._scanned_sources[path]
+                if path in self._scanned_data:
+                    source_data[path] = self._scanned_data[path]
+                continue
+            sources[path] = self._load_source(path, source_data)
+
+        corpus, aws_data = self._merge_sources(sources, source_data)
+        self._scanned_signatures = signatures
+        self._scanned_sources = sources
+        self._scanned_data = source_data
+        with self._pending_lock:
+            self._pending_reload = (corpus, aws_data, sources)
+        return True
+
+    def _load_source(self, path: str, source_data: Dict[str, Dict[str, Any]]) -> Optional[Corpus]:
+        """Load one corpus file, keeping parsed JSON data for the aws_data attribute"""
+        try:
+            if path.endswith(CORPUS_SUFFIX):
+                # Memory-mapped; its tables are only read when used
+                return CompiledCorpus(path)
+            if path.endswith(JSONL_SUFFIX):
+                # Streamed; categories are completed on first use
+                return StreamingCorpus(path)
+            with open(path, encoding="utf-8") as f:
+                source_data[path] = json.load(f)
+            return CorpusIndex(source_data[path])
         except FileNotFoundError:
-            print(f"Warning: {self.aws_data_file} not found. Using fallback data.")
-            self.aws_data = self._get_fallback_aws_data()
+            print(f"Warning: {path} not found.")
         except json.JSONDecodeError as e:
-            print(f"Error loading AWS data: {e}")
-            self.aws_data = self._get_fallback_aws_data()
+            print(f"Error loading AWS data from {path}: {e}")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: Could not load {path}: {e}")
+        return None
+
+    def _merge_sources(
+        self, sources: Dict[str, Optional[Corpus]], source_data: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Corpus, Optional[Dict[str, Any]]]:
+        """Combine the loaded sources, falling back to built-in data if none loaded"""
+        loaded = [path for path, corpus in sources.items() if corpus is not None]
+        if not loaded:
+            print("Warning: No AWS data could be loaded. Using fallback data.")
+            aws_data = self._get_fallback_aws_data()
+            return CorpusIndex(aws_data), aws_data
+        if len(loaded) == 1:
+            return sources[loaded[0]], source_data.get(loaded[0])
+        return MultiCorpus([sources[path] for path in loaded]), None
+
+    def apply_pending_reload(self) -> bool:
+        """Swap in indexes staged by the watcher; call between frames"""
+        if self._retired_corpora:
+            self._close_retired_corpora()
+        with self._pending_lock:
+            pending, self._pending_reload = self._pending_reload, None
+        if pending is None:
+            return False
+
+        previous_sources = self._sources
+        self.corpus, self.aws_data, self._sources = pending
+
+        # Release memory maps of replaced sources only after nothing uses them
+        retained = {id(source) for source in self._sources.values()}
+        self._retired_corpora.extend(
+            source
+            for source in previous_sources.values()
+            if isinstance(source, CompiledCorpus) and id(source) not in retained
+        )
+        self._close_retired_corpora()
+        return True
+
+    def _close_retired_corpora(self) -> None:
+        """Close replaced compiled corpora, keeping those still referenced for a later try"""
+        still_open = []
+        for corpus in self._retired_corpora:
+            try:
+                corpus.close()
+            except BufferError:
+                still_open.append(corpus)
+        self._retired_corpora = still_open
+
+    def check_for_changes(self) -> bool:
+        """Reload any changed sources in the calling thread; they apply on the next swap"""
+        with self._scan_lock:
+            return self._scan_sources()
+
+    def start_watching(self, interval: float = 1.0) -> None:
+        """Poll the sources for changes on a background thread"""
+        if self._watch_thread is not None:
+            return
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop, args=(interval,), name="corpus-watcher", daemon=True
+        )
+        self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        """Stop the watcher thread"""
+        if self._watch_thread is None:
+            return
+        self._watch_stop.set()
+        self._watch_thread.join()
+        self._watch_thread = None
+
+    def _watch_loop(self, interval: float) -> None:
+        """Check the sources every interval until stopped"""
+        while not self._watch_stop.wait(interval):
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                # A broken edit must not stop the watcher
+                print(f"Warning: Could not reload AWS data: {e}")
 
     def load_save_data(self) -> None:
         """Load user save data from JSON file"""
@@ -48,45 +409,75 @@ class DataManager:
             self.save_data = self._get_default_save_data()
 
     def save_user_data(self) -> None:
-        """Save user data to JSON file"""
+        """Save user data to JSON file, in the background when async saving is on"""
+        if self.save_writer is not None:
+            self.save_writer.submit(self.save_data)
+            return
         try:
-            with open(self.save_file, "w", encoding="utf-8") as f:
-                json.dump(self.save_data, f, ensure_ascii=False, indent=2)
+            write_file_atomic(self.save_file, serialize_json(self.save_data))
         except Exception as e:
             print(f"Error saving user data: {e}")
 
-    def get_all_sentences(self) -> List[str]:
-        """Get all typing sentences from all categories"""
-        sentences = []
-        if self.aws_data and "categories" in self.aws_data:
-            for category in self.aws_data["categories"].values():
-                sentences.extend(category.get("sentences", []))
-        return sentences
+    def shutdown(self) -> None:
+        """Stop the corpus watcher and write any pending save data and sessions"""
+        self.stop_watching()
+        if self.save_writer is not None:
+            self.save_writer.shutdown()
+        if self.session_store is not None:
+            self.session_store.close()
+        if self.stats_writer is not None:
+            self.stats_writer.shutdown()
+
+    def load_typing_stats(self) -> None:
+        """Load the lifetime typing statistics"""
+        if self.typing_stats_file is None:
+            return
+        try:
+            self.typing_stats = TypingStats.load(self.typing_stats_file)
+        except FileNotFoundError:
+            self.typing_stats = TypingStats()
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error loading typing statistics: {e}")
+            self.typing_stats = TypingStats()
+
+    def save_typing_stats(self) -> None:
+        """Save the lifetime typing statistics, in the background when async saving is on"""
+        if self.typing_stats_file is None:
+            return
+        if self.stats_writer is not None:
+            self.stats_writer.submit(self.typing_stats)
+            return
+        try:
+            write_file_atomic(self.typing_stats_file, self.typing_stats.to_bytes())
+        except OSError as e:
+            print(f"Error saving typing statistics: {e}")
+
+    def add_typing_stats(self, session_stats: TypingStats) -> None:
+        """Merge the statistics of a finished game into the lifetime statistics and save them"""
+        self.typing_stats.merge(session_stats)
+        self.save_typing_stats()
+
+    def get_all_sentences(self) -> Sequence[str]:
+        """Get all typing sentences from all categories (shared, do not modify)"""
+        return self.corpus.sentences
+
+    def get_sentences_for_service(self, service_name: str) -> Sequence[str]:
+        """Get the sentences featuring a specific service"""
+        return self.corpus.sentences_for_service(service_name)
 
-    def get_sentences_by_category(self, category: str) -> List[str]:
+    def get_sentences_by_category(self, category: str) -> Sequence[str]:
         """Get sentences for a specific category"""
-        if self.aws_data and "categories" in self.aws_data:
-            return self.aws_data["categories"].get(category, {}).get("sentences", [])
-        return []
+        return self.corpus.sentences_for_category(category)
 
     def get_service_description(self, service_name: str) -> str:
         """Get description for a specific service"""
-        if self.aws_data and "categories" in self.aws_data:
-            for category in self.aws_data["categories"].values():
-                descriptions = category.get("descriptions", {})
-                if service_name in descriptions:
-                    return descriptions[service_name]
-        return "説明が見つかりません"
+        description = self.corpus.description(service_name)
+        return "説明が見つかりません" if description is None else description
 
     def get_sentence_translation(self, sentence: str) -> str:
         """Get Japanese translation for a sentence"""
-        clean_sentence = sentence.replace("<", "").replace(">", "")
-        if self.aws_data and "categories" in self.aws_data:
-            for category in self.aws_data["categories"].values():
-                translations = category.get("translations", {})
-                if clean_sentence in translations:
-                    return translations[clean_sentence]
-        return "翻訳が見つかりません"
+        translation = self.corpus.translation(sentence)
+        return "翻訳が見つかりません" if translation is None else translation
 
     def get_high_score(self) -> int:
         """Get the current high score"""
@@ -110,9 +501,11 @@ class DataManager:
         elapsed_time: float,
         answered_services: List[str],
     ) -> None:
-        """Add a new game session - now only updates high score"""
-        # This method is kept for compatibility but only updates high score
-        # No session history is stored anymore
+        """Record a finished game in the session history, if one is configured"""
+        if self.session_store is not None:
+            self.session_store.add_session(
+                score, mistakes, total_chars, elapsed_time, answered_services
+            )
 
     def get_game_statistics(self) -> Dict[str, Any]:
         """Get game statistics - now returns only high score info"""
@@ -4,18 +4,111 @@ Font management module for AWS Service Typing Game
 
 import os
 import sys
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
 from ..core.config import FontConfig
 
 
+class TextSurfaceCache:
+    """Bounded LRU cache of rendered text surfaces"""
+
+    def __init__(
+        self,
+        max_bytes: int = FontConfig.TEXT_CACHE_MAX_BYTES,
+        max_entries: int = FontConfig.TEXT_CACHE_MAX_ENTRIES,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, Tuple[pygame.Surface, int]] = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple) -> Optional[pygame.Surface]:
+        """Get a cached surface and mark it as recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: tuple, surface: pygame.Surface) -> None:
+        """Store a surface, evicting least recently used entries to stay within budget"""
+        size = surface.get_pitch() * surface.get_height()
+        if size > self.max_bytes:
+            return  # Never cache a surface larger than the whole budget
+
+        old_entry = self._entries.pop(key, None)
+        if old_entry is not None:
+            self.current_bytes -= old_entry[1]
+
+        self._entries[key] = (surface, size)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes or len(self._entries) > self.max_entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached surfaces"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache usage counters"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class GlyphMetrics:
+    """Per-glyph advance widths for one font, measured once per character"""
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        self.line_height = font.get_height()
+        self._advances: Dict[str, int] = {}
+
+    def advance(self, char: str) -> int:
+        """Get the horizontal advance of a single character"""
+        width = self._advances.get(char)
+        if width is None:
+            width = self.font.size(char)[0]
+            self._advances[char] = width
+        return width
+
+    def prefix_widths(self, text: str) -> List[int]:
+        """Get cumulative widths where item i is the width of text[:i]"""
+        return [0, *accumulate(self.advance(char) for char in text)]
+
+    def text_width(self, text: str) -> int:
+        """Get the width of text as the sum of its glyph advances"""
+        return sum(self.advance(char) for char in text)
+
+
 class FontManager:
     """Manages font loading and initialization for different platforms"""
 
     def __init__(self):
         self.font_path = self._get_font_path()
         self.fonts = {}
+        self.text_cache = TextSurfaceCache()
+        self.glyph_metrics: Dict[str, GlyphMetrics] = {}
+        # Bumped whenever the fonts are rebuilt, for caches keyed on font identity
+        self.font_generation = 0
         self._initialize_fonts()
 
     def _get_font_path(self) -> str:
@@ -37,6 +130,11 @@ class FontManager:
 
     def _initialize_fonts(self) -> None:
         """Initialize all required fonts"""
+        # Surfaces and metrics from any previous fonts are no longer valid
+        self.text_cache.clear()
+        self.glyph_metrics = {}
+        self.font_generation += 1
+
         if self.font_path:
             self.fonts = {
                 "title": pygame.font.Font(self.font_path, FontConfig.TITLE_SIZE),
@@ -80,11 +178,31 @@ class FontManager:
     def render_text(
         self, text: str, font_type: str, color: tuple, antialias: bool = True
     ) -> pygame.Surface:
-        """Render text with specified font and color"""
-        font = self.get_font(font_type)
-        return font.render(text, antialias, color)
+        """Render text with specified font and color
+
+        Returned surfaces are shared through the text cache and must not be modified.
+        """
+        key = (text, font_type, tuple(color), antialias)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            font = self.get_font(font_type)
+            surface = font.render(text, antialias, color)
+            self.text_cache.put(key, surface)
+        return surface
+
+    def get_glyph_metrics(self, font_type: str) -> GlyphMetrics:
+        """Get the glyph advance table for a font type, building it on first use"""
+        metrics = self.glyph_metrics.get(font_type)
+        if metrics is None:
+            metrics = GlyphMetrics(self.get_font(font_type))
+            self.glyph_metrics[font_type] = metrics
+        return metrics
 
     def get_text_size(self, text: str, font_type: str) -> tuple:
         """Get the size of rendered text"""
         font = self.get_font(font_type)
         return font.size(text)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get text surface cache statistics"""
+        return self.text_cache.get_stats()
@@ -0,0 +1,73 @@
+"""
+Dirty rectangle tracking for AWS Service Typing Game
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+
+class DirtyRegionTracker:
+    """Tracks which screen regions changed between presented frames
+
+    Draw code still repaints the whole back buffer every frame. Each dynamic
+    element is registered with a name, its rect and the state it was drawn
+    from; only elements whose state or position changed since the previous
+    frame are reported, so regions outside them are identical on screen.
+    """
+
+    def __init__(self):
+        self._previous: Dict[str, Tuple[pygame.Rect, Any]] = {}
+        self._current: Dict[str, Tuple[pygame.Rect, Any]] = {}
+        self._previous_transient: List[pygame.Rect] = []
+        self._current_transient: List[pygame.Rect] = []
+        self._rects: List[pygame.Rect] = []
+        self._frame_key: Optional[tuple] = None
+        self.full_redraw = True
+
+    def begin_frame(self, state_name: str, size: Tuple[int, int]) -> None:
+        """Start a frame, forcing a full redraw on state transitions and resizes"""
+        frame_key = (state_name, size)
+        if frame_key != self._frame_key:
+            self._frame_key = frame_key
+            self.full_redraw = True
+        self._current = {}
+        self._current_transient = []
+        self._rects = []
+
+    def invalidate(self) -> None:
+        """Force the next presented frame to be a full redraw"""
+        self.full_redraw = True
+
+    def track(self, name: str, rect: pygame.Rect, state: Any) -> None:
+        """Register a dynamic element drawn this frame"""
+        rect = pygame.Rect(rect)
+        self._current[name] = (rect, state)
+        previous = self._previous.get(name)
+        if previous is None:
+            self._rects.append(rect)
+        elif previous[0] != rect:
+            self._rects.append(rect)
+            self._rects.append(previous[0])
+        elif previous[1] != state:
+            self._rects.append(rect)
+
+    def add_transient(self, rects: Sequence[pygame.Rect]) -> None:
+        """Register short-lived drawings such as particles that change every frame"""
+        self._current_transient.extend(rects)
+
+    def end_frame(self) -> Optional[List[pygame.Rect]]:
+        """Finish a frame and return the rects to update, or None for a full flip"""
+        # Elements that disappeared must be repainted where they used to be
+        for name, (rect, _) in self._previous.items():
+            if name not in self._current:
+                self._rects.append(rect)
+
+        rects = self._rects + self._current_transient + self._previous_transient
+        self._previous = self._current
+        self._previous_transient = self._current_transient
+
+        if self.full_redraw:
+            self.full_redraw = False
+            return None
+        return rects
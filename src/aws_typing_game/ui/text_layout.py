@@ -0,0 +1,233 @@
+"""
+Text layout helpers for AWS Service Typing Game
+
+Line breaking is done purely from glyph advance tables, so no surfaces are
+rendered while measuring text.
+"""
+
+import unicodedata
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from ..core.config import UIConfig
+from ..managers.font_manager import GlyphMetrics
+
+# Sentence font sizes, from preferred to smallest
+SENTENCE_FONT_SIZES = ("game", "game_small", "game_tiny")
+LINE_SPACING = 4
+HIGHLIGHT_PADDING = 4
+HIGHLIGHT_VERTICAL_PADDING = 2
+
+# Characters that must not begin or end a line in Japanese text (kinsoku)
+NO_LINE_START = set(
+    "、。，．・：；？！ー）」』】〕〉》”’ぁぃぅぇぉっゃゅょァィゥェォッャュョ.,:;!?)]}"
+)
+NO_LINE_END = set("（「『【〔〈《“‘([{")
+
+
+def is_cjk(char: str) -> bool:
+    """Check if a character is a wide CJK character that allows breaks around it"""
+    return unicodedata.east_asian_width(char) in ("W", "F")
+
+
+def _break_opportunities(text: str) -> List[int]:
+    """Get the sorted indices where a new line may start"""
+    breaks = []
+    for i in range(1, len(text)):
+        prev_char = text[i - 1]
+        char = text[i]
+        space_break = char == " " or prev_char == " "
+        cjk_break = (is_cjk(prev_char) or is_cjk(char)) and (
+            char not in NO_LINE_START and prev_char not in NO_LINE_END
+        )
+        if space_break or cjk_break:
+            breaks.append(i)
+    return breaks
+
+
+def break_lines(text: str, metrics: GlyphMetrics, max_width: int) -> List[Tuple[int, int]]:
+    """Break text into lines and return (start, end) index pairs into text
+
+    Spaces at line boundaries are dropped. Words that are wider than max_width on
+    their own are broken between characters.
+    """
+    length = len(text)
+    prefix = metrics.prefix_widths(text)
+    breaks = _break_opportunities(text)
+    lines = []
+
+    start = 0
+    while start < length:
+        while start < length and text[start] == " ":
+            start += 1
+        if start >= length:
+            break
+
+        # Furthest index whose prefix width still fits on this line
+        limit = bisect_right(prefix, prefix[start] + max_width, start + 1) - 1
+        if limit >= length:
+            end = length
+        else:
+            candidate = bisect_right(breaks, limit) - 1
+            if candidate >= 0 and breaks[candidate] > start:
+                end = breaks[candidate]
+            else:
+                end = max(limit, start + 1)  # No break opportunity: force a break
+
+        line_end = end
+        while line_end > start and text[line_end - 1] == " ":
+            line_end -= 1
+        lines.append((start, line_end))
+        start = end
+
+    return lines
+
+
+def wrap_text(text: str, metrics: GlyphMetrics, max_width: int) -> List[str]:
+    """Wrap plain text to fit within max_width"""
+    return [text[start:end] for start, end in break_lines(text, metrics, max_width)]
+
+
+class LayoutLine:
+    """One line of a sentence layout, split around the highlighted service"""
+
+    def __init__(
+        self,
+        before: str,
+        service: str,
+        after: str,
+        y: int,
+        service_x: int,
+        after_x: int,
+        highlight_rect: Optional[pygame.Rect],
+    ):
+        self.before = before
+        self.service = service
+        self.after = after
+        self.y = y
+        self.service_x = service_x
+        self.after_x = after_x
+        self.highlight_rect = highlight_rect
+
+
+class SentenceLayout:
+    """Precomputed layout of a typing sentence for a given width and font set
+
+    All positions are relative to the top-left corner of the text area.
+    """
+
+    def __init__(self, plain_text: str, font_size: str, line_height: int, lines: List[LayoutLine]):
+        self.plain_text = plain_text
+        self.font_size = font_size
+        self.line_height = line_height
+        self.lines = lines
+        self.text_height = len(lines) * line_height
+        self.panel_height = 0
+
+        highlight_rects = [line.highlight_rect for line in lines if line.highlight_rect]
+        self.highlight_rect = (
+            highlight_rects[0].unionall(highlight_rects[1:]) if highlight_rects else None
+        )
+
+
+def _split_sentence(sentence: str, service_name: str) -> Tuple[str, Optional[Tuple[int, int]]]:
+    """Strip <service> brackets and return the plain text with the service span"""
+    start = sentence.find("<")
+    end = sentence.find(">", start + 1) if start != -1 else -1
+    if start == -1 or end == -1 or sentence[start + 1 : end] != service_name:
+        return sentence.replace("<", "").replace(">", ""), None
+
+    before = sentence[:start].replace(">", "")
+    after = sentence[end + 1 :].replace("<", "").replace(">", "")
+    return before + service_name + after, (len(before), len(before) + len(service_name))
+
+
+def build_sentence_layout(
+    sentence: str,
+    service_name: str,
+    max_width: int,
+    get_metrics: Callable[[str], GlyphMetrics],
+) -> SentenceLayout:
+    """Choose a font size, break lines and place the service highlight for a sentence"""
+    plain_text, span = _split_sentence(sentence, service_name)
+
+    font_size = SENTENCE_FONT_SIZES[-1]
+    for candidate in SENTENCE_FONT_SIZES:
+        if get_metrics(candidate).text_width(plain_text) <= max_width:
+            font_size = candidate
+            break
+
+    metrics = get_metrics(font_size)
+    font = metrics.font
+    line_height = metrics.line_height + LINE_SPACING
+
+    lines = []
+    for index, (start, end) in enumerate(break_lines(plain_text, metrics, max_width)):
+        y = index * line_height
+        if span is None or span[1] <= start or span[0] >= end:
+            lines.append(LayoutLine(plain_text[start:end], "", "", y, 0, 0, None))
+            continue
+
+        service_start = max(span[0], start)
+        service_end = min(span[1], end)
+        before = plain_text[start:service_start]
+        service = plain_text[service_start:service_end]
+        service_x = font.size(before)[0] if before else 0
+        service_width = font.size(service)[0]
+        highlight_rect = pygame.Rect(
+            service_x - HIGHLIGHT_PADDING,
+            y - HIGHLIGHT_VERTICAL_PADDING,
+            service_width + HIGHLIGHT_PADDING * 2,
+            metrics.line_height + HIGHLIGHT_VERTICAL_PADDING * 2,
+        )
+        lines.append(
+            LayoutLine(
+                before,
+                service,
+                plain_text[service_end:end],
+                y,
+                service_x,
+                service_x + service_width,
+                highlight_rect,
+            )
+        )
+
+    return SentenceLayout(plain_text, font_size, line_height, lines)
+
+
+class SentenceLayoutCache:
+    """LRU cache of sentence layouts shared across the whole corpus"""
+
+    def __init__(self, max_entries: int = UIConfig.SENTENCE_LAYOUT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._layouts: OrderedDict[tuple, SentenceLayout] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[SentenceLayout]:
+        """Get a cached layout and mark it as recently used"""
+        layout = self._layouts.get(key)
+        if layout is None:
+            self.misses += 1
+            return None
+        self._layouts.move_to_end(key)
+        self.hits += 1
+        return layout
+
+    def put(self, key: tuple, layout: SentenceLayout) -> None:
+        """Store a layout, evicting the least recently used one when full"""
+        self._layouts[key] = layout
+        self._layouts.move_to_end(key)
+        while len(self._layouts) > self.max_entries:
+            self._layouts.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached layouts"""
+        self._layouts.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache usage counters"""
+        return {"entries": len(self._layouts), "hits": self.hits, "misses": self.misses}
@@ -2,12 +2,20 @@
 UI management module for AWS Service Typing Game
 """
 
-from typing import List, Tuple
+import contextlib
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pygame
 
 from ..core.config import Colors, EvaluationConfig, GameConfig, UIConfig
 from ..managers.font_manager import FontManager
+from .dirty_regions import DirtyRegionTracker
+from .text_layout import (
+    SentenceLayout,
+    SentenceLayoutCache,
+    build_sentence_layout,
+    wrap_text,
+)
 
 
 class UIManager:
@@ -19,6 +27,9 @@ class UIManager:
         self.responsive_manager = None
         self.accessibility_manager = None
         self.animation_manager = None
+        self.sentence_layouts = SentenceLayoutCache()
+        self.gradient_cache: Dict[tuple, pygame.Surface] = {}
+        self.dirty_regions: Optional[DirtyRegionTracker] = None
 
     def set_responsive_manager(self, responsive_manager):
         """Set the responsive design manager"""
@@ -32,6 +43,36 @@ class UIManager:
         """Set the animation manager"""
         self.animation_manager = animation_manager
 
+    def enable_dirty_rects(self) -> None:
+        """Enable dirty rectangle tracking for partial display updates"""
+        self.dirty_regions = DirtyRegionTracker()
+
+    def begin_frame(self, state_name: str) -> None:
+        """Start tracking a new frame for the given game state"""
+        if self.dirty_regions is not None:
+            self.dirty_regions.begin_frame(state_name, self.screen.get_size())
+
+    def invalidate_frame(self) -> None:
+        """Force the next frame to be presented with a full flip"""
+        if self.dirty_regions is not None:
+            self.dirty_regions.invalidate()
+
+    def add_transient_regions(self, rects: Sequence[pygame.Rect]) -> None:
+        """Register regions drawn outside the UI manager, such as particle effects"""
+        if self.dirty_regions is not None:
+            self.dirty_regions.add_transient(rects)
+
+    def end_frame(self) -> Optional[List[pygame.Rect]]:
+        """Get the rects changed this frame, or None when the whole screen must be flipped"""
+        if self.dirty_regions is None:
+            return None
+        return self.dirty_regions.end_frame()
+
+    def _track_region(self, name: str, rect: pygame.Rect, *state) -> None:
+        """Register a dynamic element so it is updated only when its state changes"""
+        if self.dirty_regions is not None:
+            self.dirty_regions.track(name, rect, state)
+
     def _draw_modern_card(
         self,
         x: int,
@@ -139,330 +180,136 @@ class UIManager:
         if end_color is None:
             end_color = Colors.SURFACE
 
-        width = self.screen.get_width()
-        height = self.screen.get_height()
+        gradient = self._get_gradient_surface(
+            self.screen.get_size(), tuple(start_color), tuple(end_color)
+        )
+        self.screen.blit(gradient, (0, 0))
 
-        for y in range(height):
-            ratio = y / height
-            # Linear interpolation between colors
-            r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-            g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-            b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-            color = (r, g, b)
-            pygame.draw.line(self.screen, color, (0, y), (width, y))
+    def _get_gradient_surface(
+        self,
+        size: Tuple[int, int],
+        start_color: Tuple[int, int, int],
+        end_color: Tuple[int, int, int],
+    ) -> pygame.Surface:
+        """Get the cached gradient surface, regenerating it on resize or theme change"""
+        key = (size, start_color, end_color)
+        gradient = self.gradient_cache.get(key)
+        if gradient is not None:
+            return gradient
+
+        # Gradients for an old screen size will never be drawn again
+        self.gradient_cache = {
+            cached_key: surface
+            for cached_key, surface in self.gradient_cache.items()
+            if cached_key[0] == size
+        }
 
-    def _wrap_text(self, text: str, font_size: str, max_width: int) -> List[str]:
-        """Wrap text to fit within the specified width"""
-        words = text.split(" ")
-        lines = []
-        current_line = ""
-
-        for word in words:
-            # Test if adding this word would exceed max width
-            test_line = current_line + (" " if current_line else "") + word
-            test_surface = self.font_manager.render_text(test_line, font_size, Colors.ON_SURFACE)
-
-            if test_surface.get_width() <= max_width:
-                current_line = test_line
-            # If current line is not empty, save it and start new line
-            elif current_line:
-                lines.append(current_line)
-                current_line = word
-            else:
-                # Single word is too long, force break
-                lines.append(word)
-                current_line = ""
+        width, height = size
+        try:
+            import numpy as np
+
+            # Linear interpolation between colors, one row per screen line
+            ratio = np.arange(height, dtype=np.float64)[:, None] / height
+            start = np.array(start_color, dtype=np.float64)
+            end = np.array(end_color, dtype=np.float64)
+            rows = (start + (end - start) * ratio).astype(np.uint8)
+            pixels = np.broadcast_to(rows[None, :, :], (width, height, 3))
+            gradient = pygame.surfarray.make_surface(np.ascontiguousarray(pixels))
+        except ImportError:
+            gradient = pygame.Surface(size)
+            for y in range(height):
+                ratio = y / height
+                color = tuple(
+                    int(start_color[i] + (end_color[i] - start_color[i]) * ratio) for i in range(3)
+                )
+                pygame.draw.line(gradient, color, (0, y), (width, y))
 
-        # Add the last line if it exists
-        if current_line:
-            lines.append(current_line)
+        # Keep the unconverted surface if the display format is unavailable
+        with contextlib.suppress(pygame.error):
+            gradient = gradient.convert(self.screen)
 
-        return lines if lines else [text]
+        self.gradient_cache[key] = gradient
+        return gradient
 
-    def _get_adaptive_font_size(self, text: str, max_width: int) -> str:
-        """Determine the best font size for the given text and width"""
-        clean_text = text.replace("<", "").replace(">", "")
+    def _wrap_text(self, text: str, font_size: str, max_width: int) -> List[str]:
+        """Wrap text to fit within the specified width"""
+        metrics = self.font_manager.get_glyph_metrics(font_size)
+        lines = wrap_text(text, metrics, max_width)
+        return lines if lines else [text]
 
-        # Try different font sizes
-        font_sizes = ["game", "game_small", "game_tiny"]
+    def _get_sentence_layout(
+        self, sentence: str, service_name: str, max_width: int
+    ) -> SentenceLayout:
+        """Get the cached layout for a sentence, building it on first use"""
+        key = (sentence, service_name, max_width, self.font_manager.font_generation)
+        layout = self.sentence_layouts.get(key)
+        if layout is None:
+            layout = build_sentence_layout(
+                sentence, service_name, max_width, self.font_manager.get_glyph_metrics
+            )
+            layout.panel_height = self._calculate_game_panel_height(layout.text_height)
+            self.sentence_layouts.put(key, layout)
+        return layout
 
-        for font_size in font_sizes:
-            test_surface = self.font_manager.render_text(clean_text, font_size, Colors.ON_SURFACE)
-            if test_surface.get_width() <= max_width:
-                return font_size
+    def _calculate_game_panel_height(self, text_area_height: int) -> int:
+        """Calculate the typing panel height needed for a sentence of the given height"""
+        header_card_height = 50
+        content_spacing = UIConfig.SPACE_LG  # After header
+        sentence_label_height = 20
+        text_spacing = 30  # After label
+        input_spacing = UIConfig.SPACE_MD  # After text
+        input_height = UIConfig.INPUT_FIELD_HEIGHT
+        stats_spacing = UIConfig.SPACE_LG  # After input
+        stats_height = 80  # Progress + metrics
+        bottom_padding = UIConfig.CARD_PADDING
 
-        # If even tiny doesn't fit, we'll need wrapping
-        return "game_tiny"
+        return (
+            header_card_height
+            + content_spacing
+            + sentence_label_height
+            + text_spacing
+            + text_area_height
+            + input_spacing
+            + input_height
+            + stats_spacing
+            + stats_height
+            + bottom_padding
+        )
 
     def _draw_enhanced_word(
         self, current_word: str, service_name: str, x: int, y: int, max_width: int
     ) -> int:
         """Draw the current word with enhanced service name highlighting and text wrapping
         Returns the height used by the text"""
+        layout = self._get_sentence_layout(current_word, service_name, max_width)
+        font_size = layout.font_size
 
-        # Clean the word for width calculation
-        clean_word = current_word.replace("<", "").replace(">", "")
-
-        # Get the optimal font size
-        font_size = self._get_adaptive_font_size(clean_word, max_width)
-
-        # Check if text needs wrapping even with adaptive font size
-        test_surface = self.font_manager.render_text(clean_word, font_size, Colors.ON_SURFACE)
-        line_height = test_surface.get_height() + 4  # Add some line spacing
-
-        if test_surface.get_width() <= max_width:
-            # Text fits on one line, draw normally
-            self._draw_single_line_word(current_word, service_name, x, y, font_size)
-            return line_height
-        else:
-            # Text needs wrapping
-            return self._draw_wrapped_word(
-                current_word, service_name, x, y, max_width, line_height, font_size
-            )
-
-    def _draw_single_line_word(
-        self, current_word: str, service_name: str, x: int, y: int, font_size: str = "game"
-    ) -> None:
-        """Draw a single line word with service highlighting"""
-        if "<" in current_word and ">" in current_word:
-            # Split the sentence into parts
-            parts = current_word.split("<")
-            if len(parts) > 1:
-                before_service = parts[0]
-                service_and_after = parts[1].split(">")
-                if len(service_and_after) > 1:
-                    service = service_and_after[0]
-                    after_service = service_and_after[1]
-
-                    # Ensure the extracted service matches the expected service name
-                    if service != service_name:
-                        # Fallback: just draw the text without highlighting
-                        clean_text = current_word.replace("<", "").replace(">", "")
-                        text_surface = self.font_manager.render_text(
-                            clean_text, font_size, Colors.ON_SURFACE
-                        )
-                        self.screen.blit(text_surface, (x, y))
-                        return
-
-                    current_x = x
-
-                    # Draw text before service name
-                    if before_service:
-                        before_surface = self.font_manager.render_text(
-                            before_service, font_size, Colors.ON_SURFACE
-                        )
-                        self.screen.blit(before_surface, (current_x, y))
-                        current_x += before_surface.get_width()
-
-                    # Draw service name with modern highlight
-                    service_surface = self.font_manager.render_text(
-                        service, font_size, Colors.ON_SURFACE
-                    )
-                    service_width = service_surface.get_width()
-                    service_height = service_surface.get_height()
-
-                    # Modern service highlight background - precisely aligned
-                    highlight_padding = 4
-                    highlight_vertical_padding = 2
-                    highlight_rect = pygame.Rect(
-                        current_x - highlight_padding,
-                        y - highlight_vertical_padding,
-                        service_width + highlight_padding * 2,
-                        service_height + highlight_vertical_padding * 2,
-                    )
-                    pygame.draw.rect(self.screen, Colors.PRIMARY, highlight_rect, 0, 6)
-
-                    # Draw service text at the exact same position
-                    self.screen.blit(service_surface, (current_x, y))
-                    current_x += service_width
-
-                    # Draw text after service name
-                    if after_service:
-                        after_surface = self.font_manager.render_text(
-                            after_service, font_size, Colors.ON_SURFACE
-                        )
-                        self.screen.blit(after_surface, (current_x, y))
-        else:
-            # No service highlighting needed
-            text_surface = self.font_manager.render_text(current_word, font_size, Colors.ON_SURFACE)
-            self.screen.blit(text_surface, (x, y))
-
-    def _draw_wrapped_word(
-        self,
-        current_word: str,
-        service_name: str,
-        x: int,
-        y: int,
-        max_width: int,
-        line_height: int,
-        font_size: str = "game",
-    ) -> int:
-        """Draw a wrapped word with service highlighting across multiple lines"""
-        # For long text, we need to handle service name highlighting carefully
-        if "<" in current_word and ">" in current_word:
-            # Extract service parts
-            parts = current_word.split("<")
-            if len(parts) > 1:
-                before_service = parts[0]
-                service_and_after = parts[1].split(">")
-                if len(service_and_after) > 1:
-                    service = service_and_after[0]
-                    after_service = service_and_after[1]
-
-                    # Reconstruct text with markers for wrapping
-                    full_text = (
-                        before_service
-                        + "【SERVICE_START】"
-                        + service
-                        + "【SERVICE_END】"
-                        + after_service
-                    )
-
-                    # Wrap the text
-                    wrapped_lines = self._wrap_text_with_markers(full_text, max_width, font_size)
-
-                    # Draw each line with proper highlighting
-                    current_y = y
-                    for line in wrapped_lines:
-                        self._draw_line_with_service_highlight(
-                            line, x, current_y, service, font_size
-                        )
-                        current_y += line_height
-
-                    return len(wrapped_lines) * line_height
-
-        # Fallback: simple text wrapping without service highlighting
-        clean_text = current_word.replace("<", "").replace(">", "")
-        wrapped_lines = self._wrap_text(clean_text, font_size, max_width)
-
-        current_y = y
-        for line in wrapped_lines:
-            text_surface = self.font_manager.render_text(line, font_size, Colors.ON_SURFACE)
-            self.screen.blit(text_surface, (x, current_y))
-            current_y += line_height
-
-        return len(wrapped_lines) * line_height
-
-    def _wrap_text_with_markers(
-        self, text: str, max_width: int, font_size: str = "game"
-    ) -> List[str]:
-        """Wrap text while preserving service markers"""
-        # Split by spaces but keep service markers intact
-        parts = []
-        current_part = ""
-        i = 0
-
-        while i < len(text):
-            if text[i : i + 15] == "【SERVICE_START】":
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-                parts.append("【SERVICE_START】")
-                i += 15
-            elif text[i : i + 13] == "【SERVICE_END】":
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-                parts.append("【SERVICE_END】")
-                i += 13
-            elif text[i] == " ":
-                if current_part:
-                    parts.append(current_part)
-                    current_part = ""
-                parts.append(" ")
-                i += 1
-            else:
-                current_part += text[i]
-                i += 1
-
-        if current_part:
-            parts.append(current_part)
-
-        # Now wrap the parts into lines
-        lines = []
-        current_line_parts = []
-        current_line_width = 0
-
-        for part in parts:
-            if part in ["【SERVICE_START】", "【SERVICE_END】"]:
-                current_line_parts.append(part)
-                continue
-
-            part_surface = self.font_manager.render_text(
-                part if part != " " else "A", font_size, Colors.ON_SURFACE
-            )
-            part_width = part_surface.get_width() if part != " " else part_surface.get_width() // 2
-
-            if current_line_width + part_width <= max_width:
-                current_line_parts.append(part)
-                current_line_width += part_width
-            else:
-                # Start new line
-                if current_line_parts:
-                    lines.append("".join(current_line_parts))
-                current_line_parts = [part]
-                current_line_width = part_width
-
-        if current_line_parts:
-            lines.append("".join(current_line_parts))
+        for line in layout.lines:
+            line_y = y + line.y
 
-        return lines
+            # Draw text before service name
+            if line.before:
+                before_surface = self.font_manager.render_text(
+                    line.before, font_size, Colors.ON_SURFACE
+                )
+                self.screen.blit(before_surface, (x, line_y))
 
-    def _draw_line_with_service_highlight(
-        self, line: str, x: int, y: int, service_name: str, font_size: str = "game"
-    ) -> None:
-        """Draw a line with service name highlighting if present"""
-        if "【SERVICE_START】" in line and "【SERVICE_END】" in line:
-            # This line contains the service name
-            parts = line.split("【SERVICE_START】")
-            before = parts[0]
-            service_and_after = parts[1].split("【SERVICE_END】")
-            service = service_and_after[0]
-            after = service_and_after[1]
-
-            current_x = x
-
-            # Draw before text
-            if before:
-                before_surface = self.font_manager.render_text(before, font_size, Colors.ON_SURFACE)
-                self.screen.blit(before_surface, (current_x, y))
-                current_x += before_surface.get_width()
-
-            # Draw service with highlight
-            if service:
+            # Draw service name with modern highlight
+            if line.service:
+                pygame.draw.rect(self.screen, Colors.PRIMARY, line.highlight_rect.move(x, y), 0, 6)
                 service_surface = self.font_manager.render_text(
-                    service, font_size, Colors.ON_SURFACE
+                    line.service, font_size, Colors.ON_SURFACE
                 )
-                service_width = service_surface.get_width()
-                service_height = service_surface.get_height()
-
-                # Precisely aligned highlight background
-                highlight_padding = 4
-                highlight_vertical_padding = 2
-                highlight_rect = pygame.Rect(
-                    current_x - highlight_padding,
-                    y - highlight_vertical_padding,
-                    service_width + highlight_padding * 2,
-                    service_height + highlight_vertical_padding * 2,
-                )
-                pygame.draw.rect(self.screen, Colors.PRIMARY, highlight_rect, 0, 6)
-
-                # Draw service text at the exact same position
-                self.screen.blit(service_surface, (current_x, y))
-                current_x += service_width
+                self.screen.blit(service_surface, (x + line.service_x, line_y))
 
-            # Draw after text
-            if after:
-                after_surface = self.font_manager.render_text(after, font_size, Colors.ON_SURFACE)
-                self.screen.blit(after_surface, (current_x, y))
-        else:
-            # Regular line without service highlighting
-            clean_line = line.replace("【SERVICE_START】", "").replace("【SERVICE_END】", "")
-            if clean_line:
-                text_surface = self.font_manager.render_text(
-                    clean_line, font_size, Colors.ON_SURFACE
+            # Draw text after service name
+            if line.after:
+                after_surface = self.font_manager.render_text(
+                    line.after, font_size, Colors.ON_SURFACE
                 )
-                self.screen.blit(text_surface, (x, y))
+                self.screen.blit(after_surface, (x + line.after_x, line_y))
+
+        return layout.text_height
 
     def _draw_metric_card(
         self,
@@ -522,6 +369,7 @@ class UIManager:
         """Draw the modern main menu screen"""
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
+        self._track_region("menu", self.screen.get_rect(), high_score, sfx_enabled, music_enabled)
 
         # Modern gradient background
         self._draw_gradient_background()
@@ -753,6 +601,13 @@ class UIManager:
             else Colors.ERROR
         )
         self._draw_progress_bar(progress_x, progress_y, progress_width, time_ratio, bar_color)
+        self._track_region(
+            "time_card",
+            pygame.Rect(time_x, time_y, time_card_width, time_card_height),
+            int(remaining_time),
+            int(progress_width * min(time_ratio, 1.0)),
+            bar_color,
+        )
 
         # Score card
         score_card_width = 120
@@ -771,6 +626,9 @@ class UIManager:
 
         score_value = self.font_manager.render_text(str(score), "score", Colors.PRIMARY)
         self.screen.blit(score_value, (score_x + UIConfig.SPACE_SM, time_y + 24))
+        self._track_region(
+            "score_card", pygame.Rect(score_x, time_y, score_card_width, time_card_height), score
+        )
 
         # Mistakes indicator
         if mistakes > 0:
@@ -792,50 +650,21 @@ class UIManager:
                 str(mistakes), "score", Colors.ON_SURFACE
             )
             self.screen.blit(mistakes_value, (mistakes_x + UIConfig.SPACE_SM, time_y + 24))
+            self._track_region(
+                "mistakes_card",
+                pygame.Rect(mistakes_x, time_y, mistakes_card_width, time_card_height),
+                mistakes,
+            )
 
         # Main typing panel with dynamic sizing
         panel_margin = min(UIConfig.PANEL_MARGIN, screen_width // 3)
         panel_width = panel_margin * 2
 
-        # Calculate required height based on content
-        # Quick calculation for text height to determine panel size
-        clean_word = current_word.replace("<", "").replace(">", "")
-        test_surface = self.font_manager.render_text(clean_word, "game", Colors.ON_SURFACE)
+        # Panel height comes from the cached sentence layout
         text_display_width = panel_width - UIConfig.CARD_PADDING * 2
-
-        # Estimate number of lines needed
-        if test_surface.get_width() > text_display_width:
-            estimated_lines = (test_surface.get_width() // text_display_width) + 1
-        else:
-            estimated_lines = 1
-
-        # Calculate minimum panel height needed
-        line_height = test_surface.get_height() + 4
-        text_area_height = estimated_lines * line_height
-
-        # Total content height calculation
-        header_card_height = 50
-        content_spacing = UIConfig.SPACE_LG  # After header
-        sentence_label_height = 20
-        text_spacing = 30  # After label
-        input_spacing = UIConfig.SPACE_MD  # After text
-        input_height = UIConfig.INPUT_FIELD_HEIGHT
-        stats_spacing = UIConfig.SPACE_LG  # After input
-        stats_height = 80  # Progress + metrics
-        bottom_padding = UIConfig.CARD_PADDING
-
-        required_height = (
-            header_card_height
-            + content_spacing
-            + sentence_label_height
-            + text_spacing
-            + text_area_height
-            + input_spacing
-            + input_height
-            + stats_spacing
-            + stats_height
-            + bottom_padding
-        )
+        layout = self._get_sentence_layout(current_word, service_name, text_display_width)
+        clean_current_word = layout.plain_text
+        required_height = layout.panel_height
 
         # Set panel height with minimum and maximum bounds
         min_panel_height = 350
@@ -849,6 +678,13 @@ class UIManager:
         main_card = self._draw_modern_card(
             panel_x, panel_y, panel_width, panel_height, Colors.SURFACE, elevation=True
         )
+        self._track_region(
+            "typing_panel",
+            main_card.inflate(2, 2).move(1, 1),  # Include the card shadow
+            current_word,
+            typed_text,
+            score,
+        )
 
         # Card header
         header_height_card = 50
@@ -880,7 +716,6 @@ class UIManager:
 
         # Enhanced word display with better highlighting and dynamic sizing
         word_y = content_y + 30
-        text_display_width = panel_width - UIConfig.CARD_PADDING * 2
         text_height_used = self._draw_enhanced_word(
             current_word, service_name, panel_x + UIConfig.CARD_PADDING, word_y, text_display_width
         )
@@ -896,7 +731,6 @@ class UIManager:
         input_bg_color = Colors.SURFACE_VARIANT
         if len(typed_text) > 0:
             # Check if typing is correct
-            clean_current_word = current_word.replace("<", "").replace(">", "")
             is_correct = True
             for i, char in enumerate(typed_text):
                 if i >= len(clean_current_word) or char != clean_current_word[i]:
@@ -970,7 +804,6 @@ class UIManager:
 
         # Real-time feedback indicator
         if len(typed_text) > 0:
-            clean_current_word = current_word.replace("<", "").replace(">", "")
             feedback_color = Colors.SUCCESS
             for i, char in enumerate(typed_text):
                 if i >= len(clean_current_word) or char != clean_current_word[i]:
@@ -992,7 +825,6 @@ class UIManager:
         stats_y = input_y + UIConfig.INPUT_FIELD_HEIGHT + UIConfig.SPACE_LG
 
         # Character progress
-        clean_current_word = current_word.replace("<", "").replace(">", "")
         char_progress = len(typed_text) / max(len(clean_current_word), 1)
 
         progress_label = self.font_manager.render_text(
@@ -1047,7 +879,8 @@ class UIManager:
             "Enter: 確定  |  ESC: メニューに戻る", "small", Colors.ON_SURFACE_VARIANT
         )
         help_x = (screen_width - help_text.get_width()) // 2
-        self.screen.blit(help_text, (help_x, help_y))
+        help_rect = self.screen.blit(help_text, (help_x, help_y))
+        self._track_region("help_text", help_rect, help_y)
 
         # Modern footer
         footer_height = 30
@@ -1088,6 +921,9 @@ class UIManager:
         cpm = 0 if elapsed_time == 0 else int(total_chars / (elapsed_time / 60))
         evaluation, eval_color = self._get_evaluation(score)
         accuracy = self._calculate_accuracy(correct_chars, mistakes)
+        self._track_region(
+            "results", self.screen.get_rect(), score, high_score, total_chars, cpm, accuracy
+        )
 
         # Main results container with proper bounds checking
         container_width = min(800, screen_width - UIConfig.SPACE_XL * 2)
@@ -1258,6 +1094,15 @@ class UIManager:
         """Draw the modern service information screen"""
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
+        self._track_region(
+            "service_info",
+            self.screen.get_rect(),
+            tuple(answered_services),
+            current_service_index,
+            service_description,
+            example_sentence,
+            translation,
+        )
 
         # Modern gradient background
         self._draw_gradient_background()
@@ -1616,22 +1461,7 @@ class UIManager:
         self, text: str, x: int, y: int, max_width: int, font_type: str, color: tuple
     ) -> int:
         """Draw multiline text and return the final y position"""
-        words = text.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + word + " "
-            test_width = self.font_manager.get_text_size(test_line, font_type)[0]
-            if test_width < max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word + " "
-
-        if current_line:
-            lines.append(current_line)
+        lines = wrap_text(text, self.font_manager.get_glyph_metrics(font_type), max_width)
 
         current_y = y
         for line in lines:
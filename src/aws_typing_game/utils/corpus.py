@@ -0,0 +1,780 @@
+"""
+Sentence corpus indexes and the compiled binary corpus format
+
+A compiled corpus is a single little-endian file laid out as:
+
+    header          magic, version, table lengths and section offsets
+    string offsets  uint32 offsets into the string data (one extra entry)
+    sentences       clean text, service, service span and translation
+    service hashes  sorted uint64 hashes of the service names
+    services        name, description and a range of service sentences
+    service sentences
+                    sentence indices grouped by service
+    categories      name and a contiguous range of sentences
+    key hashes      sorted uint64 hashes of the clean translated sentences
+    keys            clean sentence and translation
+    string data     UTF-8 strings
+
+Sentences are stored without markers and rebuilt from their service span.
+Strings are referenced by index, and every table is read straight from a
+memory map, so opening a corpus only parses the header.
+
+A JSON Lines corpus holds one sentence record per line:
+
+    {"category": "computing", "sentence": "My <EC2> ...", "service": "EC2",
+     "translation": "...", "description": "..."}
+
+Only "sentence" is required; the service defaults to the marked name.
+"""
+
+import argparse
+import array
+import bisect
+import hashlib
+import json
+import mmap
+import re
+import struct
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+SERVICE_PATTERN = re.compile(r"<([^>]+)>")
+
+CORPUS_SUFFIX = ".corpus"
+JSONL_SUFFIX = ".jsonl"
+JSON_SUFFIX = ".json"
+SOURCE_SUFFIXES = (JSON_SUFFIX, JSONL_SUFFIX, CORPUS_SUFFIX)
+CORPUS_MAGIC = b"AWSC"
+CORPUS_VERSION = 1
+NO_STRING = 0xFFFFFFFF
+
+# magic, version, reserved, 6 table lengths, 9 section offsets and the file size
+HEADER = struct.Struct("<4sHH6I10Q")
+
+SENTENCE_DTYPE = np.dtype(
+    [
+        ("text", "<u4"),  # Only set when the sentence cannot be rebuilt from its span
+        ("clean", "<u4"),
+        ("service", "<u4"),
+        ("span_start", "<u4"),
+        ("span_end", "<u4"),
+        ("translation", "<u4"),
+    ]
+)
+SERVICE_DTYPE = np.dtype(
+    [("name", "<u4"), ("description", "<u4"), ("first", "<u4"), ("count", "<u4")]
+)
+CATEGORY_DTYPE = np.dtype([("name", "<u4"), ("first", "<u4"), ("count", "<u4")])
+KEY_DTYPE = np.dtype([("key", "<u4"), ("translation", "<u4")])
+
+
+def clean_sentence(sentence: str) -> str:
+    """Remove the service markers from a sentence"""
+    return sentence.replace("<", "").replace(">", "")
+
+
+def mark_service(clean_text: str, span: Tuple[int, int]) -> str:
+    """Put the service markers back around a span of a clean sentence"""
+    start, end = span
+    return f"{clean_text[:start]}<{clean_text[start:end]}>{clean_text[end:]}"
+
+
+def string_hash(text: str) -> int:
+    """Get the stable 64-bit hash used by the compiled lookup tables"""
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _filter_sentences(
+    corpus: Union["CorpusIndex", "StreamingCorpus"],
+    service_names: Set[str],
+    category_name: Optional[str],
+) -> List[str]:
+    """Filter the sentence lists of an in-memory corpus by service"""
+    excluded = {
+        sentence
+        for service_name in service_names
+        for sentence in corpus.sentences_for_service(service_name)
+    }
+    sentences = (
+        corpus.sentences if category_name is None else corpus.sentences_for_category(category_name)
+    )
+    return [sentence for sentence in sentences if sentence not in excluded]
+
+
+class CorpusIndex:
+    """In-memory lookup indexes built from parsed corpus data"""
+
+    def __init__(self, aws_data: Optional[Dict[str, Any]]):
+        self.sentences: List[str] = []
+        self.sentences_by_service: Dict[str, List[str]] = {}
+        self.sentences_by_category: Dict[str, List[str]] = {}
+        self.translations: Dict[str, str] = {}
+        self.descriptions: Dict[str, str] = {}
+
+        categories = aws_data.get("categories", {}) if aws_data else {}
+        for category_name, category in categories.items():
+            # Earlier categories win when a key appears more than once
+            for clean_text, translation in category.get("translations", {}).items():
+                self.translations.setdefault(clean_text, translation)
+            for service_name, description in category.get("descriptions", {}).items():
+                self.descriptions.setdefault(service_name, description)
+
+            category_sentences = category.get("sentences", [])
+            self.sentences_by_category[category_name] = category_sentences
+            for sentence in category_sentences:
+                self.sentences.append(sentence)
+                service_match = SERVICE_PATTERN.search(sentence)
+                if service_match:
+                    self.sentences_by_service.setdefault(service_match.group(1), []).append(
+                        sentence
+                    )
+
+        # Sentences with markers resolve directly, without stripping them per lookup
+        for sentence in self.sentences:
+            translation = self.translations.get(clean_sentence(sentence))
+            if translation is not None:
+                self.translations.setdefault(sentence, translation)
+
+    def sentences_for_service(self, service_name: str) -> Sequence[str]:
+        """Get the sentences featuring a service"""
+        return self.sentences_by_service.get(service_name, [])
+
+    def sentences_for_category(self, category_name: str) -> Sequence[str]:
+        """Get the sentences of a category"""
+        return self.sentences_by_category.get(category_name, [])
+
+    def translation(self, sentence: str) -> Optional[str]:
+        """Get the translation of a sentence, with or without markers"""
+        translation = self.translations.get(sentence)
+        if translation is None:
+            translation = self.translations.get(clean_sentence(sentence))
+        return translation
+
+    def description(self, service_name: str) -> Optional[str]:
+        """Get the description of a service"""
+        return self.descriptions.get(service_name)
+
+    def service_names(self) -> List[str]:
+        """Get the names of the services that have sentences"""
+        return list(self.sentences_by_service)
+
+    def category_names(self) -> List[str]:
+        """Get the category names in corpus order"""
+        return list(self.sentences_by_category)
+
+    def sentences_without(
+        self, service_names: Set[str], category_name: Optional[str] = None
+    ) -> Sequence[str]:
+        """Get all sentences, or a category's, except those of the given services"""
+        return _filter_sentences(self, service_names, category_name)
+
+
+def _parse_record(line: bytes) -> Optional[Tuple[str, str, Optional[str], Dict[str, Any]]]:
+    """Parse one JSON Lines record into category, sentence, service and the raw record"""
+    if not line.strip():
+        return None
+    record = json.loads(line)
+    sentence = record["sentence"]
+    service_name = record.get("service")
+    if not service_name:
+        service_match = SERVICE_PATTERN.search(sentence)
+        service_name = service_match.group(1) if service_match else None
+    return record.get("category", "others"), sentence, service_name, record
+
+
+def read_jsonl_corpus(path: str) -> Dict[str, Any]:
+    """Read a whole JSON Lines corpus into the nested JSON corpus structure"""
+    categories: Dict[str, Dict[str, Any]] = {}
+    with open(path, "rb") as f:
+        for line in f:
+            parsed = _parse_record(line)
+            if parsed is None:
+                continue
+            category_name, sentence, service_name, record = parsed
+            category = categories.setdefault(
+                category_name,
+                {"services": [], "sentences": [], "translations": {}, "descriptions": {}},
+            )
+            category["sentences"].append(sentence)
+            if service_name and service_name not in category["services"]:
+                category["services"].append(service_name)
+            if record.get("translation"):
+                category["translations"].setdefault(clean_sentence(sentence), record["translation"])
+            if service_name and record.get("description"):
+                category["descriptions"].setdefault(service_name, record["description"])
+    return {"categories": categories}
+
+
+class StreamingCorpus:
+    """JSON Lines corpus that loads translations and descriptions per category on demand
+
+    Startup keeps only the sentences, their services and the file offsets of
+    each category's records; a category's translations and descriptions are
+    parsed from those records the first time one of them is looked up.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.sentences: List[str] = []
+        self.sentences_by_service: Dict[str, List[str]] = {}
+        self.sentences_by_category: Dict[str, List[str]] = {}
+        self.loaded_categories: Set[str] = set()
+
+        self._category_offsets: Dict[str, array.array] = {}
+        # Which category holds the translation or description for a key
+        self._translation_categories: Dict[str, str] = {}
+        self._description_categories: Dict[str, str] = {}
+        self._translations: Dict[str, str] = {}
+        self._descriptions: Dict[str, str] = {}
+
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                line_offset = offset
+                offset += len(line)
+                parsed = _parse_record(line)
+                if parsed is None:
+                    continue
+                category_name, sentence, service_name, record = parsed
+
+                self.sentences.append(sentence)
+                self.sentences_by_category.setdefault(category_name, []).append(sentence)
+                if service_name:
+                    self.sentences_by_service.setdefault(service_name, []).append(sentence)
+                self._category_offsets.setdefault(category_name, array.array("Q")).append(
+                    line_offset
+                )
+
+                # Earlier records win when a key appears more than once
+                if record.get("translation"):
+                    self._translation_categories.setdefault(clean_sentence(sentence), category_name)
+                if service_name and record.get("description"):
+                    self._description_categories.setdefault(service_name, category_name)
+
+    def _load_category(self, category_name: str) -> None:
+        """Parse the translations and descriptions of one category"""
+        self.loaded_categories.add(category_name)
+        with open(self.path, "rb") as f:
+            for offset in self._category_offsets.get(category_name, ()):
+                f.seek(offset)
+                _, sentence, service_name, record = _parse_record(f.readline())
+                # Only some records of a key may carry its value
+                clean_text = clean_sentence(sentence)
+                translation = record.get("translation")
+                if translation and self._translation_categories.get(clean_text) == category_name:
+                    self._translations.setdefault(clean_text, translation)
+                description = record.get("description")
+                if (
+                    service_name
+                    and description
+                    and self._description_categories.get(service_name) == category_name
+                ):
+                    self._descriptions.setdefault(service_name, description)
+
+    def sentences_for_service(self, service_name: str) -> Sequence[str]:
+        """Get the sentences featuring a service"""
+        return self.sentences_by_service.get(service_name, [])
+
+    def sentences_for_category(self, category_name: str) -> Sequence[str]:
+        """Get the sentences of a category"""
+        return self.sentences_by_category.get(category_name, [])
+
+    def translation(self, sentence: str) -> Optional[str]:
+        """Get the translation of a sentence, loading its category if needed"""
+        clean_text = clean_sentence(sentence)
+        category_name = self._translation_categories.get(clean_text)
+        if category_name is not None and category_name not in self.loaded_categories:
+            self._load_category(category_name)
+        return self._translations.get(clean_text)
+
+    def description(self, service_name: str) -> Optional[str]:
+        """Get the description of a service, loading its category if needed"""
+        category_name = self._description_categories.get(service_name)
+        if category_name is not None and category_name not in self.loaded_categories:
+            self._load_category(category_name)
+        return self._descriptions.get(service_name)
+
+    def service_names(self) -> List[str]:
+        """Get the names of the services that have sentences"""
+        return list(self.sentences_by_service)
+
+    def category_names(self) -> List[str]:
+        """Get the category names in corpus order"""
+        return list(self.sentences_by_category)
+
+    def sentences_without(
+        self, service_names: Set[str], category_name: Optional[str] = None
+    ) -> Sequence[str]:
+        """Get all sentences, or a category's, except those of the given services"""
+        return _filter_sentences(self, service_names, category_name)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get how much of the corpus has been loaded"""
+        return {
+            "sentences": len(self.sentences),
+            "categories": len(self._category_offsets),
+            "loaded_categories": len(self.loaded_categories),
+            "translations": len(self._translations),
+            "descriptions": len(self._descriptions),
+        }
+
+
+class LazyStrings(Sequence[str]):
+    """Read-only sequence that decodes strings from a compiled corpus on access"""
+
+    def __init__(self, get_string: Callable[[int], str], ids: Sequence[int]):
+        self._get_string = get_string
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyStrings(self._get_string, self._ids[index])
+        return self._get_string(int(self._ids[index]))
+
+    def __iter__(self) -> Iterator[str]:
+        for item_id in self._ids:
+            yield self._get_string(int(item_id))
+
+
+class ChainedStrings(Sequence[str]):
+    """Read-only sequence that concatenates other sequences without copying them"""
+
+    def __init__(self, parts: Sequence[Sequence[str]]):
+        self._parts = list(parts)
+        self._ends: List[int] = []
+        total = 0
+        for part in self._parts:
+            total += len(part)
+            self._ends.append(total)
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "sentence index out of range"
+            raise IndexError(msg)
+        part = bisect.bisect_right(self._ends, index)
+        start = self._ends[part - 1] if part else 0
+        return self._parts[part][index - start]
+
+    def __iter__(self) -> Iterator[str]:
+        for part in self._parts:
+            yield from part
+
+
+class CompiledCorpus:
+    """Memory-mapped compiled corpus with the same lookups as CorpusIndex"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < HEADER.size:
+            msg = f"{path} is not a compiled corpus"
+            raise ValueError(msg)
+        magic, version, _, *fields = HEADER.unpack_from(self._mm, 0)
+        if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+            msg = f"{path} is not a version {CORPUS_VERSION} compiled corpus"
+            raise ValueError(msg)
+        counts, offsets = fields[:6], fields[6:]
+        if len(self._mm) < offsets[9]:
+            msg = f"{path} is truncated"
+            raise ValueError(msg)
+
+        # Tables in file order; the string offsets table has one extra entry
+        self._offsets = np.frombuffer(self._mm, "<u4", counts[0] + 1, offsets[0])
+        self._sentences = np.frombuffer(self._mm, SENTENCE_DTYPE, counts[1], offsets[1])
+        self._service_hashes = np.frombuffer(self._mm, "<u8", counts[2], offsets[2])
+        self._services = np.frombuffer(self._mm, SERVICE_DTYPE, counts[2], offsets[3])
+        self._service_sentences = np.frombuffer(self._mm, "<u4", counts[3], offsets[4])
+        self._categories = np.frombuffer(self._mm, CATEGORY_DTYPE, counts[4], offsets[5])
+        self._key_hashes = np.frombuffer(self._mm, "<u8", counts[5], offsets[6])
+        self._keys = np.frombuffer(self._mm, KEY_DTYPE, counts[5], offsets[7])
+        self._data_offset = offsets[8]
+
+        self.sentences = LazyStrings(self.get_sentence, range(counts[1]))
+        self._category_rows: Optional[Dict[str, int]] = None
+
+    def close(self) -> None:
+        """Release the memory map"""
+        self.sentences = LazyStrings(self.get_sentence, range(0))
+        self._offsets = self._sentences = self._services = self._service_hashes = None
+        self._service_sentences = self._categories = self._keys = self._key_hashes = None
+        self._mm.close()
+
+    def get_string(self, string_id: int) -> str:
+        """Decode one string from the string table"""
+        start = self._data_offset + int(self._offsets[string_id])
+        end = self._data_offset + int(self._offsets[string_id + 1])
+        return self._mm[start:end].decode("utf-8")
+
+    def get_sentence(self, index: int) -> str:
+        """Get a sentence with its service markers"""
+        sentence = self._sentences[index]
+        if int(sentence["text"]) != NO_STRING:
+            return self.get_string(int(sentence["text"]))
+        clean_text = self.get_string(int(sentence["clean"]))
+        span = self.sentence_span(index)
+        return clean_text if span is None else mark_service(clean_text, span)
+
+    def _find(self, hashes: np.ndarray, names: np.ndarray, text: str) -> Optional[int]:
+        """Binary search a sorted hash array and confirm the match by string"""
+        text_hash = np.uint64(string_hash(text))
+        row = int(np.searchsorted(hashes, text_hash))
+        while row < len(hashes) and hashes[row] == text_hash:
+            if self.get_string(int(names[row])) == text:
+                return row
+            row += 1
+        return None
+
+    def sentences_for_service(self, service_name: str) -> Sequence[str]:
+        """Get the sentences featuring a service
+
+        The few sentences of a service are decoded up front, so callers never
+        hold a view that would keep the memory map from closing.
+        """
+        row = self._find(self._service_hashes, self._services["name"], service_name)
+        if row is None:
+            return []
+        first, count = int(self._services[row]["first"]), int(self._services[row]["count"])
+        return [
+            self.get_sentence(int(index))
+            for index in self._service_sentences[first : first + count]
+        ]
+
+    def _get_category_rows(self) -> Dict[str, int]:
+        """Map category names to their rows, decoding the names on first use"""
+        if self._category_rows is None:
+            self._category_rows = {
+                self.get_string(int(name)): row for row, name in enumerate(self._categories["name"])
+            }
+        return self._category_rows
+
+    def sentences_for_category(self, category_name: str) -> Sequence[str]:
+        """Get the sentences of a category"""
+        row = self._get_category_rows().get(category_name)
+        if row is None:
+            return []
+        first, count = int(self._categories[row]["first"]), int(self._categories[row]["count"])
+        return self.sentences[first : first + count]
+
+    def sentence_span(self, index: int) -> Optional[Tuple[int, int]]:
+        """Get the service span of a sentence within its clean text"""
+        sentence = self._sentences[index]
+        if int(sentence["service"]) == NO_STRING:
+            return None
+        return int(sentence["span_start"]), int(sentence["span_end"])
+
+    def translation(self, sentence: str) -> Optional[str]:
+        """Get the translation of a sentence, with or without markers"""
+        row = self._find(self._key_hashes, self._keys["key"], clean_sentence(sentence))
+        if row is None:
+            return None
+        return self.get_string(int(self._keys[row]["translation"]))
+
+    def description(self, service_name: str) -> Optional[str]:
+        """Get the description of a service"""
+        row = self._find(self._service_hashes, self._services["name"], service_name)
+        if row is None:
+            return None
+        description_id = int(self._services[row]["description"])
+        return None if description_id == NO_STRING else self.get_string(description_id)
+
+    def service_names(self) -> List[str]:
+        """Get the names of the services that have sentences"""
+        return [
+            self.get_string(int(service["name"]))
+            for service in self._services
+            if int(service["count"]) > 0
+        ]
+
+    def category_names(self) -> List[str]:
+        """Get the category names in corpus order"""
+        return list(self._get_category_rows())
+
+    def sentences_without(
+        self, service_names: Set[str], category_name: Optional[str] = None
+    ) -> Sequence[str]:
+        """Get all sentences, or a category's, except those of the given services"""
+        keep = np.ones(len(self._sentences), dtype=bool)
+        for service_name in service_names:
+            row = self._find(self._service_hashes, self._services["name"], service_name)
+            if row is not None:
+                first, count = int(self._services[row]["first"]), int(self._services[row]["count"])
+                keep[self._service_sentences[first : first + count]] = False
+
+        first, end = 0, len(keep)
+        if category_name is not None:
+            row = self._get_category_rows().get(category_name)
+            if row is None:
+                return []
+            first = int(self._categories[row]["first"])
+            end = first + int(self._categories[row]["count"])
+        return LazyStrings(self.get_sentence, first + np.flatnonzero(keep[first:end]))
+
+
+class MultiCorpus:
+    """Layered view over several corpora where earlier corpora take precedence
+
+    A service belongs to the first corpus with sentences for it, and its
+    sentences and description come only from that corpus, so an override
+    source replaces a service as a whole. Translations fall through to later
+    corpora.
+    """
+
+    def __init__(self, corpora: Sequence[Any]):
+        self.corpora = list(corpora)
+
+        # Only the service and category tables are read; sentences stay in their corpora
+        self._service_owners: Dict[str, int] = {}
+        self._shadowed: List[Set[str]] = []
+        self._category_names: Dict[str, None] = {}
+        for position, corpus in enumerate(self.corpora):
+            shadowed = set()
+            for service_name in corpus.service_names():
+                if self._service_owners.setdefault(service_name, position) != position:
+                    shadowed.add(service_name)
+            self._shadowed.append(shadowed)
+            self._category_names.update(dict.fromkeys(corpus.category_names()))
+
+        self._sentences: Optional[ChainedStrings] = None
+        self._sentences_by_category: Dict[str, ChainedStrings] = {}
+
+    def _layer_sentences(self, position: int, category_name: Optional[str] = None) -> Sequence[str]:
+        """Get a corpus's sentences, or a category's, minus services an earlier corpus owns"""
+        corpus = self.corpora[position]
+        if self._shadowed[position]:
+            return corpus.sentences_without(self._shadowed[position], category_name)
+        if category_name is None:
+            return corpus.sentences
+        return corpus.sentences_for_category(category_name)
+
+    @property
+    def sentences(self) -> Sequence[str]:
+        """All sentences, corpus by corpus, assembled on first use"""
+        if self._sentences is None:
+            self._sentences = ChainedStrings(
+                [self._layer_sentences(position) for position in range(len(self.corpora))]
+            )
+        return self._sentences
+
+    def sentences_for_service(self, service_name: str) -> Sequence[str]:
+        """Get the sentences featuring a service from the corpus that owns it"""
+        position = self._service_owners.get(service_name)
+        if position is None:
+            return []
+        return self.corpora[position].sentences_for_service(service_name)
+
+    def sentences_for_category(self, category_name: str) -> Sequence[str]:
+        """Get the sentences of a category from every corpus"""
+        if category_name not in self._category_names:
+            return []
+        sentences = self._sentences_by_category.get(category_name)
+        if sentences is None:
+            sentences = self._sentences_by_category[category_name] = ChainedStrings(
+                [
+                    self._layer_sentences(position, category_name)
+                    for position in range(len(self.corpora))
+                ]
+            )
+        return sentences
+
+    def translation(self, sentence: str) -> Optional[str]:
+        """Get the translation of a sentence from the first corpus that has one"""
+        for corpus in self.corpora:
+            translation = corpus.translation(sentence)
+            if translation is not None:
+                return translation
+        return None
+
+    def description(self, service_name: str) -> Optional[str]:
+        """Get the description of a service, preferring the corpus that owns it"""
+        position = self._service_owners.get(service_name)
+        if position is not None:
+            description = self.corpora[position].description(service_name)
+            if description is not None:
+                return description
+        for corpus in self.corpora:
+            description = corpus.description(service_name)
+            if description is not None:
+                return description
+        return None
+
+    def service_names(self) -> List[str]:
+        """Get the names of the services that have sentences"""
+        return list(self._service_owners)
+
+    def category_names(self) -> List[str]:
+        """Get the category names in corpus order"""
+        return list(self._category_names)
+
+
+class _StringTable:
+    """Deduplicating string table used while compiling"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.encoded: List[bytes] = []
+
+    def add(self, text: Optional[str]) -> int:
+        if text is None:
+            return NO_STRING
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.encoded)
+            self.encoded.append(text.encode("utf-8"))
+        return string_id
+
+
+def _merge_corpora(corpora: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Merge categories by name; earlier corpora win for duplicate keys"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for corpus in corpora:
+        for name, category in corpus.get("categories", {}).items():
+            target = merged.setdefault(
+                name, {"sentences": [], "translations": {}, "descriptions": {}}
+            )
+            target["sentences"].extend(category.get("sentences", []))
+            for field in ("translations", "descriptions"):
+                for key, value in category.get(field, {}).items():
+                    target[field].setdefault(key, value)
+    return merged
+
+
+def _sorted_by_hash(names: List[str]) -> List[str]:
+    return sorted(names, key=string_hash)
+
+
+def compile_corpus(corpora: List[Dict[str, Any]]) -> bytes:
+    """Compile parsed JSON corpora into the binary corpus format"""
+    categories = _merge_corpora(corpora)
+    strings = _StringTable()
+    translations: Dict[str, str] = {}
+    descriptions: Dict[str, str] = {}
+    for category in categories.values():
+        for clean_text, translation in category["translations"].items():
+            translations.setdefault(clean_text, translation)
+        for service_name, description in category["descriptions"].items():
+            descriptions.setdefault(service_name, description)
+
+    sentence_count = sum(len(category["sentences"]) for category in categories.values())
+    sentences = np.zeros(sentence_count, SENTENCE_DTYPE)
+    category_rows = []
+    service_links: Dict[str, List[int]] = {}
+    position = 0
+    for name, category in categories.items():
+        category_rows.append((strings.add(name), position, len(category["sentences"])))
+        for sentence in category["sentences"]:
+            clean_text = clean_sentence(sentence)
+            service_match = SERVICE_PATTERN.search(sentence)
+            service_name = service_match.group(1) if service_match else None
+            span = None
+            if service_match:
+                span_start = len(clean_sentence(sentence[: service_match.start()]))
+                span = (span_start, span_start + len(service_name))
+                service_links.setdefault(service_name, []).append(position)
+            rebuilt = clean_text if span is None else mark_service(clean_text, span)
+
+            sentences[position] = (
+                NO_STRING if rebuilt == sentence else strings.add(sentence),
+                strings.add(clean_text),
+                strings.add(service_name),
+                span[0] if span else 0,
+                span[1] if span else 0,
+                strings.add(translations.get(clean_text)),
+            )
+            position += 1
+
+    # Services with descriptions but no sentences are still looked up by name
+    service_names = _sorted_by_hash(list(dict.fromkeys([*service_links, *descriptions])))
+    services = np.zeros(len(service_names), SERVICE_DTYPE)
+    links: List[int] = []
+    for row, name in enumerate(service_names):
+        sentence_ids = service_links.get(name, [])
+        services[row] = (
+            strings.add(name),
+            strings.add(descriptions.get(name)),
+            len(links),
+            len(sentence_ids),
+        )
+        links.extend(sentence_ids)
+
+    key_names = _sorted_by_hash(list(translations))
+    keys = np.array(
+        [(strings.add(key), strings.add(translations[key])) for key in key_names], KEY_DTYPE
+    )
+
+    string_offsets = np.zeros(len(strings.encoded) + 1, "<u4")
+    string_offsets[1:] = np.cumsum([len(encoded) for encoded in strings.encoded])
+
+    sections = [
+        string_offsets.tobytes(),
+        sentences.tobytes(),
+        np.array([string_hash(name) for name in service_names], "<u8").tobytes(),
+        services.tobytes(),
+        np.array(links, "<u4").tobytes(),
+        np.array(category_rows, CATEGORY_DTYPE).tobytes(),
+        np.array([string_hash(key) for key in key_names], "<u8").tobytes(),
+        keys.tobytes(),
+        b"".join(strings.encoded),
+    ]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        position += -position % 8  # Keep every section 8-byte aligned
+        offsets.append(position)
+        position += len(section)
+
+    counts = (
+        len(strings.encoded),
+        len(sentences),
+        len(services),
+        len(links),
+        len(category_rows),
+        len(keys),
+    )
+    output = bytearray(HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, 0, *counts, *offsets, position))
+    for offset, section in zip(offsets, sections):
+        output.extend(b"\0" * (offset - len(output)))
+        output.extend(section)
+    return bytes(output)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point for compile-corpus"""
+    parser = argparse.ArgumentParser(description="Compile JSON corpora into a binary corpus")
+    parser.add_argument("inputs", nargs="+", help="JSON or JSONL corpus files, earlier files win")
+    parser.add_argument("-o", "--output", required=True, help=f"output file ({CORPUS_SUFFIX})")
+    args = parser.parse_args(argv)
+
+    corpora = []
+    for input_path in args.inputs:
+        if input_path.endswith(JSONL_SUFFIX):
+            corpora.append(read_jsonl_corpus(input_path))
+            continue
+        with open(input_path, encoding="utf-8") as f:
+            corpora.append(json.load(f))
+
+    compiled = compile_corpus(corpora)
+    with open(args.output, "wb") as f:
+        f.write(compiled)
+
+    corpus = CompiledCorpus(args.output)
+    print(f"Compiled {len(corpus.sentences)} sentences into {args.output} ({len(compiled)} bytes)")
+    corpus.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Per-state frame and CPU statistics for the game loop
+"""
+
+import time
+from typing import Dict
+
+
+class FrameStats:
+    """Counts loop iterations, rendered frames and CPU time for each game state"""
+
+    def __init__(self):
+        self.states: Dict[str, Dict[str, float]] = {}
+        self._last_cpu_time = time.process_time()
+        self._last_wall_time = time.perf_counter()
+
+    def record_iteration(self, state_name: str, rendered: bool) -> None:
+        """Attribute the time since the previous iteration to a game state"""
+        cpu_time = time.process_time()
+        wall_time = time.perf_counter()
+
+        stats = self.states.setdefault(
+            state_name,
+            {"iterations": 0, "frames_rendered": 0, "cpu_time": 0.0, "wall_time": 0.0},
+        )
+        stats["iterations"] += 1
+        if rendered:
+            stats["frames_rendered"] += 1
+        stats["cpu_time"] += cpu_time - self._last_cpu_time
+        stats["wall_time"] += wall_time - self._last_wall_time
+
+        self._last_cpu_time = cpu_time
+        self._last_wall_time = wall_time
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get per-state counters including CPU usage and rendered frames per second"""
+        result = {}
+        for state_name, stats in self.states.items():
+            wall_time = max(stats["wall_time"], 1e-9)
+            result[state_name] = {
+                **stats,
+                "cpu_percent": 100.0 * stats["cpu_time"] / wall_time,
+                "rendered_fps": stats["frames_rendered"] / wall_time,
+            }
+        return result
+
+    def format_summary(self) -> str:
+        """Format the per-state counters as one line per state"""
+        lines = []
+        for state_name, stats in self.get_stats().items():
+            lines.append(
+                f"{state_name}: {int(stats['frames_rendered'])} frames in "
+                f"{stats['wall_time']:.1f}s ({stats['rendered_fps']:.1f} fps, "
+                f"CPU {stats['cpu_percent']:.1f}%)"
+            )
+        return "\n".join(lines)
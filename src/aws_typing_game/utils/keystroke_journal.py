@@ -0,0 +1,148 @@
+"""
+Append-only binary journal of typed keystrokes
+
+Each journal file starts with a small header followed by fixed-size records:
+
+    delta_us   uint32  microseconds since the previous record of the session
+    codepoint  uint32  typed character
+    expected   uint32  character the sentence expected, 0 past its end
+    flags      uint8   FLAG_CORRECT, FLAG_SESSION_START
+
+Records are padded to 16 bytes so a file maps directly onto a NumPy array.
+"""
+
+import os
+import struct
+import time
+from typing import BinaryIO, List, Optional
+
+import numpy as np
+
+from ..core.config import FileConfig
+
+JOURNAL_MAGIC = b"AWSK"
+JOURNAL_VERSION = 1
+JOURNAL_PREFIX = "keystrokes-"
+JOURNAL_SUFFIX = ".bin"
+
+# magic, version and record size
+HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<IIIB3x")
+
+FLAG_CORRECT = 1
+FLAG_SESSION_START = 2
+
+KEYSTROKE_DTYPE = np.dtype(
+    {
+        "names": ["delta_us", "codepoint", "expected", "flags"],
+        "formats": ["<u4", "<u4", "<u4", "u1"],
+        "offsets": [0, 4, 8, 12],
+        "itemsize": RECORD.size,
+    }
+)
+
+MAX_DELTA_US = 0xFFFFFFFF
+
+
+def journal_files(folder: str) -> List[str]:
+    """List the journal files in a folder, oldest first"""
+    try:
+        names = os.listdir(folder)
+    except FileNotFoundError:
+        return []
+    return [
+        os.path.join(folder, name)
+        for name in sorted(names)
+        if name.startswith(JOURNAL_PREFIX) and name.endswith(JOURNAL_SUFFIX)
+    ]
+
+
+def read_journal(path: str) -> np.ndarray:
+    """Memory-map a journal file as a structured array of its complete records"""
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        msg = f"{path} is not a keystroke journal"
+        raise ValueError(msg)
+    magic, version, record_size = HEADER.unpack(header)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION or record_size != RECORD.size:
+        msg = f"{path} is not a version {JOURNAL_VERSION} keystroke journal"
+        raise ValueError(msg)
+
+    # A record cut short by a crash is ignored
+    count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+    if count == 0:
+        return np.zeros(0, KEYSTROKE_DTYPE)
+    return np.memmap(path, KEYSTROKE_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+class KeystrokeJournal:
+    """Buffered writer that rotates to a new file when the current one is full"""
+
+    def __init__(
+        self,
+        folder: str = FileConfig.KEYSTROKE_JOURNAL_FOLDER,
+        max_file_bytes: int = FileConfig.KEYSTROKE_JOURNAL_FILE_BYTES,
+        buffer_bytes: int = FileConfig.KEYSTROKE_JOURNAL_BUFFER_BYTES,
+    ):
+        self.folder = folder
+        self.max_records = max(1, (max_file_bytes - HEADER.size) // RECORD.size)
+        self.buffer_bytes = buffer_bytes
+        self.path: Optional[str] = None
+        self.records_written = 0
+
+        os.makedirs(folder, exist_ok=True)
+        existing = journal_files(folder)
+        self._file_index = self._parse_index(existing[-1]) + 1 if existing else 0
+        self._file: Optional[BinaryIO] = None
+        self._file_records = 0
+        self._last_time: Optional[float] = None
+
+    def _parse_index(self, path: str) -> int:
+        name = os.path.basename(path)[len(JOURNAL_PREFIX) : -len(JOURNAL_SUFFIX)]
+        return int(name) if name.isdigit() else 0
+
+    def _open_next_file(self) -> None:
+        """Close the current file and start the next one with a fresh header"""
+        if self._file is not None:
+            self._file.close()
+        self.path = os.path.join(
+            self.folder, f"{JOURNAL_PREFIX}{self._file_index:06d}{JOURNAL_SUFFIX}"
+        )
+        self._file_index += 1
+        self._file = open(self.path, "wb", buffering=self.buffer_bytes)  # noqa: SIM115
+        self._file.write(HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, RECORD.size))
+        self._file_records = 0
+
+    def _write(self, delta_us: int, codepoint: int, expected: int, flags: int) -> None:
+        if self._file is None or self._file_records >= self.max_records:
+            self._open_next_file()
+        self._file.write(RECORD.pack(delta_us, codepoint, expected, flags))
+        self._file_records += 1
+        self.records_written += 1
+
+    def start_session(self) -> None:
+        """Mark the start of a game; the next keystroke is timed from here"""
+        self._last_time = time.perf_counter()
+        self._write(0, 0, 0, FLAG_SESSION_START)
+
+    def record(self, codepoint: int, expected: int, correct: bool) -> None:
+        """Append one keystroke, timed from the previous one"""
+        now = time.perf_counter()
+        if self._last_time is None:
+            delta_us = 0
+        else:
+            delta_us = min(int((now - self._last_time) * 1_000_000), MAX_DELTA_US)
+        self._last_time = now
+        self._write(delta_us, codepoint, expected, FLAG_CORRECT if correct else 0)
+
+    def flush(self) -> None:
+        """Push buffered records to the operating system"""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Write the buffered records and close the current file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
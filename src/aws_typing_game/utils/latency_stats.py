@@ -0,0 +1,75 @@
+"""
+Latency histograms for input-to-output measurements
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with cheap percentile queries"""
+
+    def __init__(self, bucket_ms: float = 0.25, max_ms: float = 250.0):
+        self.bucket_ms = bucket_ms
+        # The last bucket collects everything at or above max_ms
+        self.counts = np.zeros(int(max_ms / bucket_ms) + 1, dtype=np.int64)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """Add one latency sample in milliseconds"""
+        index = min(int(latency_ms / self.bucket_ms), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, percent: float) -> float:
+        """Get the upper bound of the bucket holding the given percentile"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(np.ceil(percent / 100 * self.count)))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        if index == len(self.counts) - 1:
+            return self.max_ms
+        return min((index + 1) * self.bucket_ms, self.max_ms)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get sample count, mean, max and p50/p95/p99 in milliseconds"""
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+class LatencyTracker:
+    """Keeps one latency histogram per label"""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, label: str, seconds: float) -> None:
+        """Add one latency sample in seconds for a label"""
+        histogram = self.histograms.get(label)
+        if histogram is None:
+            histogram = self.histograms[label] = LatencyHistogram()
+        histogram.record(seconds * 1000)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get the statistics of every label"""
+        return {label: histogram.get_stats() for label, histogram in self.histograms.items()}
+
+    def dump(self, path: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Write the statistics and optional metadata to a JSON file"""
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"metadata": metadata or {}, "latency": self.get_stats()}, f, indent=2)
+        except OSError as e:
+            print(f"Warning: Could not write latency statistics: {e}")
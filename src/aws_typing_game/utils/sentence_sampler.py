@@ -0,0 +1,126 @@
+"""
+Weighted sentence sampling that favours the user's weak spots
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..core.config import GameConfig
+from .corpus import SERVICE_PATTERN
+from .typing_stats import TypingStats
+
+
+class FenwickTree:
+    """Binary indexed tree over non-negative weights with O(log n) update and search"""
+
+    def __init__(self, weights: Sequence[float]):
+        weights = np.asarray(weights, dtype=np.float64)
+        self.size = len(weights)
+        self.weights = weights.tolist()
+
+        # tree[i] holds the sum of the lowbit(i) weights ending at position i
+        prefix = np.concatenate(([0.0], np.cumsum(weights)))
+        positions = np.arange(self.size + 1)
+        tree = prefix - prefix[positions - (positions & -positions)]
+        self.tree = tree.tolist()
+        self.tree[0] = 0.0
+
+        self._top_bit = 1 << max(0, self.size.bit_length() - 1) if self.size else 0
+
+    def total(self) -> float:
+        """Get the sum of all weights"""
+        total = 0.0
+        position = self.size
+        while position > 0:
+            total += self.tree[position]
+            position -= position & -position
+        return total
+
+    def update(self, index: int, weight: float) -> None:
+        """Set the weight at an index"""
+        delta = weight - self.weights[index]
+        self.weights[index] = weight
+        position = index + 1
+        while position <= self.size:
+            self.tree[position] += delta
+            position += position & -position
+
+    def find(self, value: float) -> int:
+        """Get the first index whose running total exceeds value"""
+        position = 0
+        bit = self._top_bit
+        while bit:
+            next_position = position + bit
+            if next_position <= self.size and self.tree[next_position] <= value:
+                position = next_position
+                value -= self.tree[next_position]
+            bit >>= 1
+        # Rounding can push a value at the very top past the last weight
+        return min(position, self.size - 1)
+
+
+class SentenceSampler:
+    """Draws sentences with probability proportional to how much the user struggles with them
+
+    A sentence's weight grows with its smoothed error rate and with how much
+    slower than GameConfig.TARGET_SECONDS_PER_CHAR it was typed. Sentences
+    that have not been typed yet start from their service's lifetime accuracy.
+    Pass a seeded rng to make the draws reproducible.
+    """
+
+    def __init__(
+        self,
+        sentences: Sequence[str],
+        typing_stats: Optional[TypingStats] = None,
+        rng: Optional[np.random.Generator] = None,
+    ):
+        self.sentences = sentences
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.error_rates = np.zeros(len(sentences), dtype=np.float64)
+        self.slowness = np.zeros(len(sentences), dtype=np.float64)
+
+        if typing_stats is not None:
+            service_errors = {
+                service_name: 1.0 - summary["accuracy"] / 100
+                for service_name, summary in typing_stats.service_summary().items()
+            }
+            # Skip the scan when nothing has been learned yet
+            if any(service_errors.values()):
+                service_matches = map(SERVICE_PATTERN.search, sentences)
+                self.error_rates = np.array(
+                    [
+                        service_errors.get(service_match.group(1), 0.0) if service_match else 0.0
+                        for service_match in service_matches
+                    ],
+                    dtype=np.float64,
+                )
+
+        self.tree = FenwickTree(self._weight(self.error_rates, self.slowness))
+
+    def _weight(self, error_rate, slowness):
+        """Turn error rates and slowness into sampling weights"""
+        return (
+            1.0
+            + GameConfig.WEAKNESS_ERROR_WEIGHT * error_rate
+            + GameConfig.WEAKNESS_SPEED_WEIGHT * slowness
+        )
+
+    def sample(self) -> int:
+        """Draw a sentence index"""
+        return self.tree.find(self.rng.random() * self.tree.total())
+
+    def record_result(self, index: int, mistakes: int, chars: int, seconds: float) -> None:
+        """Fold a finished sentence into its weight"""
+        attempts = chars + mistakes
+        error_rate = mistakes / attempts if attempts else 0.0
+        seconds_per_char = seconds / chars if chars else 0.0
+        slowness = min(
+            GameConfig.WEAKNESS_MAX_SLOWNESS,
+            max(0.0, seconds_per_char / GameConfig.TARGET_SECONDS_PER_CHAR - 1.0),
+        )
+
+        smoothing = GameConfig.WEAKNESS_SMOOTHING
+        self.error_rates[index] += smoothing * (error_rate - self.error_rates[index])
+        self.slowness[index] += smoothing * (slowness - self.slowness[index])
+        self.tree.update(index, float(self._weight(self.error_rates[index], self.slowness[index])))
@@ -0,0 +1,295 @@
+"""
+SQLite session history with batched background inserts
+"""
+
+import contextlib
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import FileConfig
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    profile TEXT NOT NULL DEFAULT '',
+    score INTEGER NOT NULL,
+    mistakes INTEGER NOT NULL,
+    total_chars INTEGER NOT NULL,
+    duration REAL NOT NULL
+);
+-- Covers the trend query so it never touches the table
+CREATE INDEX IF NOT EXISTS sessions_timestamp
+    ON sessions (timestamp, score, total_chars, mistakes);
+CREATE INDEX IF NOT EXISTS sessions_score ON sessions (score);
+CREATE INDEX IF NOT EXISTS sessions_mistakes ON sessions (mistakes);
+CREATE INDEX IF NOT EXISTS sessions_total_chars ON sessions (total_chars);
+CREATE INDEX IF NOT EXISTS sessions_duration ON sessions (duration);
+CREATE INDEX IF NOT EXISTS sessions_profile_timestamp ON sessions (profile, timestamp);
+CREATE INDEX IF NOT EXISTS sessions_profile_score ON sessions (profile, score);
+
+CREATE TABLE IF NOT EXISTS session_services (
+    session_id INTEGER NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    service TEXT NOT NULL,
+    PRIMARY KEY (session_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS session_services_service
+    ON session_services (service, session_id);
+"""
+
+# timestamp, profile, score, mistakes, total_chars, duration and answered services
+SessionRow = Tuple[float, str, int, int, int, float, Sequence[str]]
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open a session database in WAL mode so reads never wait for the writer"""
+    connection = sqlite3.connect(path, timeout=5.0)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA foreign_keys=ON")
+    return connection
+
+
+class SessionStore:
+    """Records finished game sessions and answers history queries
+
+    Sessions are queued by the game thread and inserted by a worker thread
+    that commits them in batches, one transaction per batch. The bounded
+    queue drops sessions rather than blocking the game when it is full.
+    Queries run on the caller's own connection.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        profile: str = "",
+        batch_size: int = FileConfig.SESSION_BATCH_SIZE,
+        flush_interval: float = FileConfig.SESSION_FLUSH_INTERVAL,
+        max_size: int = FileConfig.SESSION_QUEUE_SIZE,
+    ):
+        self.path = path
+        self.profile = profile
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+
+        self.submitted = 0
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failed = 0
+
+        # Create the schema up front so queries work before the first insert
+        with contextlib.closing(connect(path)) as connection:
+            connection.executescript(SCHEMA)
+        self._reader: Optional[sqlite3.Connection] = None
+
+        self._thread = threading.Thread(target=self._run, name="session-store", daemon=True)
+        self._thread.start()
+
+    def add_session(
+        self,
+        score: int,
+        mistakes: int,
+        total_chars: int,
+        duration: float,
+        answered_services: Sequence[str],
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Queue a finished session without touching the database"""
+        self.submitted += 1
+        row = (
+            time.time() if timestamp is None else timestamp,
+            self.profile,
+            score,
+            mistakes,
+            total_chars,
+            duration,
+            tuple(answered_services),
+        )
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        connection = connect(self.path)
+        running = True
+        while running:
+            item = self._queue.get()
+            batch: List[SessionRow] = []
+            waiters: List[threading.Event] = []
+
+            # Gather whatever else arrives shortly so it shares the transaction
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._insert_batch(connection, batch)
+            for waiter in waiters:
+                waiter.set()
+        connection.close()
+
+    def _insert_batch(self, connection: sqlite3.Connection, batch: List[SessionRow]) -> None:
+        """Insert sessions and their services in a single transaction"""
+        try:
+            with connection:
+                service_rows = []
+                for row in batch:
+                    cursor = connection.execute(
+                        "INSERT INTO sessions (timestamp, profile, score, mistakes, total_chars, duration)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        row[:6],
+                    )
+                    service_rows.extend(
+                        (cursor.lastrowid, position, service)
+                        for position, service in enumerate(row[6])
+                    )
+                connection.executemany(
+                    "INSERT INTO session_services (session_id, position, service) VALUES (?, ?, ?)",
+                    service_rows,
+                )
+        except sqlite3.Error as e:
+            self.failed += len(batch)
+            print(f"Error saving game sessions: {e}")
+            return
+        self.written += len(batch)
+        self.batches += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every queued session has been committed"""
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Commit the queued sessions and stop the worker"""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        if self._reader is None:
+            self._reader = connect(self.path)
+        return self._reader.execute(sql, params).fetchall()
+
+    def _filters(
+        self, profile: Optional[str], since: Optional[float], column_prefix: str = ""
+    ) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause for the optional profile and start time filters"""
+        clauses, params = [], []
+        if profile is not None:
+            clauses.append(f"{column_prefix}profile = ?")
+            params.append(profile)
+        if since is not None:
+            clauses.append(f"{column_prefix}timestamp >= ?")
+            params.append(since)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count_sessions(self, profile: Optional[str] = None, since: Optional[float] = None) -> int:
+        """Count the stored sessions"""
+        where, params = self._filters(profile, since)
+        return self._query(f"SELECT COUNT(*) FROM sessions{where}", params)[0][0]  # noqa: S608
+
+    def top_sessions(
+        self, limit: int = 10, profile: Optional[str] = None, since: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Get the highest scoring sessions, most recent first among ties"""
+        where, params = self._filters(profile, since)
+        rows = self._query(
+            "SELECT id, timestamp, profile, score, mistakes, total_chars, duration"  # noqa: S608
+            f" FROM sessions{where} ORDER BY score DESC, timestamp DESC LIMIT ?",
+            [*params, limit],
+        )
+        return [dict(row) for row in rows]
+
+    def score_trend(
+        self,
+        bucket_seconds: float = 86400,
+        profile: Optional[str] = None,
+        since: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get session count, average score and accuracy per time bucket"""
+        where, params = self._filters(profile, since)
+        rows = self._query(
+            "SELECT CAST(timestamp / ? AS INTEGER) * ? AS bucket_start,"  # noqa: S608
+            " COUNT(*) AS sessions, AVG(score) AS average_score,"
+            " SUM(total_chars) AS total_chars, SUM(mistakes) AS mistakes"
+            f" FROM sessions{where} GROUP BY bucket_start ORDER BY bucket_start",
+            [bucket_seconds, bucket_seconds, *params],
+        )
+        trend = []
+        for row in rows:
+            attempts = row["total_chars"] + row["mistakes"]
+            trend.append(
+                {
+                    "bucket_start": row["bucket_start"],
+                    "sessions": row["sessions"],
+                    "average_score": row["average_score"],
+                    "accuracy": row["total_chars"] / attempts * 100 if attempts else 0.0,
+                }
+            )
+        return trend
+
+    def service_counts(
+        self,
+        limit: Optional[int] = None,
+        profile: Optional[str] = None,
+        since: Optional[float] = None,
+    ) -> List[Tuple[str, int]]:
+        """Get how often each service was answered, most frequent first"""
+        if profile is None and since is None:
+            # Served from the service index alone
+            sql = "SELECT service, COUNT(*) AS answered FROM session_services GROUP BY service"
+            params: List[Any] = []
+        else:
+            # CROSS JOIN keeps SQLite from starting at the service index, so the
+            # filters narrow the sessions first and services are found by key
+            where, params = self._filters(profile, since, "s.")
+            sql = (
+                "SELECT ss.service, COUNT(*) AS answered FROM sessions s"  # noqa: S608
+                f" CROSS JOIN session_services ss ON ss.session_id = s.id{where}"
+                " GROUP BY ss.service"
+            )
+        sql += " ORDER BY answered DESC, service"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [(row[0], row[1]) for row in self._query(sql, params)]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get insert pipeline counters"""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "submitted": self.submitted,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
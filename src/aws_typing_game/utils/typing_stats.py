@@ -0,0 +1,167 @@
+"""
+Incremental typing statistics per service and per character
+"""
+
+import io
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+STATS_VERSION = 1
+
+# Printable ASCII gets its own row and column; everything else shares the last one
+FIRST_CODEPOINT = 32
+LAST_CODEPOINT = 126
+OTHER_INDEX = LAST_CODEPOINT - FIRST_CODEPOINT + 1
+ALPHABET_SIZE = OTHER_INDEX + 1
+
+# Columns of the per-service count and time tables
+WORDS, CORRECT, MISTAKES = 0, 1, 2
+TOTAL_SECONDS, BEST_SECONDS = 0, 1
+
+
+def character_index(codepoint: int) -> int:
+    """Get the confusion matrix row or column of a codepoint"""
+    if FIRST_CODEPOINT <= codepoint <= LAST_CODEPOINT:
+        return codepoint - FIRST_CODEPOINT
+    return OTHER_INDEX
+
+
+def index_character(index: int) -> str:
+    """Get the character of a confusion matrix row or column"""
+    return "?" if index == OTHER_INDEX else chr(index + FIRST_CODEPOINT)
+
+
+class TypingStats:
+    """Keystroke and word statistics that update in constant time and merge by addition
+
+    The confusion matrix counts keystrokes by expected (row) and typed
+    (column) character, so its diagonal holds the correct keystrokes.
+    Services are rows of fixed-width count and time tables that grow by
+    doubling when a new service appears.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.confusion = np.zeros((ALPHABET_SIZE, ALPHABET_SIZE), dtype=np.int64)
+        self.service_names: List[str] = []
+        self.service_rows: Dict[str, int] = {}
+        self.service_counts = np.zeros((capacity, 3), dtype=np.int64)
+        self.service_times = np.zeros((capacity, 2), dtype=np.float64)
+        self.word_start: Optional[float] = None
+
+    def _service_row(self, service_name: str) -> int:
+        """Get the table row of a service, adding one if needed"""
+        row = self.service_rows.get(service_name)
+        if row is not None:
+            return row
+
+        row = len(self.service_names)
+        if row == len(self.service_counts):
+            capacity = max(1, 2 * row)
+            self.service_counts = np.resize(self.service_counts, (capacity, 3))
+            self.service_times = np.resize(self.service_times, (capacity, 2))
+            self.service_counts[row:] = 0
+            self.service_times[row:] = 0.0
+        self.service_times[row, BEST_SECONDS] = np.inf
+        self.service_names.append(service_name)
+        self.service_rows[service_name] = row
+        return row
+
+    def record_keystroke(self, service_name: str, expected: int, typed: int, correct: bool) -> None:
+        """Count one typed character against the character the sentence expected"""
+        self.confusion[character_index(expected), character_index(typed)] += 1
+        row = self._service_row(service_name)
+        self.service_counts[row, CORRECT if correct else MISTAKES] += 1
+
+    def start_word(self, now: float) -> None:
+        """Start timing a new sentence"""
+        self.word_start = now
+
+    def complete_word(self, service_name: str, now: float) -> None:
+        """Count a finished sentence and the time it took"""
+        row = self._service_row(service_name)
+        self.service_counts[row, WORDS] += 1
+        if self.word_start is not None:
+            seconds = now - self.word_start
+            self.service_times[row, TOTAL_SECONDS] += seconds
+            self.service_times[row, BEST_SECONDS] = min(
+                self.service_times[row, BEST_SECONDS], seconds
+            )
+        self.word_start = now
+
+    def merge(self, other: "TypingStats") -> None:
+        """Add another set of statistics, such as a finished session, to this one"""
+        self.confusion += other.confusion
+        for other_row, service_name in enumerate(other.service_names):
+            row = self._service_row(service_name)
+            self.service_counts[row] += other.service_counts[other_row]
+            self.service_times[row, TOTAL_SECONDS] += other.service_times[other_row, TOTAL_SECONDS]
+            self.service_times[row, BEST_SECONDS] = min(
+                self.service_times[row, BEST_SECONDS], other.service_times[other_row, BEST_SECONDS]
+            )
+
+    def service_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get sentence count, times and accuracy per service"""
+        summary = {}
+        for row, service_name in enumerate(self.service_names):
+            words, correct, mistakes = (int(value) for value in self.service_counts[row])
+            total_seconds, best_seconds = self.service_times[row]
+            summary[service_name] = {
+                "words": words,
+                "average_seconds": total_seconds / words if words else 0.0,
+                "best_seconds": float(best_seconds) if words else 0.0,
+                "accuracy": correct / (correct + mistakes) * 100 if correct + mistakes else 100.0,
+            }
+        return summary
+
+    def character_accuracy(self) -> Dict[str, float]:
+        """Get the share of correct keystrokes for every expected character seen"""
+        attempts = self.confusion.sum(axis=1)
+        correct = np.diagonal(self.confusion)
+        return {
+            index_character(index): float(correct[index] / attempts[index] * 100)
+            for index in np.flatnonzero(attempts)
+        }
+
+    def most_confused(self, limit: int = 10) -> List[Tuple[str, str, int]]:
+        """Get the most frequent mistakes as expected character, typed character and count"""
+        mistakes = self.confusion.copy()
+        np.fill_diagonal(mistakes, 0)
+        flat = np.argsort(mistakes, axis=None)[::-1][:limit]
+        pairs = []
+        for expected, typed in zip(*np.unravel_index(flat, mistakes.shape)):
+            count = int(mistakes[expected, typed])
+            if count == 0:
+                break
+            pairs.append((index_character(expected), index_character(typed), count))
+        return pairs
+
+    def to_bytes(self) -> bytes:
+        """Serialize the statistics as an uncompressed NumPy archive"""
+        count = len(self.service_names)
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            version=np.array(STATS_VERSION),
+            confusion=self.confusion,
+            service_names=np.array(self.service_names, dtype=str),
+            service_counts=self.service_counts[:count],
+            service_times=self.service_times[:count],
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def load(cls, path: str) -> "TypingStats":
+        """Read statistics written from to_bytes"""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != STATS_VERSION:
+                msg = f"{path} has unsupported statistics version {int(data['version'])}"
+                raise ValueError(msg)
+            names = [str(name) for name in data["service_names"]]
+            stats = cls(capacity=max(1, len(names)))
+            stats.confusion[:] = data["confusion"]
+            stats.service_names = names
+            stats.service_rows = {name: row for row, name in enumerate(names)}
+            stats.service_counts[: len(names)] = data["service_counts"]
+            stats.service_times[: len(names)] = data["service_times"]
+        return stats
@@ -0,0 +1,106 @@
+"""Tests for the particle system."""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+from aws_typing_game.managers.animation_manager import AnimationManager, ParticleSystem
+
+
+class TestParticleSystem:
+    """Test cases for ParticleSystem class."""
+
+    def test_spawn_uses_free_slots(self):
+        """Test that spawning fills free slots."""
+        particles = ParticleSystem(capacity=32)
+        particles.spawn(400, 300, (100, 150, 255), "typing")
+
+        assert particles.active_count == 5
+        assert particles.palette == [(100, 150, 255)]
+
+    def test_dead_particles_are_recycled(self):
+        """Test that particles die after their life and free their slots."""
+        particles = ParticleSystem(capacity=32)
+        particles.update(now=0.0)
+        particles.spawn(400, 300, (100, 150, 255), "typing")
+
+        particles.update(now=0.25)  # typing particles live for 0.5s
+        assert particles.active_count == 5
+        particles.update(now=0.51)
+        assert particles.active_count == 0
+        particles.spawn(400, 300, (0, 255, 0), "success")
+        assert particles.active_count == 15
+
+    def test_particles_age_by_elapsed_time(self):
+        """Test that particle lifetime does not depend on how often update runs."""
+        particles = ParticleSystem(capacity=32)
+        particles.update(now=0.0)
+        particles.spawn(400, 300, (100, 150, 255), "typing")
+
+        for frame in range(1, 10):  # 20 FPS for 0.45s
+            particles.update(now=frame * 0.05)
+        assert particles.active_count == 5
+
+        particles.update(now=0.55)
+        assert particles.active_count == 0
+
+    def test_spawn_never_exceeds_capacity(self):
+        """Test that a full system does not overflow."""
+        particles = ParticleSystem(capacity=20)
+        particles.spawn(0, 0, (0, 255, 0), "success")
+        particles.spawn(0, 0, (0, 255, 0), "success")
+
+        assert particles.active_count == 20
+
+    def test_draw_uses_atlas_sprites(self):
+        """Test that drawing rasterizes each sprite once and blits all particles."""
+        surface = pygame.Surface((800, 600), pygame.SRCALPHA)
+        particles = ParticleSystem(capacity=32)
+        particles.spawn(400, 300, (0, 255, 0), "success")
+
+        drawn_rects = particles.draw(surface)
+
+        assert len(drawn_rects) == 15
+        assert len(particles.atlas.atlases) == 1
+        assert particles.atlas.rasterized[0].sum() <= 4  # One cell per radius at full alpha
+
+    def test_full_pool_evicts_oldest_particles(self):
+        """Test that drop_oldest makes room for new effects."""
+        particles = ParticleSystem(capacity=20, eviction_policy="drop_oldest")
+        particles.spawn(0, 0, (0, 255, 0), "success")
+        particles.spawn(0, 0, (0, 0, 255), "success")
+
+        stats = particles.get_stats()
+        assert stats["active"] == 20
+        assert stats["evicted"] == 10
+        assert stats["dropped"] == 0
+        assert (particles.color_index[particles.life > 0] == 1).sum() == 15
+
+    def test_lowest_priority_keeps_important_particles(self):
+        """Test that low-priority effects cannot evict high-priority ones."""
+        particles = ParticleSystem(capacity=15, eviction_policy="lowest_priority")
+        particles.spawn(0, 0, (0, 255, 0), "success")
+        particles.spawn(0, 0, (100, 150, 255), "typing")
+
+        stats = particles.get_stats()
+        assert stats["dropped"] == 5
+        assert stats["evicted"] == 0
+
+
+class TestAnimationManager:
+    """Test cases for the bounded animation pool."""
+
+    def test_score_popups_are_bounded(self):
+        """Test that score popups never exceed the pool capacity."""
+        manager = AnimationManager(max_animations=8)
+        for _ in range(20):
+            manager.create_score_popup(500, 300, 10)
+
+        stats = manager.get_pool_stats()["animations"]
+        assert stats["active"] == 8
+        assert stats["peak"] == 8
+        assert stats["evicted"] == 32
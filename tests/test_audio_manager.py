@@ -0,0 +1,288 @@
+"""Tests for audio generation and playback."""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import wave
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from aws_typing_game.managers.audio_manager import (
+    DEFAULT_SOUNDS,
+    AudioDispatcher,
+    AudioManager,
+    MusicPlaylist,
+    SoundCache,
+    SoundGenerator,
+)
+
+
+class TestSoundGenerator:
+    """Test cases for synthesized sound effects."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        pygame.mixer.quit()
+
+    def test_beep_length_matches_duration(self):
+        """Test that a beep has one stereo frame per sample."""
+        sound = SoundGenerator.generate_beep(440, 0.1)
+        samples = pygame.sndarray.array(sound)
+        assert samples.shape == (2205, 2)
+        assert samples.max() > 4000
+
+    def test_default_bank_fades_out(self):
+        """Test that every default sound is generated and decays towards silence."""
+        for generator_name, args in DEFAULT_SOUNDS.values():
+            sound = getattr(SoundGenerator, generator_name)(*args)
+            samples = pygame.sndarray.array(sound)
+            assert samples.shape[1] == 2
+            assert (samples[:, 0] == samples[:, 1]).all()
+            if generator_name != "generate_beep":
+                assert abs(samples[-10:]).max() < abs(samples).max() / 4
+
+
+class TestSoundCache:
+    """Test cases for the on-disk generated sound cache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = SoundCache(self.temp_dir.name)
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        pygame.mixer.quit()
+        self.temp_dir.cleanup()
+
+    def test_round_trip_preserves_samples(self):
+        """Test that a cached buffer loads back with identical samples."""
+        key = self.cache.make_key("generate_beep", (440, 0.1))
+        assert self.cache.load(key) is None
+
+        sound = SoundGenerator.generate_beep(440, 0.1)
+        self.cache.store(key, sound)
+        cached = self.cache.load(key)
+
+        assert cached.get_raw() == sound.get_raw()
+        assert self.cache.get_stats() == {"hits": 1, "misses": 1}
+
+    def test_key_depends_on_arguments_and_mixer_format(self):
+        """Test that changing parameters or mixer settings invalidates entries."""
+        key = self.cache.make_key("generate_beep", (440, 0.1))
+        assert key != self.cache.make_key("generate_beep", (880, 0.1))
+
+        pygame.mixer.quit()
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        assert key != self.cache.make_key("generate_beep", (440, 0.1))
+
+    def test_key_depends_on_generator_defaults(self):
+        """Test that changing a generator's default arguments invalidates entries."""
+        key = self.cache.make_key("generate_click", ())
+        generator = SoundGenerator.generate_click
+        original_defaults = generator.__defaults__
+        generator.__defaults__ = (0.2, 22050)
+        try:
+            assert key != SoundCache(self.temp_dir.name).make_key("generate_click", ())
+        finally:
+            generator.__defaults__ = original_defaults
+        assert key == SoundCache(self.temp_dir.name).make_key("generate_click", ())
+
+
+class TestTypingClicks:
+    """Test cases for the round-robin typing click bank."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        self.audio_manager = AudioManager()
+        self.audio_manager.sfx_enabled = True
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        pygame.mixer.quit()
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def test_variants_differ(self):
+        """Test that the click bank holds distinct variants."""
+        raws = {sound.get_raw() for sound in self.audio_manager.typing_variants}
+        assert len(raws) == len(self.audio_manager.typing_variants) > 1
+
+    def test_every_keystroke_plays_a_click(self):
+        """Test that rapid keystrokes rotate variants and steal voices instead of dropping."""
+        channel_count = len(self.audio_manager.typing_channels)
+        variant_count = len(self.audio_manager.typing_variants)
+
+        for _ in range(variant_count + 1):
+            self.audio_manager.play_typing_sound()
+
+        assert self.audio_manager.typing_variant_index == 1 % variant_count
+        assert self.audio_manager.typing_channel_index == (variant_count + 1) % channel_count
+
+
+class TestAudioDispatcher:
+    """Test cases for the audio command thread."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.played = []
+        self.release = threading.Event()
+        self.dispatcher = AudioDispatcher(self._handler, max_size=3)
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.release.set()
+        self.dispatcher.shutdown()
+
+    def _handler(self, sound_name, volume_override, keypress_time):
+        self.release.wait(1.0)
+        self.played.append(sound_name)
+
+    def test_commands_are_coalesced_and_bounded(self):
+        """Test that duplicates merge and a full queue drops instead of blocking."""
+        self.dispatcher.submit("success")
+        while self.dispatcher.dispatched == 0:  # Worker is now blocked in the handler
+            threading.Event().wait(0.001)
+
+        for sound_name in ("error", "error", "new_word", "typing", "game_over"):
+            self.dispatcher.submit(sound_name)
+        self.release.set()
+        self.dispatcher.shutdown()
+
+        stats = self.dispatcher.get_stats()
+        assert self.played == ["success", "error", "new_word", "typing"]
+        assert stats["coalesced"] == 1
+        assert stats["dropped"] == 1
+        assert stats["max_queue_depth"] == 3
+        assert stats["dispatched"] == 4
+
+    def test_typing_clicks_are_never_coalesced(self):
+        """Test that every keystroke click is played even while one is waiting."""
+        self.dispatcher.submit("success")
+        while self.dispatcher.dispatched == 0:
+            threading.Event().wait(0.001)
+
+        self.dispatcher.submit("typing")
+        self.dispatcher.submit("typing")
+        self.release.set()
+        self.dispatcher.shutdown()
+
+        assert self.played == ["success", "typing", "typing"]
+        assert self.dispatcher.get_stats()["coalesced"] == 0
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+class TestMusicPlaylist:
+    """Test cases for the background music playlist."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tracks = []
+        for name in ("first.wav", "second.wav"):
+            path = os.path.join(self.temp_dir.name, name)
+            with wave.open(path, "wb") as f:
+                f.setnchannels(2)
+                f.setsampwidth(2)
+                f.setframerate(22050)
+                f.writeframes(b"\x00\x00" * 2 * 22050)
+            self.tracks.append(path)
+        self.playlist = MusicPlaylist(self.tracks, fade_ms=0)
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.playlist.shutdown()
+        pygame.mixer.quit()
+        self.temp_dir.cleanup()
+
+    def test_next_track_is_queued_and_advanced(self):
+        """Test that the following track is queued and becomes current when one ends."""
+        self.playlist.play(self.tracks[0])
+        assert _wait_for(lambda: self.playlist.queued_track is not None)
+        assert self.playlist.current_track == self.tracks[0]
+
+        queued = self.playlist.queued_track
+        self.playlist.track_ended()
+        assert _wait_for(lambda: self.playlist.current_track == queued)
+
+    def test_stop_clears_playlist(self):
+        """Test that a stop is not mistaken for the end of a track."""
+        self.playlist.play()
+        self.playlist.stop()
+        self.playlist.track_ended()
+        self.playlist.shutdown()
+
+        assert self.playlist.current_track is None
+        assert self.playlist.queued_track is None
+
+
+class TestCustomSounds:
+    """Test cases for loading custom sound files."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.original_cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        os.makedirs("assets/sounds")
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        pygame.mixer.quit()
+        os.chdir(self.original_cwd)
+        self.temp_dir.cleanup()
+
+    def _write_wav(self, filename, frames):
+        with wave.open(os.path.join("assets", "sounds", filename), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(11025)
+            f.writeframes(b"\x10\x00" * frames)
+
+    def test_custom_sounds_are_decoded_and_converted(self):
+        """Test that files are matched by preference, decoded and converted to the mixer format."""
+        with open(os.path.join("assets", "sounds", "CLICK.wav"), "wb") as f:
+            f.write(b"not a sound")
+        self._write_wav("key.wav", 1000)
+        self._write_wav("Success.WAV", 500)
+
+        audio_manager = AudioManager()
+
+        typing_samples = pygame.sndarray.array(audio_manager.typing_variants[0])
+        assert audio_manager.typing_variants == [audio_manager.sounds["typing"]]
+        assert typing_samples.shape == (2000, 2)  # Resampled to 22050 Hz stereo
+        assert pygame.sndarray.array(audio_manager.sounds["success"]).shape == (1000, 2)
+        assert set(audio_manager.custom_sound_load_times) == {"CLICK.wav", "key.wav", "Success.WAV"}
+
+    def test_only_the_preferred_file_is_decoded(self):
+        """Test that lower-preference files are skipped once a sound has decoded."""
+        self._write_wav("success.wav", 500)
+        self._write_wav("correct.wav", 800)
+        self._write_wav("win.ogg", 800)
+
+        audio_manager = AudioManager()
+
+        assert pygame.sndarray.array(audio_manager.sounds["success"]).shape == (1000, 2)
+        assert set(audio_manager.custom_sound_load_times) == {"success.wav"}
@@ -0,0 +1,391 @@
+"""Tests for the data manager."""
+
+import json
+import os
+import stat
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aws_typing_game.managers.data_manager import (
+    FILE_CREATION_MASK,
+    DataManager,
+    SaveWriter,
+    write_file_atomic,
+)
+from aws_typing_game.utils.corpus import compile_corpus
+
+
+class TestDataManager:
+    """Test cases for DataManager lookups."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_file = os.path.join(self.temp_dir.name, "save_data.json")
+        self.data_manager = DataManager(save_file=self.save_file)
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_indexes_cover_all_sentences(self):
+        """Test that every sentence is indexed by its service and has a translation."""
+        sentences = self.data_manager.get_all_sentences()
+        assert sentences
+
+        for sentence in sentences:
+            service_name = sentence[sentence.index("<") + 1 : sentence.index(">")]
+            assert sentence in self.data_manager.get_sentences_for_service(service_name)
+            assert self.data_manager.get_sentence_translation(sentence) != "翻訳が見つかりません"
+
+    def test_lookups_match_marked_and_clean_sentences(self):
+        """Test that translations resolve with and without markers."""
+        data_file = os.path.join(self.temp_dir.name, "data.json")
+        with open(data_file, "w", encoding="utf-8") as f:
+            json.dump(self.data_manager._get_fallback_aws_data(), f)
+        data_manager = DataManager(data_file, self.save_file)
+
+        marked = "My <EC2> instance is having an identity crisis"
+        clean = "My EC2 instance is having an identity crisis"
+        assert data_manager.get_sentence_translation(marked) == (
+            data_manager.get_sentence_translation(clean)
+        )
+        assert data_manager.get_service_description("Lambda").startswith("サーバーレス")
+        assert data_manager.get_service_description("Unknown") == "説明が見つかりません"
+
+    def test_reload_rebuilds_indexes(self):
+        """Test that indexes follow reloaded data."""
+        data_file = os.path.join(self.temp_dir.name, "data.json")
+        with open(data_file, "w", encoding="utf-8") as f:
+            json.dump(self.data_manager._get_fallback_aws_data(), f)
+        data_manager = DataManager(data_file, self.save_file)
+        assert len(data_manager.get_all_sentences()) == 2
+
+        with open(data_file, "w", encoding="utf-8") as f:
+            json.dump({"categories": {"storage": {"sentences": ["<S3> holds it all"]}}}, f)
+        data_manager.load_aws_data()
+
+        assert data_manager.get_all_sentences() == ["<S3> holds it all"]
+        assert data_manager.get_sentences_for_service("EC2") == []
+
+
+class TestCompiledCorpus:
+    """Test cases for loading a compiled binary corpus."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_file = os.path.join(self.temp_dir.name, "save_data.json")
+        self.json_manager = DataManager(save_file=self.save_file)
+
+        corpus_file = os.path.join(self.temp_dir.name, "aws.corpus")
+        with open(corpus_file, "wb") as f:
+            f.write(compile_corpus([self.json_manager.aws_data]))
+        self.compiled_manager = DataManager(corpus_file, self.save_file)
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.compiled_manager.corpus.close()
+        self.temp_dir.cleanup()
+
+    def test_compiled_lookups_match_json(self):
+        """Test that the compiled corpus answers every lookup like the JSON data."""
+        json_sentences = list(self.json_manager.get_all_sentences())
+        assert list(self.compiled_manager.get_all_sentences()) == json_sentences
+
+        for sentence in json_sentences:
+            service_name = sentence[sentence.index("<") + 1 : sentence.index(">")]
+            for manager in (self.json_manager, self.compiled_manager):
+                assert sentence in manager.get_sentences_for_service(service_name)
+            assert self.compiled_manager.get_sentence_translation(
+                sentence
+            ) == self.json_manager.get_sentence_translation(sentence)
+            assert self.compiled_manager.get_service_description(
+                service_name
+            ) == self.json_manager.get_service_description(service_name)
+
+        assert list(self.compiled_manager.get_sentences_by_category("storage")) == list(
+            self.json_manager.get_sentences_by_category("storage")
+        )
+        assert self.compiled_manager.get_service_description("Unknown") == "説明が見つかりません"
+
+    def test_close_while_service_sentences_are_held(self):
+        """Test that sentences handed out for a service outlive the memory map."""
+        corpus = self.compiled_manager.corpus
+        sentences = corpus.sentences_for_service("EC2")
+        expected = list(sentences)
+
+        corpus.close()
+
+        assert expected
+        assert list(sentences) == expected
+
+    def test_service_spans_are_precomputed(self):
+        """Test that the service span points at the service in the clean sentence."""
+        corpus = self.compiled_manager.corpus
+        sentence = corpus.sentences[0]
+        start, end = corpus.sentence_span(0)
+
+        service_name = sentence[sentence.index("<") + 1 : sentence.index(">")]
+        assert sentence.replace("<", "").replace(">", "")[start:end] == service_name
+
+
+class TestStreamingCorpus:
+    """Test cases for loading a JSON Lines corpus."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_file = os.path.join(self.temp_dir.name, "save_data.json")
+        self.json_manager = DataManager(save_file=self.save_file)
+
+        corpus_file = os.path.join(self.temp_dir.name, "aws.jsonl")
+        with open(corpus_file, "w", encoding="utf-8") as f:
+            for category_name, category in self.json_manager.aws_data["categories"].items():
+                for sentence in category["sentences"]:
+                    service_name = sentence[sentence.index("<") + 1 : sentence.index(">")]
+                    record = {
+                        "category": category_name,
+                        "sentence": sentence,
+                        "translation": self.json_manager.get_sentence_translation(sentence),
+                        "description": category["descriptions"].get(service_name),
+                    }
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.streaming_manager = DataManager(corpus_file, self.save_file)
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_categories_load_on_first_lookup(self):
+        """Test that startup only indexes sentences and lookups load one category."""
+        corpus = self.streaming_manager.corpus
+        assert list(self.streaming_manager.get_all_sentences()) == list(
+            self.json_manager.get_all_sentences()
+        )
+        assert corpus.loaded_categories == set()
+
+        sentence = self.json_manager.get_sentences_by_category("storage")[0]
+        assert self.streaming_manager.get_sentence_translation(
+            sentence
+        ) == self.json_manager.get_sentence_translation(sentence)
+        assert corpus.loaded_categories == {"storage"}
+
+    def test_streaming_lookups_match_json(self):
+        """Test that every lookup matches the JSON data once categories are loaded."""
+        for sentence in self.json_manager.get_all_sentences():
+            service_name = sentence[sentence.index("<") + 1 : sentence.index(">")]
+            assert sentence in self.streaming_manager.get_sentences_for_service(service_name)
+            assert self.streaming_manager.get_sentence_translation(
+                sentence
+            ) == self.json_manager.get_sentence_translation(sentence)
+            assert self.streaming_manager.get_service_description(
+                service_name
+            ) == self.json_manager.get_service_description(service_name)
+        assert self.streaming_manager.get_service_description("Unknown") == "説明が見つかりません"
+
+    def test_values_missing_from_some_records(self):
+        """Test that lookups skip records without a translation or description."""
+        corpus_file = os.path.join(self.temp_dir.name, "partial.jsonl")
+        records = [
+            {"category": "storage", "sentence": "<S3> holds it all"},
+            {"category": "storage", "sentence": "<S3> again", "description": None},
+            {"category": "storage", "sentence": "<S3> keeps it", "description": "保管"},
+            {"category": "storage", "sentence": "<S3> holds it all", "translation": "全部"},
+        ]
+        with open(corpus_file, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        data_manager = DataManager(corpus_file, self.save_file)
+
+        assert data_manager.get_service_description("S3") == "保管"
+        assert data_manager.get_sentence_translation("<S3> holds it all") == "全部"
+        assert data_manager.get_sentence_translation("<S3> again") == "翻訳が見つかりません"
+
+
+class TestMultipleSources:
+    """Test cases for merging and reloading several corpus sources."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_file = os.path.join(self.temp_dir.name, "save_data.json")
+        self.override_dir = os.path.join(self.temp_dir.name, "overrides")
+        self.base_file = os.path.join(self.temp_dir.name, "base.json")
+        self._write_json(
+            self.base_file, DataManager(save_file=self.save_file)._get_fallback_aws_data()
+        )
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def _write_json(self, path, data):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def _override(self, sentences, description):
+        return {
+            "categories": {
+                "computing": {
+                    "sentences": sentences,
+                    "descriptions": {"EC2": description},
+                }
+            }
+        }
+
+    def test_earlier_sources_own_duplicate_services(self):
+        """Test that an override replaces a service's sentences and description."""
+        os.makedirs(self.override_dir)
+        self._write_json(
+            os.path.join(self.override_dir, "ec2.json"),
+            self._override(["<EC2> was rewritten"], "上書き"),
+        )
+        data_manager = DataManager([self.override_dir, self.base_file], self.save_file)
+
+        assert list(data_manager.get_sentences_for_service("EC2")) == ["<EC2> was rewritten"]
+        assert data_manager.get_service_description("EC2") == "上書き"
+        assert len(data_manager.get_sentences_for_service("Lambda")) == 1
+        assert "<EC2> was rewritten" in data_manager.get_sentences_by_category("computing")
+        assert len(data_manager.get_all_sentences()) == 2
+        assert data_manager.get_sentence_translation(
+            "I wrote a <Lambda> function to feed my cat"
+        ).startswith("猫に")
+
+    def test_compiled_layers_stay_lazy(self):
+        """Test that layering over a compiled corpus only filters shadowed services."""
+        corpus_file = os.path.join(self.temp_dir.name, "base.corpus")
+        with open(corpus_file, "wb") as f:
+            f.write(compile_corpus([DataManager(save_file=self.save_file).aws_data]))
+        override_file = os.path.join(self.temp_dir.name, "override.json")
+        self._write_json(override_file, self._override(["<EC2> was rewritten"], "上書き"))
+        data_manager = DataManager([override_file, corpus_file], self.save_file)
+
+        corpus = data_manager.corpus
+        assert corpus._sentences is None
+        sentences = data_manager.get_all_sentences()
+        assert isinstance(sentences[1], str)
+        assert sentences[0] == "<EC2> was rewritten"
+        assert all(
+            "<EC2>" not in sentence or sentence == "<EC2> was rewritten" for sentence in sentences
+        )
+        assert list(data_manager.get_sentences_by_category("computing"))[0] == (
+            "<EC2> was rewritten"
+        )
+        assert len(data_manager.get_sentences_for_service("S3")) > 0
+        corpus.corpora[1].close()
+
+    def test_reload_while_compiled_sentences_are_held(self):
+        """Test that swapping out a compiled corpus never fails on sentences still in use."""
+        corpus_file = os.path.join(self.temp_dir.name, "base.corpus")
+        aws_data = DataManager(save_file=self.save_file).aws_data
+        with open(corpus_file, "wb") as f:
+            f.write(compile_corpus([aws_data]))
+        data_manager = DataManager(corpus_file, self.save_file)
+        old_corpus = data_manager.corpus
+        held_sentences = data_manager.get_sentences_for_service("EC2")
+        expected = list(held_sentences)
+        held_view = memoryview(old_corpus._mm)
+
+        with open(corpus_file, "wb") as f:
+            f.write(compile_corpus([self._override(["<EC2> was edited"], "編集")]))
+        assert data_manager.check_for_changes()
+        assert data_manager.apply_pending_reload()
+
+        assert list(data_manager.get_sentences_for_service("EC2")) == ["<EC2> was edited"]
+        assert list(held_sentences) == expected
+        assert not old_corpus._mm.closed
+
+        held_view.release()
+        assert not data_manager.apply_pending_reload()
+        assert old_corpus._mm.closed
+        data_manager.corpus.close()
+
+    def test_changes_are_staged_until_applied(self):
+        """Test that only changed sources reload and the swap waits for the caller."""
+        data_manager = DataManager([self.override_dir, self.base_file], self.save_file)
+        base_corpus = data_manager.corpus
+        assert not data_manager.check_for_changes()
+
+        os.makedirs(self.override_dir)
+        self._write_json(
+            os.path.join(self.override_dir, "ec2.json"),
+            self._override(["<EC2> was rewritten"], "上書き"),
+        )
+        assert data_manager.check_for_changes()
+        assert data_manager.corpus is base_corpus
+
+        assert data_manager.apply_pending_reload()
+        assert data_manager.corpus.corpora[1] is base_corpus
+        assert list(data_manager.get_sentences_for_service("EC2")) == ["<EC2> was rewritten"]
+        assert not data_manager.apply_pending_reload()
+
+    def test_watcher_picks_up_edits(self):
+        """Test that the background watcher stages edited sources."""
+        data_manager = DataManager(self.base_file, self.save_file, watch_interval=0.01)
+        try:
+            self._write_json(self.base_file, self._override(["<EC2> was edited"], "編集"))
+            os.utime(self.base_file, ns=(0, 0))
+
+            deadline = time.monotonic() + 2.0
+            while not data_manager.apply_pending_reload() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            data_manager.stop_watching()
+
+        assert list(data_manager.get_all_sentences()) == ["<EC2> was edited"]
+        assert data_manager.aws_data["categories"]["computing"]["sentences"] == ["<EC2> was edited"]
+
+
+class TestSaveWriter:
+    """Test cases for the background save pipeline."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_file = os.path.join(self.temp_dir.name, "save_data.json")
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_saves_are_written_atomically_on_shutdown(self):
+        """Test that pending saves are flushed and no temporary files are left."""
+        data_manager = DataManager(save_file=self.save_file, async_save=True)
+        for score in (10, 20, 30):
+            data_manager.update_high_score(score)
+        data_manager.shutdown()
+
+        with open(self.save_file, encoding="utf-8") as f:
+            assert json.load(f)["high_score"] == 30
+        assert os.listdir(self.temp_dir.name) == ["save_data.json"]
+
+        stats = data_manager.save_writer.get_stats()
+        assert stats["submitted"] == 3
+        assert stats["written"] + stats["coalesced"] == 3
+
+    def test_snapshots_coalesce_while_waiting(self):
+        """Test that only the newest snapshot is written when saves pile up."""
+        writer = SaveWriter(self.save_file, max_size=2)
+        for score in range(50):
+            writer.submit({"high_score": score})
+        assert writer.flush()
+
+        with open(self.save_file, encoding="utf-8") as f:
+            assert json.load(f) == {"high_score": 49}
+        assert writer.written + writer.coalesced == 50
+        writer.shutdown()
+
+    def test_atomic_write_keeps_file_mode(self):
+        """Test that replacing a file keeps its permissions instead of the temporary file's."""
+        write_file_atomic(self.save_file, "{}")
+        mode = 0o666 & ~FILE_CREATION_MASK
+        assert stat.S_IMODE(os.stat(self.save_file).st_mode) == mode
+
+        os.chmod(self.save_file, 0o640)
+        write_file_atomic(self.save_file, "{}")
+        assert stat.S_IMODE(os.stat(self.save_file).st_mode) == 0o640
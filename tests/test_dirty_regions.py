@@ -0,0 +1,55 @@
+"""Tests for dirty rectangle tracking."""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+from aws_typing_game.ui.dirty_regions import DirtyRegionTracker
+
+
+class TestDirtyRegionTracker:
+    """Test cases for DirtyRegionTracker class."""
+
+    def setup_method(self):
+        """Set up a tracker that has already presented one frame."""
+        self.tracker = DirtyRegionTracker()
+        self.tracker.begin_frame("playing", (1000, 700))
+        self.tracker.track("score_card", pygame.Rect(0, 0, 10, 10), 1)
+        self.tracker.end_frame()
+
+    def test_first_frame_is_full_redraw(self):
+        """Test that a new tracker asks for a full flip."""
+        tracker = DirtyRegionTracker()
+        tracker.begin_frame("menu", (1000, 700))
+        assert tracker.end_frame() is None
+
+    def test_unchanged_element_is_not_reported(self):
+        """Test that an element with the same state is skipped."""
+        self.tracker.begin_frame("playing", (1000, 700))
+        self.tracker.track("score_card", pygame.Rect(0, 0, 10, 10), 1)
+        assert self.tracker.end_frame() == []
+
+    def test_changed_element_is_reported(self):
+        """Test that a state change reports the element rect."""
+        self.tracker.begin_frame("playing", (1000, 700))
+        self.tracker.track("score_card", pygame.Rect(0, 0, 10, 10), 2)
+        assert pygame.Rect(0, 0, 10, 10) in self.tracker.end_frame()
+
+    def test_state_transition_forces_full_redraw(self):
+        """Test that switching game state falls back to a full flip."""
+        self.tracker.begin_frame("game_over", (1000, 700))
+        assert self.tracker.end_frame() is None
+
+    def test_transient_rects_are_reported_twice(self):
+        """Test that particle rects are also repainted on the next frame."""
+        particle = pygame.Rect(5, 5, 2, 2)
+        self.tracker.begin_frame("playing", (1000, 700))
+        self.tracker.add_transient([particle])
+        assert particle in self.tracker.end_frame()
+
+        self.tracker.begin_frame("playing", (1000, 700))
+        assert particle in self.tracker.end_frame()
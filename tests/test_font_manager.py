@@ -0,0 +1,90 @@
+"""Tests for the text surface cache."""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+from aws_typing_game.managers.font_manager import FontManager, TextSurfaceCache
+from aws_typing_game.ui.ui_manager import UIManager
+
+
+class TestTextSurfaceCache:
+    """Test cases for TextSurfaceCache class."""
+
+    def _make_surface(self, width: int = 10, height: int = 10) -> pygame.Surface:
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted."""
+        cache = TextSurfaceCache()
+        key = ("時間", "small", (255, 255, 255), True)
+
+        assert cache.get(key) is None
+        surface = self._make_surface()
+        cache.put(key, surface)
+
+        assert cache.get(key) is surface
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        """Test that the oldest entry is evicted when the budget is exceeded."""
+        surface_bytes = self._make_surface().get_pitch() * 10
+        cache = TextSurfaceCache(max_bytes=surface_bytes * 2)
+
+        cache.put("a", self._make_surface())
+        cache.put("b", self._make_surface())
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", self._make_surface())
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.current_bytes <= cache.max_bytes
+
+    def test_clear_resets_usage(self):
+        """Test that clearing drops all entries."""
+        cache = TextSurfaceCache()
+        cache.put("a", self._make_surface())
+        cache.clear()
+
+        assert cache.get("a") is None
+        assert cache.current_bytes == 0
+
+
+class TestFontManager:
+    """Test cases for FontManager class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        pygame.font.init()
+
+    def test_rebuilding_fonts_invalidates_caches(self):
+        """Test that surfaces and metrics measured with old fonts are dropped."""
+        font_manager = FontManager()
+        font_manager.render_text("EC2", "small", (255, 255, 255))
+        font_manager.get_glyph_metrics("small")
+        generation = font_manager.font_generation
+
+        font_manager._initialize_fonts()
+
+        assert font_manager.text_cache.get_stats()["entries"] == 0
+        assert font_manager.glyph_metrics == {}
+        assert font_manager.font_generation == generation + 1
+
+    def test_sentence_layouts_follow_font_rebuilds(self):
+        """Test that a cached sentence layout is not reused with rebuilt fonts."""
+        font_manager = FontManager()
+        ui_manager = UIManager(pygame.Surface((800, 600)), font_manager)
+        layout = ui_manager._get_sentence_layout("My <EC2> instance", "EC2", 400)
+        assert ui_manager._get_sentence_layout("My <EC2> instance", "EC2", 400) is layout
+
+        font_manager._initialize_fonts()
+
+        assert ui_manager._get_sentence_layout("My <EC2> instance", "EC2", 400) is not layout
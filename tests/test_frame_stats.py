@@ -0,0 +1,86 @@
+"""Tests for per-state frame statistics."""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aws_typing_game.utils import frame_stats
+from aws_typing_game.utils.frame_stats import FrameStats
+
+
+class FakeClock:
+    """Stand-in for the time module with manually advanced CPU and wall clocks"""
+
+    def __init__(self):
+        self.cpu_time = 0.0
+        self.wall_time = 0.0
+
+    def process_time(self):
+        return self.cpu_time
+
+    def perf_counter(self):
+        return self.wall_time
+
+    def advance(self, wall_seconds, cpu_seconds):
+        self.wall_time += wall_seconds
+        self.cpu_time += cpu_seconds
+
+
+class TestFrameStats:
+    """Test cases for FrameStats class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.real_time = frame_stats.time
+        frame_stats.time = self.clock
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        frame_stats.time = self.real_time
+
+    def test_iterations_are_attributed_to_states(self):
+        """Test that the time since the previous iteration goes to the given state."""
+        stats = FrameStats()
+        for rendered in (True, False, True, False):
+            self.clock.advance(0.5, 0.1)
+            stats.record_iteration("playing", rendered)
+        self.clock.advance(1.0, 0.0)
+        stats.record_iteration("menu", False)
+
+        playing = stats.states["playing"]
+        assert playing["iterations"] == 4
+        assert playing["frames_rendered"] == 2
+        assert playing["wall_time"] == 2.0
+        assert abs(playing["cpu_time"] - 0.4) < 1e-9
+        assert stats.states["menu"]["frames_rendered"] == 0
+
+    def test_derived_rates(self):
+        """Test that CPU usage and rendered frame rate are computed per state."""
+        stats = FrameStats()
+        for _ in range(10):
+            self.clock.advance(0.1, 0.025)
+            stats.record_iteration("playing", True)
+
+        playing = stats.get_stats()["playing"]
+        assert abs(playing["cpu_percent"] - 25.0) < 1e-6
+        assert abs(playing["rendered_fps"] - 10.0) < 1e-6
+        assert stats.format_summary() == "playing: 10 frames in 1.0s (10.0 fps, CPU 25.0%)"
+
+    def test_empty_stats(self):
+        """Test that nothing is reported before the first iteration."""
+        stats = FrameStats()
+
+        assert stats.get_stats() == {}
+        assert stats.format_summary() == ""
+
+    def test_zero_elapsed_time_does_not_divide_by_zero(self):
+        """Test that an iteration with no elapsed time still reports finite rates."""
+        stats = FrameStats()
+        stats.record_iteration("paused", True)
+
+        paused = stats.get_stats()["paused"]
+        assert paused["cpu_percent"] == 0.0
+        assert paused["rendered_fps"] > 0
@@ -0,0 +1,84 @@
+"""Tests for the binary keystroke journal."""
+
+import os
+import sys
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+from aws_typing_game.core.game import Game
+from aws_typing_game.managers.data_manager import DataManager
+from aws_typing_game.utils.keystroke_journal import (
+    FLAG_CORRECT,
+    FLAG_SESSION_START,
+    HEADER,
+    RECORD,
+    KeystrokeJournal,
+    journal_files,
+    read_journal,
+)
+
+
+class TestKeystrokeJournal:
+    """Test cases for writing and mapping keystroke records."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.temp_dir.name, "keystrokes")
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_records_map_onto_structured_array(self):
+        """Test that records read back field by field."""
+        journal = KeystrokeJournal(self.folder)
+        journal.start_session()
+        journal.record(ord("M"), ord("M"), True)
+        journal.record(ord("x"), ord("y"), False)
+        journal.close()
+
+        records = read_journal(journal.path)
+        assert records["flags"].tolist() == [FLAG_SESSION_START, FLAG_CORRECT, 0]
+        assert records["codepoint"][1:].tolist() == [ord("M"), ord("x")]
+        assert records["expected"][1:].tolist() == [ord("M"), ord("y")]
+        assert records["delta_us"][0] == 0
+
+    def test_files_rotate_and_ignore_partial_records(self):
+        """Test that full files rotate and a torn final record is skipped."""
+        journal = KeystrokeJournal(self.folder, max_file_bytes=HEADER.size + 2 * RECORD.size)
+        for codepoint in range(5):
+            journal.record(codepoint, codepoint, True)
+        journal.close()
+
+        paths = journal_files(self.folder)
+        assert [len(read_journal(path)) for path in paths] == [2, 2, 1]
+
+        with open(paths[-1], "ab") as f:
+            f.write(b"\x01\x02")
+        assert len(read_journal(paths[-1])) == 1
+
+        # A new journal continues after the existing files
+        assert KeystrokeJournal(self.folder)._file_index == 3
+
+    def test_game_records_typed_characters(self):
+        """Test that gameplay keystrokes are journaled with their correctness."""
+        journal = KeystrokeJournal(self.folder)
+        game = Game(DataManager(save_file=os.path.join(self.temp_dir.name, "save_data.json")))
+        game.set_keystroke_journal(journal)
+        game.reset_game()
+        game.current_word = "My <EC2> instance"
+
+        events = [
+            pygame.event.Event(pygame.KEYDOWN, key=ord(char.lower()), unicode=char) for char in "Mx"
+        ]
+        game.update(events)
+        journal.close()
+
+        records = read_journal(journal.path)
+        assert records["flags"].tolist() == [FLAG_SESSION_START, FLAG_CORRECT, 0]
+        assert records["expected"][2] == ord("y")
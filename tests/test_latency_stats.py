@@ -0,0 +1,52 @@
+"""Tests for latency histograms."""
+
+import json
+import os
+import sys
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aws_typing_game.utils.latency_stats import LatencyHistogram, LatencyTracker
+
+
+class TestLatencyStats:
+    """Test cases for latency percentiles."""
+
+    def test_percentiles(self):
+        """Test that percentiles fall in the right buckets."""
+        histogram = LatencyHistogram(bucket_ms=1.0, max_ms=100.0)
+        for latency_ms in range(1, 101):
+            histogram.record(latency_ms - 0.5)
+
+        stats = histogram.get_stats()
+        assert stats["count"] == 100
+        assert stats["p50_ms"] == 50.0
+        assert stats["p95_ms"] == 95.0
+        assert stats["p99_ms"] == 99.0
+        assert stats["max_ms"] == 99.5
+
+    def test_overflow_is_capped_at_max(self):
+        """Test that samples beyond the histogram range are still counted."""
+        histogram = LatencyHistogram(bucket_ms=1.0, max_ms=10.0)
+        histogram.record(500.0)
+
+        assert histogram.get_stats()["p99_ms"] == 500.0
+        assert histogram.counts[-1] == 1
+
+    def test_tracker_dumps_per_label_stats(self):
+        """Test that the tracker writes one entry per sound type."""
+        tracker = LatencyTracker()
+        tracker.record("typing", 0.002)
+        tracker.record("error", 0.004)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "latency.json")
+            tracker.dump(path, {"buffer": 512})
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+
+        assert data["metadata"] == {"buffer": 512}
+        assert set(data["latency"]) == {"typing", "error"}
+        assert data["latency"]["typing"]["count"] == 1
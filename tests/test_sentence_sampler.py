@@ -0,0 +1,60 @@
+"""Tests for weakness-weighted sentence sampling."""
+
+import os
+import sys
+from itertools import accumulate
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np
+
+from aws_typing_game.utils.sentence_sampler import FenwickTree, SentenceSampler
+from aws_typing_game.utils.typing_stats import TypingStats
+
+
+class TestFenwickTree:
+    """Test cases for prefix sums and search over weights."""
+
+    def test_find_matches_linear_scan(self):
+        """Test that search and updates agree with a plain running total."""
+        rng = np.random.default_rng(7)
+        weights = [rng.uniform(0.5, 3.0) for _ in range(37)]
+        tree = FenwickTree(weights)
+        for index in (0, 12, 36):
+            weights[index] = 10.0
+            tree.update(index, 10.0)
+
+        assert abs(tree.total() - sum(weights)) < 1e-9
+        for _ in range(200):
+            value = rng.uniform(0, sum(weights))
+            expected = next(
+                index for index, running in enumerate(accumulate(weights)) if running > value
+            )
+            assert tree.find(value) == expected
+
+
+class TestSentenceSampler:
+    """Test cases for the weakness-weighted sampler."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.sentences = ["<EC2> one", "<S3> two", "<Lambda> three", "<IAM> four"]
+
+    def test_missed_sentences_are_drawn_more_often(self):
+        """Test that a sentence with mistakes and slow typing gains weight."""
+        sampler = SentenceSampler(self.sentences, rng=np.random.default_rng(0))
+        sampler.record_result(2, mistakes=10, chars=10, seconds=10.0)
+        sampler.record_result(0, mistakes=0, chars=10, seconds=1.0)
+
+        draws = [sampler.sample() for _ in range(4000)]
+        assert draws.count(2) > 3 * draws.count(0)
+
+    def test_lifetime_service_accuracy_seeds_weights(self):
+        """Test that services the player misspells start with extra weight."""
+        stats = TypingStats()
+        stats.record_keystroke("S3", ord("S"), ord("A"), False)
+        stats.record_keystroke("EC2", ord("E"), ord("E"), True)
+
+        sampler = SentenceSampler(self.sentences, stats)
+        assert sampler.tree.weights[1] > sampler.tree.weights[0] == sampler.tree.weights[3]
@@ -0,0 +1,68 @@
+"""Tests for the SQLite session history."""
+
+import os
+import sys
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aws_typing_game.managers.data_manager import DataManager
+from aws_typing_game.utils.session_store import SessionStore
+
+
+class TestSessionStore:
+    """Test cases for batched session inserts and history queries."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_file = os.path.join(self.temp_dir.name, "sessions.db")
+        self.store = SessionStore(self.db_file, profile="kiosk-1", flush_interval=0.01)
+
+    def teardown_method(self):
+        """Clean up after tests."""
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_sessions_are_batched_and_queryable(self):
+        """Test that queued sessions are committed together and ranked by score."""
+        day = 86400
+        self.store.add_session(100, 5, 95, 60.0, ["EC2", "S3"], timestamp=day + 10)
+        self.store.add_session(300, 0, 150, 60.0, ["S3"], timestamp=day + 20)
+        self.store.add_session(200, 10, 90, 60.0, [], timestamp=2 * day + 5)
+        assert self.store.flush()
+
+        assert self.store.count_sessions() == 3
+        assert self.store.get_stats()["batches"] == 1
+        assert [row["score"] for row in self.store.top_sessions(2)] == [300, 200]
+        assert self.store.top_sessions(1)[0]["profile"] == "kiosk-1"
+
+        trend = self.store.score_trend(day)
+        assert [bucket["sessions"] for bucket in trend] == [2, 1]
+        assert trend[0]["bucket_start"] == day
+        assert trend[0]["average_score"] == 200
+        assert trend[0]["accuracy"] == 245 / 250 * 100
+
+    def test_service_counts_and_filters(self):
+        """Test per-service counts with and without profile and time filters."""
+        self.store.add_session(100, 0, 50, 60.0, ["EC2", "S3", "EC2"], timestamp=10)
+        self.store.add_session(100, 0, 50, 60.0, ["S3"], timestamp=20)
+        assert self.store.flush()
+
+        assert self.store.service_counts() == [("EC2", 2), ("S3", 2)]
+        assert self.store.service_counts(limit=1, since=15) == [("S3", 1)]
+        assert self.store.service_counts(profile="other") == []
+        assert self.store.count_sessions(profile="kiosk-1", since=15) == 1
+
+    def test_data_manager_records_sessions(self):
+        """Test that add_game_session feeds the store and shutdown commits it."""
+        data_manager = DataManager(
+            save_file=os.path.join(self.temp_dir.name, "save_data.json"),
+            session_db=self.db_file,
+        )
+        data_manager.add_game_session(120, 2, 80, 60.0, ["Lambda"])
+        data_manager.shutdown()
+
+        assert self.store.count_sessions() == 1
+        assert self.store.service_counts() == [("Lambda", 1)]
@@ -0,0 +1,74 @@
+"""Tests for metrics-based text layout."""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aws_typing_game.managers.font_manager import GlyphMetrics
+from aws_typing_game.ui.text_layout import (
+    SentenceLayoutCache,
+    build_sentence_layout,
+    wrap_text,
+)
+
+
+class FixedWidthFont:
+    """Font stand-in where every character is 10px wide and CJK characters 20px"""
+
+    def size(self, text):
+        width = sum(20 if ord(char) > 0x2E80 else 10 for char in text)
+        return width, 20
+
+    def get_height(self):
+        return 20
+
+
+def _metrics():
+    return GlyphMetrics(FixedWidthFont())
+
+
+class TestTextLayout:
+    """Test cases for line breaking."""
+
+    def test_wraps_on_spaces(self):
+        """Test that English text breaks between words."""
+        lines = wrap_text("My EC2 instance is here", _metrics(), 120)
+        assert lines == ["My EC2", "instance is", "here"]
+
+    def test_wraps_cjk_without_spaces(self):
+        """Test that Japanese text breaks between characters."""
+        lines = wrap_text("仮想サーバーを提供する", _metrics(), 100)
+        assert all(len(line) <= 5 for line in lines)
+        assert "".join(lines) == "仮想サーバーを提供する"
+        assert not any(line.startswith("ー") for line in lines)
+
+    def test_long_word_is_force_broken(self):
+        """Test that a word wider than the line is split."""
+        lines = wrap_text("abcdefghij", _metrics(), 40)
+        assert lines == ["abcd", "efgh", "ij"]
+
+    def test_sentence_layout_places_highlight(self):
+        """Test that a sentence layout picks a size and positions the service."""
+        layout = build_sentence_layout(
+            "My <EC2> instance", "EC2", 400, lambda font_size: _metrics()
+        )
+
+        assert layout.plain_text == "My EC2 instance"
+        assert layout.font_size == "game"
+        assert len(layout.lines) == 1
+        line = layout.lines[0]
+        assert (line.before, line.service, line.after) == ("My ", "EC2", " instance")
+        assert line.service_x == 30
+        assert layout.highlight_rect.width == 30 + 8
+
+    def test_sentence_layout_cache_evicts_oldest(self):
+        """Test that the layout cache is bounded."""
+        cache = SentenceLayoutCache(max_entries=1)
+        first = build_sentence_layout("a", "", 100, lambda font_size: _metrics())
+        cache.put("a", first)
+        cache.put("b", first)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is first
@@ -0,0 +1,77 @@
+"""Tests for incremental typing statistics."""
+
+import os
+import sys
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aws_typing_game.managers.data_manager import DataManager
+from aws_typing_game.utils.typing_stats import TypingStats
+
+
+class TestTypingStats:
+    """Test cases for per-service and per-character statistics."""
+
+    def _session(self, service_name, typed_pairs, seconds):
+        stats = TypingStats(capacity=1)
+        stats.start_word(0.0)
+        for expected, typed in typed_pairs:
+            stats.record_keystroke(service_name, ord(expected), ord(typed), expected == typed)
+        stats.complete_word(service_name, seconds)
+        return stats
+
+    def test_service_summary_and_confusions(self):
+        """Test per-service times and accuracy and the most confused characters."""
+        stats = self._session("EC2", [("E", "E"), ("C", "V"), ("C", "C"), ("2", "2")], 4.0)
+        stats.merge(self._session("S3", [("S", "S"), ("3", "3")], 2.0))
+
+        summary = stats.service_summary()
+        assert summary["EC2"]["accuracy"] == 75.0
+        assert summary["EC2"]["average_seconds"] == 4.0
+        assert summary["S3"]["words"] == 1
+        assert stats.most_confused() == [("C", "V", 1)]
+        assert stats.character_accuracy()["C"] == 50.0
+
+    def test_merge_and_persist_round_trip(self):
+        """Test that sessions merge by addition and survive a save and load."""
+        lifetime = TypingStats()
+        lifetime.merge(self._session("EC2", [("E", "E")], 4.0))
+        lifetime.merge(self._session("EC2", [("E", "3"), ("E", "é")], 2.0))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "typing_stats.npz")
+            with open(path, "wb") as f:
+                f.write(lifetime.to_bytes())
+            loaded = TypingStats.load(path)
+
+        summary = loaded.service_summary()["EC2"]
+        assert summary["words"] == 2
+        assert summary["average_seconds"] == 3.0
+        assert summary["best_seconds"] == 2.0
+        assert round(summary["accuracy"], 2) == 33.33
+        assert ("E", "?", 1) in loaded.most_confused()
+        assert (loaded.confusion == lifetime.confusion).all()
+
+    def test_data_manager_saves_stats_after_each_game(self):
+        """Test that merged statistics reach disk without waiting for shutdown."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "typing_stats.npz")
+            for async_save in (False, True):
+                data_manager = DataManager(
+                    save_file=os.path.join(temp_dir, "save_data.json"),
+                    async_save=async_save,
+                    typing_stats_file=path,
+                )
+                data_manager.add_typing_stats(self._session("EC2", [("E", "E")], 1.0))
+                if data_manager.stats_writer is not None:
+                    assert data_manager.stats_writer.flush()
+
+                assert os.path.exists(path)
+                assert TypingStats.load(path).service_summary()["EC2"]["words"] == (
+                    2 if async_save else 1
+                )
+                if data_manager.save_writer is not None:
+                    data_manager.save_writer.shutdown()
+                    data_manager.stats_writer.shutdown()